@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2025 dpa-IT Services GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the event loop latency while a burst of messages is converted.
+
+A ticker task sleeps for one millisecond in a loop and records how late it wakes up,
+while a burst of ``--messages`` messages of ``tests/data/input`` is converted either
+directly on the loop or with `AsyncG2Converter`:
+
+    python benchmarks/async_latency.py --messages 500
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+from itertools import cycle, islice
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from newsmlg2 import AsyncG2Converter, G2Converter  # noqa: E402
+
+TEMPLATES = os.path.join(_ROOT, "newsmlg2", "templates")
+
+
+async def measure(burst) -> list[float]:
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await burst()
+    done.set()
+    await task
+    return lags
+
+
+def report(name: str, elapsed: float, lags: list[float]):
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{name}: {elapsed:6.2f} s, loop lag median"
+        f" {statistics.median(lags) * 1000:6.2f} ms, p99 {p99 * 1000:6.2f} ms,"
+        f" max {lags[-1] * 1000:7.2f} ms"
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(_ROOT, "tests", "data", "input", "*"))):
+        with open(path) as f:
+            corpus.append(json.load(f))
+    burst = list(islice(cycle(corpus), args.messages))
+
+    converter = G2Converter(TEMPLATES)
+
+    async def blocking():
+        for dw in burst:
+            converter.convert(dw)
+
+    async_converter = AsyncG2Converter(TEMPLATES, max_concurrency=args.max_concurrency)
+
+    async def offloaded():
+        async for _ in async_converter.convert_many(burst, ordered=False):
+            pass
+
+    for name, run in (("blocking  ", blocking), ("offloaded ", offloaded)):
+        start = time.perf_counter()
+        lags = asyncio.run(measure(run))
+        report(name, time.perf_counter() - start, lags)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
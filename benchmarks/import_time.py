@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2025 dpa-IT Services GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the cold-start import time of newsmlg2 with ``python -X importtime``.
+
+Every run executes the statement in a fresh interpreter, the median of the cumulative
+import time of newsmlg2 and of its submodules imported on first use is reported. The
+script exits with status 1 if the median exceeds the budget, so it can guard the
+budget in CI:
+
+    python benchmarks/import_time.py --runs 15 --budget-ms 50
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+_IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)\s*$")
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(statement: str, module: str = "newsmlg2") -> tuple[float, list]:
+    """Runs `statement` in a fresh interpreter and returns the import time of `module`.
+
+    :param statement: The python statement to run, i.e. ``"import newsmlg2"``.
+    :param module: The package whose cumulative import time is returned, including
+        its submodules imported lazily after the package itself.
+    :return: The cumulative import time in milliseconds and the ten modules with the
+        highest self time as ``(self_us, module)`` tuples.
+    """
+    # no byte code is written to the checkout, so modules without an existing
+    # __pycache__ entry are compiled again in every run
+    env = {**os.environ, "PYTHONPATH": _ROOT, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative = 0
+    self_times = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        self_times.append((int(self_us), name))
+        # top-level imports are not nested, their cumulative times do not overlap
+        if len(indent) == 1 and name.split(".")[0] == module:
+            cumulative += int(cumulative_us)
+    return cumulative / 1000, sorted(self_times, reverse=True)[:10]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=11)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="fail if the median import time exceeds this budget",
+    )
+    parser.add_argument("--statement", default="import newsmlg2")
+    args = parser.parse_args(argv)
+
+    # the first run only warms the file system cache and is not measured
+    measure(args.statement)
+    timings = []
+    top = []
+    for _ in range(max(args.runs, 1)):
+        cumulative, top = measure(args.statement)
+        timings.append(cumulative)
+
+    median = statistics.median(timings)
+    print(f"{args.statement!r}: median {median:.1f} ms over {len(timings)} runs")
+    print(f"min {min(timings):.1f} ms, max {max(timings):.1f} ms")
+    print("slowest modules of the last run (self time):")
+    for self_us, name in top:
+        print(f"  {self_us / 1000:7.2f} ms  {name}")
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"import time exceeds the budget of {args.budget_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2025 dpa-IT Services GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares fully decoded messages with `LazyDocument` backed ones.
+
+The messages of ``tests/data/input`` are converted from raw bytes, once as they are
+and once padded with large fields the converter never reads (rubric, keyword and
+subject names and a nested payload), like real feed entries carry them. Reported are
+the conversion time per message and the memory held by the decoded messages after
+the converter has read them:
+
+    python benchmarks/lazy_document.py
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from newsmlg2 import DigitalwiresModel, G2Converter  # noqa: E402
+from newsmlg2.utils import LazyDocument, get_json_decoder  # noqa: E402
+
+TEMPLATES = os.path.join(_ROOT, "newsmlg2", "templates")
+
+
+def pad(raw: bytes) -> bytes:
+    dw = json.loads(raw)
+    dw["rubric_names"] = [f"Rubrik {i}" for i in range(300)]
+    dw["keyword_names"] = [f"Schlagwort {i}" for i in range(500)]
+    dw["dpasubject_names"] = [f"Sachgebiet {i}" for i in range(300)]
+    dw["autopublishnotice"] = {"log": [{"id": i, "note": "x" * 20} for i in range(200)]}
+    return json.dumps(dw, ensure_ascii=False).encode("utf-8")
+
+
+def per_message(function, corpus: list[bytes], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for raw in corpus:
+                function(raw)
+        best = min(best, time.perf_counter() - start)
+    return best / (repeat * len(corpus))
+
+
+def held_memory(decoder, corpus: list[bytes]) -> int:
+    converter = G2Converter(TEMPLATES)
+    tracemalloc.start()
+    models = []
+    for raw in corpus:
+        model = DigitalwiresModel(decoder(raw))
+        converter.dw_converter.convert(model)
+        models.append(model.digitalwire)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held // len(corpus)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(_ROOT, "tests", "data", "input", "*"))):
+        with open(path, "rb") as f:
+            corpus.append(f.read())
+
+    decoder = get_json_decoder()
+    decoders = [("decoded", decoder), ("lazy", lambda raw: LazyDocument(raw, decoder))]
+    for name, messages in (("test data", corpus), ("padded", list(map(pad, corpus)))):
+        size = sum(map(len, messages)) // len(messages)
+        print(f"{name}, {size} bytes per message:")
+        for decoder_name, decode in decoders:
+            converter = G2Converter(TEMPLATES, decoder=decode)
+            seconds = per_message(converter.convert, messages, args.repeat)
+            held = held_memory(decode, messages)
+            print(
+                f"  {decoder_name:8s} {seconds * 1e6:8.1f} us/message,"
+                f" {held / 1024:7.1f} KiB held per message"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
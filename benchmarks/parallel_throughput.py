@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2025 dpa-IT Services GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the throughput of `convert_parallel` for a growing number of workers.
+
+The messages of ``tests/data/input`` are repeated to a batch of ``--messages``
+messages, which is converted once with `G2Converter.convert_many` in this process and
+then with 1 up to ``--workers`` worker processes:
+
+    python benchmarks/parallel_throughput.py --messages 5000 --workers 8
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from itertools import cycle, islice
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from newsmlg2 import G2Converter, convert_parallel  # noqa: E402
+
+TEMPLATES = os.path.join(_ROOT, "newsmlg2", "templates")
+
+
+def load_corpus() -> list[dict]:
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(_ROOT, "tests", "data", "input", "*"))):
+        with open(path) as f:
+            corpus.append(json.load(f))
+    return corpus
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=32)
+    parser.add_argument("--engine", default="jinja")
+    args = parser.parse_args(argv)
+
+    batch = list(islice(cycle(load_corpus()), args.messages))
+
+    start = time.perf_counter()
+    converter = G2Converter(TEMPLATES, engine=args.engine)
+    for _ in converter.convert_many(batch):
+        pass
+    baseline = args.messages / (time.perf_counter() - start)
+    print(f"in process: {baseline:8.0f} messages/s")
+
+    for workers in range(1, args.workers + 1):
+        start = time.perf_counter()
+        for _ in convert_parallel(
+            batch,
+            workers=workers,
+            chunksize=args.chunksize,
+            ordered=False,
+            templates=TEMPLATES,
+            engine=args.engine,
+        ):
+            pass
+        throughput = args.messages / (time.perf_counter() - start)
+        print(
+            f"{workers:2d} workers: {throughput:8.0f} messages/s,"
+            f" {throughput / baseline:5.2f}x in process"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
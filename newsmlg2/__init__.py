@@ -13,5 +13,61 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from newsmlg2.digitalwires_model import DigitalwiresModel
-from newsmlg2.digitalwires_to_newsmlg2 import convert_to_g2
+"""Converts dpa digitalwires messages into newsmlg2.
+
+The public names are imported lazily on first access, so that ``import newsmlg2``
+does not load jinja2, arrow or the conversion pipeline before they are used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from newsmlg2.aio import AsyncG2Converter
+    from newsmlg2.digitalwires_model import DigitalwiresModel
+    from newsmlg2.digitalwires_to_newsmlg2 import (
+        convert_to_g2,
+        convert_to_g2_into,
+        convert_to_g2_stream,
+        ConversionResult,
+        G2Converter,
+    )
+    from newsmlg2.feed import convert_feed_page, iter_feed_entries
+    from newsmlg2.ndjson import convert_ndjson, iter_ndjson
+    from newsmlg2.parallel import convert_parallel
+    from newsmlg2.result_cache import MemoryResultCache, SQLiteResultCache
+    from newsmlg2.template_cache import cache_info, invalidate_template_cache
+
+_LAZY_ATTRIBUTES = {
+    "DigitalwiresModel": "newsmlg2.digitalwires_model",
+    "convert_to_g2": "newsmlg2.digitalwires_to_newsmlg2",
+    "convert_to_g2_into": "newsmlg2.digitalwires_to_newsmlg2",
+    "convert_to_g2_stream": "newsmlg2.digitalwires_to_newsmlg2",
+    "ConversionResult": "newsmlg2.digitalwires_to_newsmlg2",
+    "G2Converter": "newsmlg2.digitalwires_to_newsmlg2",
+    "convert_parallel": "newsmlg2.parallel",
+    "convert_feed_page": "newsmlg2.feed",
+    "iter_feed_entries": "newsmlg2.feed",
+    "convert_ndjson": "newsmlg2.ndjson",
+    "iter_ndjson": "newsmlg2.ndjson",
+    "MemoryResultCache": "newsmlg2.result_cache",
+    "SQLiteResultCache": "newsmlg2.result_cache",
+    "AsyncG2Converter": "newsmlg2.aio",
+    "cache_info": "newsmlg2.template_cache",
+    "invalidate_template_cache": "newsmlg2.template_cache",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Union
+
+from newsmlg2.digitalwires_to_newsmlg2 import ConversionResult, G2Converter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _WorkerConfig:
+    # compared and hashed by the key alone, which is unique per AsyncG2Converter, as
+    # the jinja arguments and filters are not hashable
+    key: str
+    templates: str = field(compare=False)
+    jinja_args: dict = field(compare=False)
+    filters: dict = field(compare=False)
+    engine: str = field(compare=False)
+
+
+class AsyncG2Converter(object):
+    """Converts digitalwires messages without blocking the event loop.
+
+    The conversion runs in an executor, the default executor of the running loop
+    unless one is given, and at most `max_concurrency` conversions are in flight at a
+    time. With a `ProcessPoolExecutor` every worker process creates its own
+    `G2Converter` on its first message, otherwise one converter is shared by the
+    threads of the executor.
+    """
+
+    def __init__(
+        self,
+        templates: str = "./newsmlg2/templates",
+        jinja_args: dict = None,
+        filters: dict[str, Callable] = None,
+        engine: str = "jinja",
+        executor: Executor = None,
+        max_concurrency: int = None,
+    ):
+        """
+        :param templates: A path to a jinja templates folder conatining a file called
+            `g2_tamplate.j2`.
+        :param jinja_args: Optional arguments to pass to jinja2.Environment.
+        :param filters: Optional jinja filters, in addition to or replacing the default
+            `datetimeformat` filter. They have to be picklable for process pools.
+        :param engine: The engine of the converter, see `G2Converter`.
+        :param executor: The executor running the conversions. Defaults to the default
+            executor of the event loop.
+        :param max_concurrency: The maximum number of conversions in flight. Defaults
+            to the number of CPUs.
+        """
+        self.executor = executor
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if isinstance(executor, ProcessPoolExecutor):
+            config = _WorkerConfig(
+                uuid.uuid4().hex, templates, jinja_args, filters, engine
+            )
+            self._convert = partial(_convert_in_worker, config)
+        else:
+            converter = G2Converter(templates, jinja_args, filters, engine=engine)
+            self._convert = converter.convert
+
+    async def convert(self, digitalwires: dict) -> str:
+        """Converts a single digitalwires message into a newsmlg2 message.
+
+        Waits while `max_concurrency` conversions are in flight.
+        :param digitalwires: The parsed json representation of a digitalwires message.
+        :return: The newsmlg2 message as a string.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, self._convert, digitalwires
+            )
+
+    async def convert_many(
+        self,
+        digitalwires: Union[Iterable[dict], AsyncIterable[dict]],
+        ordered: bool = True,
+    ) -> AsyncIterator[ConversionResult]:
+        """Converts many digitalwires messages concurrently.
+
+        Messages are only taken from `digitalwires` while fewer than `max_concurrency`
+        conversions are in flight, so a slow consumer slows down the producer. A
+        message failing to convert does not abort the batch, its result carries the
+        raised exception.
+        :param digitalwires: An iterable or async iterable of parsed digitalwires
+            messages.
+        :param ordered: If ``True`` the results are yielded in input order, otherwise as
+            soon as they are converted.
+        :return: An async iterator of ConversionResult objects.
+        """
+        pending = deque()
+        try:
+            index = 0
+            async for dw in _aiter(digitalwires):
+                if len(pending) >= self.max_concurrency:
+                    yield await _next_done(pending, ordered)
+                pending.append(asyncio.ensure_future(self._convert_result(index, dw)))
+                index += 1
+            while pending:
+                yield await _next_done(pending, ordered)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _convert_result(self, index: int, dw: dict) -> ConversionResult:
+        urn = dw.get("urn") if isinstance(dw, Mapping) else None
+        start = time.perf_counter()
+        try:
+            g2 = await self.convert(dw)
+        except Exception as e:
+            logger.warning("Failed to convert entry %s (%s): %r", index, urn, e)
+            duration = time.perf_counter() - start
+            return ConversionResult(index, urn, error=e, duration=duration)
+        duration = time.perf_counter() - start
+        return ConversionResult(index, urn, g2=g2, duration=duration)
+
+
+async def _aiter(digitalwires: Union[Iterable[dict], AsyncIterable[dict]]):
+    if hasattr(digitalwires, "__aiter__"):
+        async for dw in digitalwires:
+            yield dw
+    else:
+        for dw in digitalwires:
+            yield dw
+
+
+async def _next_done(pending: deque, ordered: bool) -> ConversionResult:
+    if ordered:
+        return await pending.popleft()
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    task = next(iter(done))
+    pending.remove(task)
+    return task.result()
+
+
+@lru_cache(maxsize=16)
+def _worker_converter(config: _WorkerConfig) -> G2Converter:
+    # the converters of a worker process, created on the first message of each
+    # AsyncG2Converter using a process pool
+    return G2Converter(
+        config.templates, config.jinja_args, config.filters, engine=config.engine
+    )
+
+
+def _convert_in_worker(config: _WorkerConfig, digitalwires: dict) -> str:
+    return _worker_converter(config).convert(digitalwires)
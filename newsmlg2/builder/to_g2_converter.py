@@ -15,6 +15,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from abc import ABC, abstractmethod
+from functools import lru_cache, partial, wraps
+from typing import Any, Callable, Union
 
 from newsmlg2.digitalwires_model import DigitalwiresModel
 from newsmlg2.extractor.association_extractor import get_associations
@@ -70,6 +72,7 @@ from newsmlg2.extractor.notepad_extractor import (
 )
 from newsmlg2.renderer import render_item_class
 from newsmlg2.renderer.render_content import (
+    IncrementalArticle,
     render_slugline,
     render_article,
     render_infobox,
@@ -101,6 +104,7 @@ from newsmlg2.renderer.render_rights_info import (
     render_copyright_notice,
     render_usageterms,
 )
+from newsmlg2.utils import Link
 
 
 class Converter(ABC):
@@ -109,85 +113,181 @@ class Converter(ABC):
         pass
 
 
+def render_remote_content_if_media(
+    dw_model: DigitalwiresModel,
+    extractors: list[Callable[[DigitalwiresModel], list[Link]]],
+) -> Union[list[dict[str, str]], None]:
+    return render_remote_content(dw_model, extractors) if not dw_model.is_text else None
+
+
+def memoized(extractor: Callable[[DigitalwiresModel], Any]) -> Callable:
+    """Wraps an extractor, so that it runs only once per model.
+
+    :param extractor: An extractor function, which takes a model.
+    :return: A function returning the result of the extractor, cached by the model.
+    """
+
+    @wraps(extractor)
+    def extract(dw_model: DigitalwiresModel) -> Any:
+        return dw_model.extract(extractor)
+
+    return extract
+
+
 class DwToG2Converter(Converter):
+    """Converts a model of a digitalwires message into the context of the newsmlg2
+    template.
+
+    `fields` lists every context field as a tuple of the field name, the renderer and
+    the extractors passed to the renderer. If the renderer is ``None``, the field is
+    the result of the single extractor, if it is a string, it names a method of the
+    converter. The fields are compiled once per class, which wraps every extractor
+    with `memoized`, every converter only binds the renderers named by a string into
+    its `plan`. Extractors shared by several fields, i.e. the subjects used for the
+    subjects and the sluglines, then run only once per message.
+    """
+
     name = "dpa-digitalwires-to-newsmlg2"
     role = "dnlgenerator:dw2newsmlg2"
     version = "0.0.1"
 
-    def convert(self, dw_model: DigitalwiresModel):
-
-        return {
-            # newsItem
-            "urn": get_urn(dw_model),
-            "version": render_version(dw_model, get_version),
-            # rightsInfo
-            "copyright_notice": render_copyright_notice(dw_model, get_copyright_notice),
-            "usageterms": render_usageterms(dw_model, [get_usageterms]),
-            # itemMeta
-            "item_class": render_item_class(dw_model),
-            "provider": render_provider(
-                dw_model, get_provider_qcode, get_provider_name
-            ),
-            "version_created": get_version_created(dw_model),
-            "embargoed": get_embargo(dw_model),
-            "pubstatus": render_pubstatus(
-                dw_model, get_pubstatus_qcode, get_pubstatus_name
-            ),
-            "generator": {
-                "name": self.name,
-                "role": self.role,
-                "version": self.version,
-            },
-            "services": render_services(dw_model, [get_services]),
-            "ednotes": render_ednotes(dw_model, [get_ednotes]),
-            "notepad": render_notepad(
-                dw_model,
-                get_notepad_header,
-                get_public_notepad,
-                get_non_public_notepad,
-                get_closing_line,
-            ),
-            "signals": render_signal(dw_model, get_signal_qcodes),
-            "association_links": render_links(
-                dw_model, [get_associations, get_linkbox]
-            ),
-            # contentMeta
-            "urgency": get_urgency(dw_model),
-            "content_created": render_content_created(dw_model, [get_content_created]),
-            "located_list": render_located(dw_model, [get_located]),
-            "info_sources": render_infosource(dw_model, [get_infosource]),
-            "creators": render_creator(dw_model, [get_creator]),
-            "contributors": render_contributor(dw_model, [get_contributor]),
-            "genre": render_genre(dw_model, get_genre),
-            "subjects": render_subjects(
-                dw_model, [get_desk, get_geo_subject, get_dpa_subjects]
-            ),
-            "audiences": render_audience(dw_model, [get_scope]),
-            "language": get_language(dw_model),
-            "keywords": render_keywords(dw_model, [get_keywords]),
-            "headline": get_headline(dw_model),
-            "byline": get_byline(dw_model),
-            "dateline": get_dateline(dw_model),
-            "credit": get_creditline(dw_model),
-            "descriptions": render_descriptions(dw_model, [get_descriptions]),
-            # pois
-            "pois": render_pois(dw_model, [get_poi]),
-            # contentSet
-            "kicker": get_kicker(dw_model),
-            "teaser": get_teaser(dw_model),
-            "embargo_notice": get_embargo_notice(dw_model),
-            "sluglines": render_slugline(
-                dw_model, [get_dpa_subjects, get_geo_subject, get_keywords]
-            ),
-            "article_html": (
-                render_article(dw_model, get_dateline, get_article)
-                if dw_model.is_text_message()
-                else None
-            ),
-            "infobox": render_infobox(dw_model, get_infobox),
-            "remote_contents": (
-                render_remote_content(dw_model, [get_associations])
-                if not dw_model.is_text_message()
-                else None
-            ),
-        }
+    fields = [
+        # newsItem
+        ("urn", None, get_urn),
+        ("version", render_version, get_version),
+        # rightsInfo
+        ("copyright_notice", render_copyright_notice, get_copyright_notice),
+        ("usageterms", render_usageterms, [get_usageterms]),
+        # itemMeta
+        ("item_class", render_item_class),
+        ("provider", render_provider, get_provider_qcode, get_provider_name),
+        ("version_created", None, get_version_created),
+        ("embargoed", None, get_embargo),
+        ("pubstatus", render_pubstatus, get_pubstatus_qcode, get_pubstatus_name),
+        ("generator", "render_generator"),
+        ("services", render_services, [get_services]),
+        ("ednotes", render_ednotes, [get_ednotes]),
+        (
+            "notepad",
+            render_notepad,
+            get_notepad_header,
+            get_public_notepad,
+            get_non_public_notepad,
+            get_closing_line,
+        ),
+        ("signals", render_signal, get_signal_qcodes),
+        ("association_links", render_links, [get_associations, get_linkbox]),
+        # contentMeta
+        ("urgency", None, get_urgency),
+        ("content_created", render_content_created, [get_content_created]),
+        ("located_list", render_located, [get_located]),
+        ("info_sources", render_infosource, [get_infosource]),
+        ("creators", render_creator, [get_creator]),
+        ("contributors", render_contributor, [get_contributor]),
+        ("genre", render_genre, get_genre),
+        ("subjects", render_subjects, [get_desk, get_geo_subject, get_dpa_subjects]),
+        ("audiences", render_audience, [get_scope]),
+        ("language", None, get_language),
+        ("keywords", render_keywords, [get_keywords]),
+        ("headline", None, get_headline),
+        ("byline", None, get_byline),
+        ("dateline", None, get_dateline),
+        ("credit", None, get_creditline),
+        ("descriptions", render_descriptions, [get_descriptions]),
+        # pois
+        ("pois", render_pois, [get_poi]),
+        # contentSet
+        ("kicker", None, get_kicker),
+        ("teaser", None, get_teaser),
+        ("embargo_notice", None, get_embargo_notice),
+        (
+            "sluglines",
+            render_slugline,
+            [get_dpa_subjects, get_geo_subject, get_keywords],
+        ),
+        ("article_html", "render_article", get_dateline, get_article),
+        ("infobox", render_infobox, get_infobox),
+        ("remote_contents", render_remote_content_if_media, [get_associations]),
+    ]
+
+    def __init__(self, incremental_article: bool = False):
+        """
+        :param incremental_article: If ``True`` the article is rendered lazily while
+            the template consumes it, see `render_article`.
+        """
+        self.incremental_article = incremental_article
+        self.plan = self._bind(_compile_class_fields(type(self)))
+
+    def compile_plan(
+        self, fields: list[tuple]
+    ) -> list[tuple[str, Callable[[DigitalwiresModel], Any]]]:
+        """Compiles the context fields into an execution plan.
+
+        The fields of the class are compiled once when its first converter is created,
+        this compiles other fields from scratch.
+        :param fields: Tuples of the field name, the renderer or ``None`` and the
+            extractors, as in `fields`.
+        :return: A list of tuples of the field name and a function taking the model.
+        """
+        return self._bind(_compile_fields(fields))
+
+    def _bind(
+        self, compiled: list[tuple]
+    ) -> list[tuple[str, Callable[[DigitalwiresModel], Any]]]:
+        return [
+            (
+                field,
+                step if method is None else partial(_step, getattr(self, method), args),
+            )
+            for field, step, method, args in compiled
+        ]
+
+    def render_article(
+        self,
+        dw_model: DigitalwiresModel,
+        extract_dateline: Callable[[DigitalwiresModel], str],
+        extract_article: Callable[[DigitalwiresModel], str],
+    ) -> Union[list[str], IncrementalArticle, None]:
+        if not dw_model.is_text:
+            return None
+        return render_article(
+            dw_model, extract_dateline, extract_article, self.incremental_article
+        )
+
+    def render_generator(self, dw_model: DigitalwiresModel) -> dict[str, str]:
+        return {"name": self.name, "role": self.role, "version": self.version}
+
+    def convert(self, dw_model: DigitalwiresModel) -> dict[str, Any]:
+        dw_model.build_indexes()
+        return {field: step(dw_model) for field, step in self.plan}
+
+
+def _step(render: Callable, args: list, dw_model: DigitalwiresModel) -> Any:
+    return render(dw_model, *args)
+
+
+@lru_cache(maxsize=64)
+def _compile_class_fields(cls: type) -> list[tuple]:
+    return _compile_fields(cls.fields)
+
+
+def _compile_fields(fields: list[tuple]) -> list[tuple]:
+    # tuples of the field name and its step, or of the field name, the name of the
+    # rendering method and its arguments, which are bound by every converter
+    compiled = []
+    for field, render, *extractors in fields:
+        args = [
+            (
+                [memoized(extractor) for extractor in arg]
+                if isinstance(arg, list)
+                else memoized(arg)
+            )
+            for arg in extractors
+        ]
+        if render is None:
+            compiled.append((field, args[0], None, None))
+        elif isinstance(render, str):
+            compiled.append((field, None, render, args))
+        else:
+            compiled.append((field, partial(_step, render, args), None, None))
+    return compiled
@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""dw2g2, a command-line batch converter from digitalwires to newsmlg2.
+
+Converts digitalwires JSON files, directories of them and NDJSON streams (one message
+per line, ``.ndjson`` or ``.jsonl`` files or ``-`` for stdin) to newsmlg2 files:
+
+    dw2g2 -o out/ archive/ feed.ndjson -j 8
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import statistics
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterator, TextIO, Union
+
+from newsmlg2.digitalwires_to_newsmlg2 import ENGINES, ConversionResult, G2Converter
+from newsmlg2.templates import TEMPLATES_DIR
+
+logger = logging.getLogger(__name__)
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+JSON_SUFFIXES = (".json",) + NDJSON_SUFFIXES
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass
+class Job:
+    """A digitalwires message and the file its newsmlg2 message is written to."""
+
+    source: str
+    output: str
+    digitalwires: dict
+
+
+@dataclass
+class Summary:
+    converted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    durations: list = None
+
+    def report(self, out: TextIO):
+        durations = sorted(self.durations or [])
+        rate = self.converted / self.elapsed if self.elapsed else 0.0
+        print(
+            f"converted {self.converted}, skipped {self.skipped}, failed {self.failed}"
+            f" in {self.elapsed:.2f} s ({rate:.1f} messages/s)",
+            file=out,
+        )
+        if durations:
+            p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+            print(
+                f"latency median {statistics.median(durations) * 1000:.2f} ms,"
+                f" p95 {p95 * 1000:.2f} ms, max {durations[-1] * 1000:.2f} ms",
+                file=out,
+            )
+
+
+def iter_jobs(
+    inputs: list[str], output_dir: str, force: bool, summary: Summary
+) -> Iterator[Job]:
+    """Yields a job for every message of `inputs` whose output is not up to date.
+
+    An output is up to date if it is at least as new as the file it was converted
+    from. Messages read from stdin are always converted. A message whose output was
+    already claimed by another message of this run, i.e. of two files of the same
+    name in different folders, is counted as failed.
+    :param inputs: Paths of JSON files, NDJSON files and directories, or ``-``.
+    :param output_dir: The folder the newsmlg2 files are written to. Files found in a
+        directory keep their path relative to the directory.
+    :param force: If ``True`` up to date outputs are converted again.
+    :param summary: The summary counting the skipped and failed messages.
+    :return: An iterator of jobs, decoding the messages lazily.
+    """
+    claimed = {}
+    for path in inputs:
+        if path == "-":
+            yield from _iter_ndjson(
+                sys.stdin, "stdin", output_dir, None, force, summary, claimed
+            )
+        elif os.path.isdir(path):
+            for source in _walk(path):
+                relative = os.path.relpath(source, path)
+                target = os.path.join(output_dir, os.path.dirname(relative))
+                yield from _iter_file(source, target, force, summary, claimed)
+        else:
+            yield from _iter_file(path, output_dir, force, summary, claimed)
+
+
+def _walk(directory: str) -> Iterator[str]:
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(JSON_SUFFIXES):
+                yield os.path.join(root, name)
+
+
+def _iter_file(
+    source: str, output_dir: str, force: bool, summary: Summary, claimed: dict
+) -> Iterator[Job]:
+    # an unreadable input is counted as failed and does not abort the run
+    try:
+        yield from _read_file(source, output_dir, force, summary, claimed)
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error("Failed to read %s: %s", source, e)
+        summary.failed += 1
+
+
+def _read_file(
+    source: str, output_dir: str, force: bool, summary: Summary, claimed: dict
+) -> Iterator[Job]:
+    mtime = os.stat(source).st_mtime
+    if source.endswith(NDJSON_SUFFIXES):
+        stem = os.path.splitext(os.path.basename(source))[0]
+        target = os.path.join(output_dir, stem)
+        with open(source, encoding="utf-8") as f:
+            yield from _iter_ndjson(f, source, target, mtime, force, summary, claimed)
+        return
+    name = os.path.splitext(os.path.basename(source))[0] + ".xml"
+    output = os.path.join(output_dir, name)
+    if not _claim(output, source, claimed, summary):
+        return
+    if not force and _is_up_to_date(output, mtime):
+        summary.skipped += 1
+        return
+    with open(source, encoding="utf-8") as f:
+        dw = _decode(f.read(), source, summary)
+    if dw is not None:
+        yield Job(source, output, dw)
+
+
+def _iter_ndjson(
+    lines: TextIO,
+    source: str,
+    output_dir: str,
+    mtime: Union[float, None],
+    force: bool,
+    summary: Summary,
+    claimed: dict,
+) -> Iterator[Job]:
+    fallback = os.path.basename(source)
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        dw = _decode(line, f"{source}:{number}", summary)
+        if dw is None:
+            continue
+        output = os.path.join(output_dir, _output_name(dw, f"{fallback}-{number}"))
+        if not _claim(output, f"{source}:{number}", claimed, summary):
+            continue
+        if not force and mtime is not None and _is_up_to_date(output, mtime):
+            summary.skipped += 1
+            continue
+        yield Job(f"{source}:{number}", output, dw)
+
+
+def _claim(output: str, source: str, claimed: dict, summary: Summary) -> bool:
+    # checked before the output is considered up to date, as it may have been written
+    # by the other message earlier in this run
+    key = os.path.normcase(os.path.abspath(output))
+    other = claimed.setdefault(key, source)
+    if other == source:
+        return True
+    logger.error("Not converting %s, %s is written to %s", source, other, output)
+    summary.failed += 1
+    return False
+
+
+def _decode(text: str, source: str, summary: Summary) -> Union[dict, None]:
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        logger.error("Failed to decode %s: %s", source, e)
+        summary.failed += 1
+        return None
+
+
+def _output_name(dw: dict, fallback: str) -> str:
+    # the version is part of the name, as a stream may contain several versions of
+    # a message
+    urn = dw.get("urn") if isinstance(dw, dict) else None
+    if not urn:
+        return _UNSAFE_CHARS.sub("_", fallback) + ".xml"
+    version = dw.get("version")
+    name = urn if version is None else f"{urn}-{version}"
+    return _UNSAFE_CHARS.sub("_", name) + ".xml"
+
+
+def _is_up_to_date(output: str, mtime: float) -> bool:
+    try:
+        return os.stat(output).st_mtime >= mtime
+    except OSError:
+        return False
+
+
+def _write(output: str, g2: str):
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    # written to a temporary file first, so an interrupted run leaves no partial
+    # output that would be considered up to date
+    tmp = f"{output}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(g2)
+    os.replace(tmp, output)
+
+
+def convert_jobs(
+    jobs: Iterator[Job], args: argparse.Namespace
+) -> Iterator[tuple[Job, ConversionResult]]:
+    """Converts the messages of `jobs`, in worker processes if ``args.jobs > 1``.
+
+    :param jobs: The jobs to convert.
+    :param args: The parsed command-line arguments.
+    :return: An iterator of the jobs and their results in input order.
+    """
+    queued = deque()
+
+    def entries():
+        for job in jobs:
+            queued.append(job)
+            yield job.digitalwires
+            # the converter holds the message now, the job only needs its output
+            job.digitalwires = None
+
+    if args.jobs > 1:
+        from newsmlg2.parallel import convert_parallel
+
+        results = convert_parallel(
+            entries(),
+            workers=args.jobs,
+            chunksize=args.chunksize,
+            templates=args.templates,
+            engine=args.engine,
+        )
+    else:
+        converter = G2Converter(args.templates, engine=args.engine)
+        results = converter.convert_many(entries())
+    for result in results:
+        yield queued.popleft(), result
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dw2g2", description="Converts digitalwires messages to newsmlg2."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="JSON files, NDJSON files (.ndjson, .jsonl), directories or - for NDJSON"
+        " from stdin",
+    )
+    parser.add_argument(
+        "-o", "--output-dir", default=".", help="folder to write the newsmlg2 files to"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=_positive_int, default=1, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=_positive_int,
+        default=16,
+        help="messages sent to a worker process at once",
+    )
+    parser.add_argument("--engine", choices=ENGINES, default="jinja")
+    parser.add_argument(
+        "--templates", default=TEMPLATES_DIR, help="folder containing g2_template.j2"
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="convert messages whose output is up to date",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="do not print the summary"
+    )
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+    summary = Summary(durations=[])
+    start = time.perf_counter()
+    jobs = iter_jobs(args.inputs, args.output_dir, args.force, summary)
+    for job, result in convert_jobs(jobs, args):
+        if result.ok:
+            _write(job.output, result.g2)
+            summary.converted += 1
+            summary.durations.append(result.duration)
+        else:
+            logger.error("Failed to convert %s: %r", job.source, result.error)
+            summary.failed += 1
+    summary.elapsed = time.perf_counter() - start
+    if not args.quiet:
+        summary.report(sys.stderr)
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
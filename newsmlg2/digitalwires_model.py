@@ -14,12 +14,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from dataclasses import dataclass
+import time
+import xml.etree.ElementTree as ETree
+from collections import namedtuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
 from operator import itemgetter
-from typing import Any
+from typing import Any, Callable
 
-from newsmlg2.utils import get_none_safe, get_rank
-from newsmlg2.utils.objects import Category, EdNote
+from newsmlg2.utils import (
+    JsonInput,
+    LazyDocument,
+    get_json_decoder,
+    get_none_safe,
+    get_rank,
+)
+from newsmlg2.utils.objects import Category, EdNote, object_factory
+
+FragmentCacheInfo = namedtuple(
+    "FragmentCacheInfo", ["hits", "misses", "parse_time", "parsed_chars"]
+)
 
 
 @dataclass
@@ -34,9 +49,55 @@ class DigitalwiresModel(object):
     The class uses a custom sorting mechanism based on a 'rank' attribute and provides
     flexibility in selecting specific attributes from the items. It also implements
     safeguards against None values in the underlying data structure.
+
+    Categories are indexed by their type and ednotes by their role the first time they
+    are accessed, and the resulting items are kept per type or role and attributes. The
+    model therefore assumes that the categories and ednotes of `digitalwire` are not
+    changed after they have been accessed.
+
+    HTML fragments like `article_html` are parsed by `parse_fragment` at most once per
+    model, `fragment_cache_info` tells how often and for how long they were parsed.
+
+    `digitalwire` can be any mapping, i.e. a `LazyDocument` which decodes the fields of
+    the raw JSON only when they are read, see `from_json`.
     """
 
-    digitalwire: dict[str, Any]
+    digitalwire: Mapping[str, Any]
+    _category_items: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _ednote_items: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _extracted: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _fragments: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _fragment_stats: list = field(
+        default_factory=lambda: [0, 0, 0.0, 0], init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_json(
+        cls,
+        raw: JsonInput,
+        lazy: bool = False,
+        decoder: Callable[[JsonInput], Any] = None,
+    ) -> "DigitalwiresModel":
+        """Creates a model from the raw JSON of a digitalwires message.
+
+        :param raw: The message as UTF-8 bytes, bytearray, memoryview or string.
+        :param lazy: If ``True`` the message is backed by a `LazyDocument`, which keeps
+            only the fields that are read as objects.
+        :param decoder: The JSON decoder, defaults to `get_json_decoder()`.
+        :return: The model of the message.
+        """
+        decoder = decoder or get_json_decoder()
+        if lazy:
+            return cls(LazyDocument(raw, decoder))
+        return cls(decoder(raw))
 
     def __getitem__(self, key):
         return self.get(key)
@@ -47,19 +108,116 @@ class DigitalwiresModel(object):
     def __missing__(self, key):
         return None
 
+    def build_indexes(self) -> None:
+        """Builds the category and ednote indexes, scanning each collection once."""
+        self.categories_by_type
+        self.ednotes_by_role
+
+    def extract(self, extractor: Callable[["DigitalwiresModel"], Any]) -> Any:
+        """Returns the result of an extractor, calling it only once per model.
+
+        :param extractor: An extractor function, which takes the model.
+        :return: The result of `extractor(self)`, shared by all callers.
+        """
+        try:
+            return self._extracted[extractor]
+        except KeyError:
+            result = self._extracted[extractor] = extractor(self)
+            return result
+
+    def parse_fragment(self, html: str) -> ETree.Element:
+        """Returns the parsed tree of an HTML fragment, parsing it only once per model.
+
+        The tree is shared by all callers and must not be modified, copy it first.
+        :param html: An HTML fragment of the message, i.e. `article_html`.
+        :return: The root element of the fragment.
+        """
+        stats = self._fragment_stats
+        element = self._fragments.get(html)
+        if element is not None:
+            stats[0] += 1
+            return element
+        start = time.perf_counter()
+        element = self._fragments[html] = ETree.fromstring(html)
+        stats[1] += 1
+        stats[2] += time.perf_counter() - start
+        stats[3] += len(html)
+        return element
+
+    def fragment_cache_info(self) -> FragmentCacheInfo:
+        """Returns the statistics of the parsed HTML fragments.
+
+        :return: A named tuple of hits, misses, the seconds spent parsing and the number
+            of parsed characters.
+        """
+        return FragmentCacheInfo(*self._fragment_stats)
+
+    @cached_property
+    def categories_by_type(self) -> dict[str, list[dict]]:
+        """The categories grouped by their type, each group in document order."""
+        index = {}
+        for cat in get_none_safe(self, "categories", []):
+            index.setdefault(cat.get("type", ""), []).append(cat)
+        return index
+
+    def categories(self, cat_type=None) -> list[dict]:
+        """Returns the categories of a type, or all categories, sorted by rank.
+
+        :param cat_type: The category type, i.e. ``"dnltype:keyword"``. If ``None``
+            all categories are returned.
+        :return: The rank-sorted list of category dicts. The list is shared by all
+            callers and must not be modified.
+        """
+        key = (cat_type, None)
+        ranked = self._category_items.get(key)
+        if ranked is None:
+            if cat_type:
+                ranked = self.categories_by_type.get(cat_type, [])
+            else:
+                ranked = get_none_safe(self, "categories", [])
+            ranked = sorted(ranked, key=get_rank)
+            self._category_items[key] = ranked
+        return ranked
+
     def category_items(self, cat_type=None, attrs: list[str] = None) -> list[Category]:
-        type_filter = {"key": "type", "value": cat_type} if cat_type else None
-        return [
-            Category(**dict(zip(Category.map_dw_key(attrs), cat)))
-            for cat in self.get_sorted_list(attrs, "categories", type_filter)
-        ]
+        if attrs is None:
+            attrs = ["type", "name", "qcode", "rank"]
+        key = (cat_type, tuple(attrs))
+        items = self._category_items.get(key)
+        if items is None:
+            create = object_factory(Category, key[1])
+            items = [create(cat) for cat in self.categories(cat_type)]
+            self._category_items[key] = items
+        return list(items)
+
+    @cached_property
+    def ranked_ednotes(self) -> list[dict]:
+        """All ednotes sorted by rank."""
+        return sorted(get_none_safe(self, "ednotes", []), key=get_rank)
+
+    @cached_property
+    def ednotes_by_role(self) -> dict[str, list[dict]]:
+        """The ednotes grouped by their role, each group sorted by rank."""
+        index = {}
+        for ednote in self.ranked_ednotes:
+            index.setdefault(ednote.get("role", ""), []).append(ednote)
+        return index
 
     def notepad_items(self, notepad_role=None, attrs: list[str] = None) -> list[EdNote]:
-        role_filter = {"key": "role", "value": notepad_role} if notepad_role else None
-        return [
-            EdNote(**dict(zip(attrs, ednote)))
-            for ednote in self.get_sorted_list(attrs, "ednotes", role_filter)
-        ]
+        if attrs is None:
+            attrs = ["role", "ednote", "is_publishable"]
+        key = (notepad_role, tuple(attrs))
+        items = self._ednote_items.get(key)
+        if items is None:
+            ednotes = (
+                self.ednotes_by_role.get(notepad_role, [])
+                if notepad_role
+                else self.ranked_ednotes
+            )
+            create = object_factory(EdNote, key[1])
+            items = [create(ednote) for ednote in ednotes]
+            self._ednote_items[key] = items
+        return list(items)
 
     def get_sorted_list(self, attrs, col_field, filter_options):
         if attrs is None:
@@ -78,13 +236,33 @@ class DigitalwiresModel(object):
             or categorie.get(filter_options["key"], "") == filter_options["value"]
         ]
 
-    def _count_associations(self) -> int:
-        return len(self.get("associations", []))
+    @cached_property
+    def association_count(self) -> int:
+        """The number of associations of the message."""
+        return len(get_none_safe(self, "associations", []))
 
-    def get_item_class(self):
-        if self["article_html"] is not None:
+    @cached_property
+    def has_article(self) -> bool:
+        """Whether the message has an article, i.e. `article_html` is not ``None``."""
+        return self["article_html"] is not None
+
+    @cached_property
+    def has_linkbox(self) -> bool:
+        """Whether the message has a non-empty linkbox."""
+        return bool(self["linkbox_html"])
+
+    @cached_property
+    def has_infobox(self) -> bool:
+        """Whether the message has an infobox, i.e. `infobox_html` is not ``None``."""
+        return self["infobox_html"] is not None
+
+    @cached_property
+    def item_class(self) -> str:
+        """The newsmlg2 item class qcode, i.e. ``"ninat:text"`` or
+        ``"ninat:picture"``."""
+        if self.has_article:
             return "ninat:text"
-        elif self._count_associations() == 1:
+        elif self.association_count == 1:
             assoc = self.get("associations", [])[0]
             if "image" == assoc.get("type"):
                 return f"ninat:picture"
@@ -93,8 +271,19 @@ class DigitalwiresModel(object):
         else:
             return "ninat:text"
 
+    @cached_property
+    def is_text(self) -> bool:
+        """Whether the item class of the message is ``"ninat:text"``."""
+        return self.item_class == "ninat:text"
+
+    def _count_associations(self) -> int:
+        return self.association_count
+
+    def get_item_class(self):
+        return self.item_class
+
     def is_text_message(self) -> bool:
-        return self.get_item_class() == "ninat:text"
+        return self.is_text
 
 
 class KeySafeDict(dict):
@@ -14,45 +14,377 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import arrow
-from jinja2 import Environment, FileSystemLoader
+import io
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Union
 
 from newsmlg2 import DigitalwiresModel
 from newsmlg2.builder.to_g2_converter import DwToG2Converter
+from newsmlg2.utils import JsonInput, get_json_decoder, parse_iso_datetime
+
+if TYPE_CHECKING:
+    from newsmlg2.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
 
 
 def datetime_format(value, format="%H:%M %d-%m-%y"):
+    if isinstance(value, str) and isinstance(format, str):
+        return _datetime_format(value, format)
+    return _arrow_format(value, format)
+
+
+@lru_cache(maxsize=4096)
+def _datetime_format(value: str, format: str) -> str:
+    # arrow names timezones differently than datetime, so %Z is left to arrow
+    if "%Z" not in format:
+        parsed = parse_iso_datetime(value)
+        if parsed is not None:
+            return parsed.strftime(format)
+    return _arrow_format(value, format)
+
+
+def _arrow_format(value, format: str) -> str:
+    import arrow
+
     return arrow.get(value).strftime(format)
 
 
+DEFAULT_FILTERS = {"datetimeformat": datetime_format}
+
+ENGINES = ("jinja", "native", "lxml")
+
+
+@dataclass(eq=True, frozen=True)
+class ConversionResult:
+    """The outcome of converting one entry of a batch.
+
+    Exactly one of `g2` and `error` is set. `index` is the position of the entry in the
+    input iterable, `duration` the seconds it took to convert the entry.
+    """
+
+    index: int
+    urn: str = None
+    g2: str = None
+    error: Exception = None
+    duration: float = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class G2Converter(object):
+    """A long-lived converter from digitalwires to newsmlg2.
+
+    The jinja environment, the compiled template and the extraction pipeline are set
+    up once when the converter is created and reused for every conversion, so one
+    instance should be kept around for as long as messages are converted.
+
+    With ``engine="native"`` the message is written by `newsmlg2.serializer` instead of
+    rendering the template. Its output is byte-identical to the bundled
+    `g2_template.j2`, custom templates and jinja args are not supported by this engine.
+
+    With ``engine="lxml"`` the message of the bundled template is built as an lxml tree
+    and serialized by lxml. The result is the same XML, but pretty printed by lxml
+    instead of indented like the template. If lxml is not installed, the converter
+    falls back to the ``"jinja"`` engine.
+    """
+
+    def __init__(
+        self,
+        templates: str = "./newsmlg2/templates",
+        jinja_args: dict = None,
+        filters: dict[str, Callable] = None,
+        bytecode_cache: str = None,
+        engine: str = "jinja",
+        incremental_article: bool = False,
+        decoder: Union[str, Callable[[JsonInput], Any]] = None,
+        cache: "ResultCache" = None,
+    ):
+        """
+        :param templates: A path to a jinja templates folder conatining a file called
+            `g2_tamplate.j2`.
+        :param jinja_args: Optional arguments to pass to jinja2.Environment.
+        :param filters: Optional jinja filters, in addition to or replacing the default
+            `datetimeformat` filter.
+        :param bytecode_cache: Optional folder to persist compiled custom templates in,
+            so that new processes can skip compiling them.
+        :param engine: Either ``"jinja"`` to render the template, ``"native"`` to
+            write the message of the bundled template without jinja or ``"lxml"`` to
+            build it with lxml.
+        :param incremental_article: If ``True`` the article is parsed while it is
+            rendered, so `stream` and `convert_into` keep only one paragraph of very
+            large articles in memory.
+        :param decoder: The JSON decoder for messages passed as bytes, ``"orjson"``,
+            ``"stdlib"`` or a function taking the bytes and returning a dict. Defaults to
+            orjson if it is installed, otherwise to the standard library.
+        :param cache: An optional `newsmlg2.result_cache.ResultCache`. Messages are
+            looked up by their `urn` and `version` (or `entry_id` and `updated`) and
+            the converter configuration before anything is extracted, `convert` stores
+            the messages it renders. The cache is bypassed if a filter is not a
+            function defined at the top level of a module.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        dw_converter = DwToG2Converter
+        if engine == "lxml":
+            from newsmlg2.serializer import lxml_serializer
+
+            if lxml_serializer.HAS_LXML:
+                self._serialize = lxml_serializer.serialize_g2_tree
+                dw_converter = lxml_serializer.LxmlDwToG2Converter
+            else:
+                logger.warning(
+                    "lxml is not installed, falling back to the jinja engine"
+                )
+                engine = "jinja"
+        elif engine == "native":
+            from newsmlg2.serializer.native_serializer import serialize_g2, write_g2
+
+            self._serialize = serialize_g2
+            self._write = write_g2
+        self.templates = templates
+        self.jinja_args = jinja_args
+        self.filters = {**DEFAULT_FILTERS, **(filters or {})}
+        self.engine = engine
+        self.template = None
+        if engine == "jinja":
+            from newsmlg2.template_cache import get_template
+
+            self.template = get_template(
+                templates, jinja_args, self.filters, bytecode_cache
+            )
+        self.dw_converter = dw_converter(incremental_article)
+        self.decoder = decoder if callable(decoder) else get_json_decoder(decoder)
+        self.cache = cache
+        if cache is not None:
+            from newsmlg2.result_cache import config_fingerprint, result_cache_key
+
+            fingerprint = config_fingerprint(
+                engine, templates, jinja_args, self.filters
+            )
+            if fingerprint is None:
+                logger.warning(
+                    "The filters can not be fingerprinted, bypassing the result cache"
+                )
+                self.cache = None
+            else:
+                self._cache_key = partial(result_cache_key, config=fingerprint)
+
+    def convert(self, digitalwires: Union[dict, JsonInput]) -> str:
+        """Converts a single digitalwires message into a newsmlg2 message.
+
+        :param digitalwires: The parsed json representation of a digitalwires message,
+            or its raw JSON as bytes, bytearray, memoryview or string.
+        :return: The newsmlg2 message as a string.
+        """
+        digitalwires = self.decode(digitalwires)
+        key, g2 = self._lookup(digitalwires)
+        if g2 is not None:
+            return g2
+        entry = self.dw_converter.convert(DigitalwiresModel(digitalwires))
+        if self.template is None:
+            g2 = self._serialize(entry, self.filters["datetimeformat"])
+        else:
+            g2 = self.template.render(**entry)
+        if key is not None:
+            self.cache.put(key, g2)
+        return g2
+
+    def stream(
+        self, digitalwires: Union[dict, JsonInput], buffer_size: int = 64
+    ) -> Iterator[str]:
+        """Converts a single digitalwires message and yields the newsmlg2 message in
+        chunks while it is rendered.
+
+        :param digitalwires: The parsed json representation of a digitalwires message,
+            or its raw JSON.
+        The native engine writes the whole message before the first chunk is yielded,
+        use `convert_into` to write it with flat memory. The lxml engine yields the
+        whole message as a single chunk.
+        :param buffer_size: The number of rendered template parts joined into a chunk.
+        :return: An iterator of string chunks, joined they equal the result of
+            `convert`.
+        """
+        if self.engine == "lxml":
+            return iter((self.convert(digitalwires),))
+        digitalwires = self.decode(digitalwires)
+        g2 = self._lookup(digitalwires)[1]
+        if g2 is not None:
+            return iter((g2,))
+        entry = self.dw_converter.convert(DigitalwiresModel(digitalwires))
+        if self.engine == "native":
+            fragments = []
+            self._write(entry, fragments.append, self.filters["datetimeformat"])
+            size = max(buffer_size, 1)
+            return (
+                "".join(fragments[i : i + size]) for i in range(0, len(fragments), size)
+            )
+        stream = self.template.stream(**entry)
+        if buffer_size > 1:
+            stream.enable_buffering(buffer_size)
+        return stream
+
+    def convert_into(
+        self, digitalwires: Union[dict, JsonInput], fp: Any, encoding: str = "utf-8"
+    ):
+        """Converts a single digitalwires message and writes the newsmlg2 message to a
+        file or socket while it is rendered.
+
+        :param digitalwires: The parsed json representation of a digitalwires message,
+            or its raw JSON.
+        :param fp: A text file, a binary file or a socket. Binary files and sockets
+            receive the message encoded with `encoding`.
+        :param encoding: The encoding used for binary files and sockets.
+        """
+        write = _writer(fp, encoding)
+        if self.engine == "native":
+            digitalwires = self.decode(digitalwires)
+            g2 = self._lookup(digitalwires)[1]
+            if g2 is not None:
+                write(g2)
+                return
+            entry = self.dw_converter.convert(DigitalwiresModel(digitalwires))
+            buffer = []
+
+            def append(fragment):
+                buffer.append(fragment)
+                if len(buffer) >= 64:
+                    write("".join(buffer))
+                    buffer.clear()
+
+            self._write(entry, append, self.filters["datetimeformat"])
+            write("".join(buffer))
+            return
+        for chunk in self.stream(digitalwires):
+            write(chunk)
+
+    def convert_many(
+        self, digitalwires: Iterable[Union[dict, JsonInput]]
+    ) -> Iterator[ConversionResult]:
+        """Lazily converts many digitalwires messages.
+
+        A message failing to decode or convert does not abort the batch, instead its
+        result carries the raised exception.
+        :param digitalwires: An iterable of parsed digitalwires messages or their raw
+            JSON.
+        :return: An iterator of ConversionResult objects in input order.
+        """
+        for index, dw in enumerate(digitalwires):
+            urn = None
+            start = time.perf_counter()
+            try:
+                dw = self.decode(dw)
+                urn = dw.get("urn") if isinstance(dw, Mapping) else None
+                g2 = self.convert(dw)
+            except Exception as e:
+                logger.warning("Failed to convert entry %s (%s): %r", index, urn, e)
+                duration = time.perf_counter() - start
+                yield ConversionResult(index, urn, error=e, duration=duration)
+            else:
+                duration = time.perf_counter() - start
+                yield ConversionResult(index, urn, g2=g2, duration=duration)
+
+    def _lookup(self, digitalwires: Any) -> tuple[Union[str, None], Union[str, None]]:
+        # the cache key and the cached message, if there is a cache
+        if self.cache is None or not isinstance(digitalwires, Mapping):
+            return None, None
+        key = self._cache_key(digitalwires)
+        if key is None:
+            return None, None
+        return key, self.cache.get(key)
+
+    def decode(self, digitalwires: Union[dict, JsonInput]) -> dict:
+        """Decodes a message passed as raw JSON, parsed messages are returned as is.
+
+        A `str` is always taken as raw JSON, never as a path or a URN.
+        :param digitalwires: A parsed digitalwires message or its raw JSON.
+        :return: The parsed message.
+        """
+        if isinstance(digitalwires, (bytes, bytearray, memoryview, str)):
+            return self.decoder(digitalwires)
+        return digitalwires
+
+
 def convert_to_g2(
-    digitalwires: dict, templates: str = "./newsmlg2/templates", jinja_args: dict = None
+    digitalwires: Union[dict, JsonInput],
+    templates: str = "./newsmlg2/templates",
+    jinja_args: dict = None,
+    engine: str = "jinja",
+    cache: "ResultCache" = None,
 ) -> str:
     """This function takes the dict representation of a digitalwires message and creates
     a newmlg2 message.
 
     For more details on how a newsmlg2 message is structured, have a look here
     https://www.iptc.org/std/NewsML-G2/2.32/specification/NewsML-G2-2.32-specification.html
-    :param digitalwires: The parsed json representation of a digitalwires message.
+
+    The jinja environment and the compiled template are taken from a process-wide cache,
+    call `invalidate_template_cache` after templates have been changed on disk.
+    :param digitalwires: The parsed json representation of a digitalwires message, or
+        its raw JSON.
     :param templates: A path to a jinja templates folder conatining a file called
         `g2_tamplate.j2`.
     :param jinja_args: Optional arguments to pass to jinja2.Environment.
+    :param engine: Either ``"jinja"`` to render the template, ``"native"`` to write
+        the message of the bundled template without jinja or ``"lxml"`` to build it with
+        lxml.
+    :param cache: An optional `newsmlg2.result_cache.ResultCache`, consulted before
+        the message is converted.
     :return: a list of newsmlg2 messages for each service
     """
-    dw_model = DigitalwiresModel(digitalwires)
-    if jinja_args is None:
-        jinja_args = {
-            "lstrip_blocks": True,
-            "trim_blocks": True,
-            "keep_trailing_newline": False,
-            "autoescape": True,
-        }
-    env = Environment(
-        loader=FileSystemLoader(templates),
-        **jinja_args,
-    )
-    env.filters["datetimeformat"] = datetime_format
-
-    entry = DwToG2Converter().convert(dw_model)
-    g2 = env.get_template("g2_template.j2").render(**entry)
-    return g2
+    converter = G2Converter(templates, jinja_args, engine=engine, cache=cache)
+    return converter.convert(digitalwires)
+
+
+def convert_to_g2_stream(
+    digitalwires: Union[dict, JsonInput],
+    templates: str = "./newsmlg2/templates",
+    jinja_args: dict = None,
+) -> Iterator[str]:
+    """Like `convert_to_g2`, but yields the newsmlg2 message in chunks while it is
+    rendered instead of building the whole message in memory.
+
+    :param digitalwires: The parsed json representation of a digitalwires message, or
+        its raw JSON.
+    :param templates: A path to a jinja templates folder conatining a file called
+        `g2_tamplate.j2`.
+    :param jinja_args: Optional arguments to pass to jinja2.Environment.
+    :return: An iterator of string chunks of the newsmlg2 message.
+    """
+    return G2Converter(templates, jinja_args).stream(digitalwires)
+
+
+def convert_to_g2_into(
+    digitalwires: Union[dict, JsonInput],
+    fp: Any,
+    templates: str = "./newsmlg2/templates",
+    jinja_args: dict = None,
+):
+    """Like `convert_to_g2`, but writes the newsmlg2 message to a file or socket while
+    it is rendered.
+
+    :param digitalwires: The parsed json representation of a digitalwires message, or
+        its raw JSON.
+    :param fp: A text file, a binary file or a socket. Binary files and sockets receive
+        the message encoded as UTF-8.
+    :param templates: A path to a jinja templates folder conatining a file called
+        `g2_tamplate.j2`.
+    :param jinja_args: Optional arguments to pass to jinja2.Environment.
+    """
+    G2Converter(templates, jinja_args).convert_into(digitalwires, fp)
+
+
+def _writer(fp: Any, encoding: str) -> Callable[[str], Any]:
+    if not hasattr(fp, "write") and hasattr(fp, "sendall"):
+        return lambda chunk: fp.sendall(chunk.encode(encoding))
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(
+        fp, "mode", ""
+    ):
+        return lambda chunk: fp.write(chunk.encode(encoding))
+    return fp.write
@@ -16,7 +16,7 @@
 # limitations under the License.
 
 from newsmlg2 import DigitalwiresModel
-from newsmlg2.utils import POI, Category, get_none_safe
+from newsmlg2.utils import POI, Category
 
 
 def get_services(dw_model: DigitalwiresModel) -> list[Category]:
@@ -258,6 +258,5 @@ def get_poi(dw_model: DigitalwiresModel) -> list[POI]:
             .get("geometry", {})
             .get("coordinates", [None, None])[1],
         )
-        for cat in get_none_safe(dw_model, "categories", [])
-        if cat.get("type", "") == "dnltype:poi"
+        for cat in dw_model.categories_by_type.get("dnltype:poi", [])
     ]
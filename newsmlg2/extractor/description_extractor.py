@@ -16,7 +16,8 @@
 #  limitations under the License.
 
 from newsmlg2 import DigitalwiresModel
-from newsmlg2.utils.objects import Description
+from newsmlg2.utils import get_none_safe, get_rank
+from newsmlg2.utils.objects import Description, object_factory
 
 
 def get_descriptions(dw_model: DigitalwiresModel) -> list[Description]:
@@ -25,8 +26,8 @@ def get_descriptions(dw_model: DigitalwiresModel) -> list[Description]:
     :param dw_model: A model of the digitalwires message.
     :return: A list of Description objects with role and description.
     """
-    attrs = ["role", "description"]
+    create = object_factory(Description, ("role", "description"))
     return [
-        Description(**dict(zip(attrs, descr)))
-        for descr in dw_model.get_sorted_list(attrs, "descriptions", None)
+        create(descr)
+        for descr in sorted(get_none_safe(dw_model, "descriptions", []), key=get_rank)
     ]
@@ -14,7 +14,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import xml.etree.ElementTree as ETree
 
 from newsmlg2 import DigitalwiresModel
 from newsmlg2.utils import Link
@@ -145,10 +144,9 @@ def get_linkbox(dw_model: DigitalwiresModel) -> list[Link]:
     :param dw_model: A model of the digitalwires message.
     :return: A list of link from the linkbox. Never ``None``.
     """
-    linkbox = dw_model.get("linkbox_html")
-    if not linkbox:
+    if not dw_model.has_linkbox:
         return []
-    section = ETree.fromstring(linkbox)
+    section = dw_model.parse_fragment(dw_model.get("linkbox_html"))
 
     links = sorted(
         [
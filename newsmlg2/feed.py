@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import codecs
+import io
+import json
+import re
+from collections import namedtuple
+from typing import IO, Any, Iterator, Union
+
+from newsmlg2 import utils
+from newsmlg2.digitalwires_to_newsmlg2 import G2Converter
+
+FeedEntry = namedtuple(
+    "FeedEntry", ["entry_id", "urn", "version", "g2", "error"], defaults=[None]
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_DELIMITERS = frozenset(" \t\n\r,}]")
+
+
+def convert_feed_page(
+    page: Union[bytes, bytearray, memoryview, str, IO],
+    converter: G2Converter = None,
+    prefetch: int = 8,
+    chunk_size: int = 65536,
+) -> Iterator[FeedEntry]:
+    """Converts the entries of a digitalwires feed page while the page is decoded.
+
+    The entries are decoded one at a time from the `entries` array of the page, on a
+    background thread which keeps up to `prefetch` entries ahead of the conversion.
+    A failing entry does not abort the page, like in `G2Converter.convert_many` it is
+    logged, its `g2` is ``None`` and its `error` the raised exception.
+    :param page: The raw page as bytes, a string or a text or binary file object.
+    :param converter: The converter to use, defaults to a `G2Converter` with the
+        bundled template.
+    :param prefetch: The number of entries decoded ahead, ``0`` decodes them on the
+        calling thread.
+    :param chunk_size: The number of bytes or characters read from a file at once.
+    :return: An iterator of `(entry_id, urn, version, g2, error)` named tuples in page
+        order.
+    """
+    if converter is None:
+        converter = G2Converter()
+    entries = iter_feed_entries(page, chunk_size)
+    if prefetch > 0:
+        entries = utils.prefetch(entries, prefetch, "feed-prefetch")
+    # the entry ids and versions of the entries taken by the converter, by the index
+    # of their result
+    meta = {}
+
+    def digitalwires():
+        for index, entry in enumerate(entries):
+            meta[index] = (_get(entry, "entry_id"), _get(entry, "version"))
+            yield entry
+
+    for result in converter.convert_many(digitalwires()):
+        entry_id, version = meta.pop(result.index)
+        yield FeedEntry(entry_id, result.urn, version, result.g2, result.error)
+
+
+def iter_feed_entries(
+    page: Union[bytes, bytearray, memoryview, str, IO], chunk_size: int = 65536
+) -> Iterator[dict]:
+    """Lazily decodes the entries of a digitalwires feed page.
+
+    Only the top level of the page is scanned, every entry of its `entries` array is
+    decoded on its own and the other keys are skipped, so at most one entry and the
+    chunk being read are kept in memory.
+    :param page: The raw page as bytes, a string or a text or binary file object.
+    :param chunk_size: The number of bytes or characters read from a file at once.
+    :return: An iterator of the entries as dicts. A malformed page raises a ValueError.
+    """
+    if isinstance(page, (bytes, bytearray, memoryview)):
+        page = io.BytesIO(page)
+    elif isinstance(page, str):
+        page = io.StringIO(page)
+    reader = _PageReader(page, chunk_size)
+    reader.expect("{")
+    if reader.skip("}"):
+        return
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected a key at position {reader.offset}")
+        reader.expect(":")
+        if key == "entries":
+            yield from _iter_array(reader)
+        else:
+            reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+def _iter_array(reader: "_PageReader") -> Iterator[Any]:
+    reader.expect("[")
+    if reader.skip("]"):
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def _get(entry: Any, key: str) -> Any:
+    return entry.get(key) if isinstance(entry, dict) else None
+
+
+class _PageReader(object):
+    """Reads JSON values one at a time from a file, keeping only unread text."""
+
+    def __init__(self, fp: IO, chunk_size: int):
+        self._read = fp.read
+        self._chunk_size = chunk_size
+        self._decode = None
+        self._buffer = ""
+        self._pos = 0
+        self._consumed = 0
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        return self._consumed + self._pos
+
+    def value(self) -> Any:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise ValueError(f"Invalid JSON at position {self.offset}") from e
+                self._fill()
+                continue
+            # a number cut by the end of the buffer, i.e. after "2." or "2.5e", may
+            # continue in the next chunk unless a delimiter follows it
+            if (
+                not self._eof
+                and isinstance(value, (int, float))
+                and self._buffer[end : end + 1] not in _DELIMITERS
+            ):
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def expect(self, chars: str) -> str:
+        self._skip_whitespace()
+        char = self._buffer[self._pos : self._pos + 1]
+        if not char or char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r} at position {self.offset}, got {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    def skip(self, char: str) -> bool:
+        self._skip_whitespace()
+        if self._buffer.startswith(char, self._pos):
+            self._pos += 1
+            return True
+        return False
+
+    def _skip_whitespace(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._fill()
+
+    def _fill(self):
+        # reads at least as much as is buffered, so a large value is decoded in a
+        # logarithmic number of attempts
+        chunk = self._read(max(self._chunk_size, len(self._buffer) - self._pos))
+        self._eof = not chunk
+        if isinstance(chunk, (bytes, bytearray)):
+            if self._decode is None:
+                self._decode = codecs.getincrementaldecoder("utf-8-sig")().decode
+            chunk = self._decode(chunk, self._eof)
+        self._consumed += self._pos
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
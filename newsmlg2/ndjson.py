@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import logging
+import os
+import time
+from collections import namedtuple
+from dataclasses import replace
+from typing import IO, Any, Callable, Iterator, Union
+
+from newsmlg2 import utils
+from newsmlg2.digitalwires_to_newsmlg2 import ConversionResult, G2Converter
+
+logger = logging.getLogger(__name__)
+
+NdjsonStats = namedtuple("NdjsonStats", ["converted", "failed", "elapsed"])
+
+
+def iter_ndjson(
+    source: Union[str, os.PathLike, IO], prefetch: int = 0
+) -> Iterator[dict]:
+    """Lazily reads and decodes the digitalwires messages of an NDJSON file.
+
+    Only one line is read at a time, blank lines are skipped.
+    :param source: A path or a text or binary file object with one message per line.
+    :param prefetch: If greater than 0, the lines are read and decoded on a background
+        thread, which keeps up to `prefetch` decoded messages ahead of the consumer.
+    :return: An iterator of the decoded messages. A line that is no valid JSON raises a
+        ValueError naming the line number.
+    """
+    lines = _read_lines(source, prefetch)
+    try:
+        for number, digitalwires, error in lines:
+            if error is not None:
+                raise error
+            yield digitalwires
+    finally:
+        lines.close()
+
+
+def convert_ndjson(
+    source: Union[str, os.PathLike, IO],
+    sink: Callable[[ConversionResult], Any],
+    converter: G2Converter = None,
+    prefetch: int = 0,
+) -> NdjsonStats:
+    """Converts the digitalwires messages of an NDJSON file one at a time.
+
+    Every result is passed to `sink` before the next message is read, so the memory
+    used does not depend on the size of the file. Like `G2Converter.convert_many`, a
+    message failing to decode or convert does not abort the file, its result carries
+    the exception. The `index` of a result is the line number of the message.
+    :param source: A path or a text or binary file object with one message per line.
+    :param sink: A function called with the ConversionResult of every message, i.e.
+        writing `result.g2` to a file.
+    :param converter: The converter to use, defaults to a `G2Converter` with the
+        bundled template.
+    :param prefetch: The number of messages read and decoded ahead on a background
+        thread while the current message is converted, see `iter_ndjson`.
+    :return: A named tuple of the number of converted and failed messages and the
+        elapsed seconds.
+    """
+    if converter is None:
+        converter = G2Converter()
+    start = time.perf_counter()
+    converted = failed = 0
+    lines = _read_lines(source, prefetch)
+    try:
+        for number, digitalwires, error in lines:
+            if error is None:
+                result = next(converter.convert_many([digitalwires]))
+                result = replace(result, index=number)
+            else:
+                logger.warning("Failed to convert line %s: %r", number, error)
+                result = ConversionResult(number, error=error)
+            if result.ok:
+                converted += 1
+            else:
+                failed += 1
+            sink(result)
+    finally:
+        lines.close()
+    return NdjsonStats(converted, failed, time.perf_counter() - start)
+
+
+def _read_lines(
+    source: Union[str, os.PathLike, IO], prefetch: int
+) -> Iterator[tuple[int, Any, Union[ValueError, None]]]:
+    if prefetch > 0:
+        return utils.prefetch(_decode_lines(source), prefetch, "ndjson-prefetch")
+    return _decode_lines(source)
+
+
+def _decode_lines(
+    source: Union[str, os.PathLike, IO],
+) -> Iterator[tuple[int, Any, Union[ValueError, None]]]:
+    # the line number and the message or the error decoding it, so a malformed line
+    # does not stop the lines after it
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from _decode_lines(f)
+        return
+    decode = utils.get_json_decoder()
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            digitalwires = decode(line)
+        except ValueError as e:
+            error = ValueError(f"line {number} is no valid JSON: {e}")
+            error.__cause__ = e
+            yield number, None, error
+        else:
+            yield number, digitalwires, None
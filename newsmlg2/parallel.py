@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import replace
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from newsmlg2.digitalwires_to_newsmlg2 import ConversionResult, G2Converter
+
+# the converter of a worker process, created once by `_init_worker`
+_converter = None
+
+
+def convert_parallel(
+    digitalwires: Iterable[dict],
+    workers: int = None,
+    chunksize: int = 16,
+    ordered: bool = True,
+    templates: str = "./newsmlg2/templates",
+    jinja_args: dict = None,
+    filters: dict[str, Callable] = None,
+    engine: str = "jinja",
+) -> Iterator[ConversionResult]:
+    """Converts many digitalwires messages in a pool of worker processes.
+
+    Every worker creates one `G2Converter` when it starts, so the template is loaded and
+    compiled once per worker and not once per message. The messages are sent to the
+    workers in chunks of `chunksize`, and at most two chunks per worker are in flight,
+    so `digitalwires` is consumed lazily and may be larger than the available memory.
+    Like `G2Converter.convert_many`, a message failing to convert does not abort the
+    batch, its result carries the exception.
+    :param digitalwires: An iterable of parsed digitalwires messages.
+    :param workers: The number of worker processes, defaults to the number of CPUs.
+    :param chunksize: The number of messages sent to a worker at once.
+    :param ordered: If ``True`` the results are yielded in input order, otherwise as
+        soon as their chunk is converted.
+    :param templates: A path to a jinja templates folder conatining a file called
+        `g2_tamplate.j2`.
+    :param jinja_args: Optional arguments to pass to jinja2.Environment.
+    :param filters: Optional jinja filters, they have to be picklable, i.e. module level
+        functions.
+    :param engine: The engine of the converters, see `G2Converter`.
+    :return: An iterator of ConversionResult objects, their `index` is the position of
+        the message in `digitalwires`.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(digitalwires, chunksize)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(templates, jinja_args, filters, engine),
+    )
+    try:
+        pending = deque(
+            executor.submit(_convert_chunk, start, chunk)
+            for start, chunk in islice(chunks, 2 * workers)
+        )
+        while pending:
+            if ordered:
+                done = pending.popleft()
+            else:
+                done = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                pending.remove(done)
+            for start, chunk in islice(chunks, 1):
+                pending.append(executor.submit(_convert_chunk, start, chunk))
+            yield from done.result()
+    finally:
+        # chunks not started yet are dropped if the results are not consumed to the end
+        executor.shutdown(cancel_futures=True)
+
+
+def _chunks(digitalwires: Iterable[dict], chunksize: int) -> Iterator[tuple]:
+    iterator = iter(digitalwires)
+    start = 0
+    while chunk := list(islice(iterator, chunksize)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _init_worker(
+    templates: str, jinja_args: dict, filters: dict[str, Callable], engine: str
+):
+    global _converter
+    _converter = G2Converter(templates, jinja_args, filters, engine=engine)
+
+
+def _convert_chunk(start: int, chunk: list[dict]) -> list[ConversionResult]:
+    return [
+        replace(result, index=start + result.index, error=_picklable(result.error))
+        for result in _converter.convert_many(chunk)
+    ]
+
+
+def _picklable(error: Exception) -> Exception:
+    # an exception which cannot be sent back would fail the whole chunk
+    if error is None:
+        return None
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(repr(error))
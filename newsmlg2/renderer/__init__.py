@@ -20,6 +20,7 @@ from .render_content import (
     render_slugline,
     render_article,
     render_infobox,
+    dateline_cache_info,
 )
 from .render_content_meta import (
     render_content_created,
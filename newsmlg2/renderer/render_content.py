@@ -14,12 +14,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import copy
 import re
 import xml.etree.ElementTree as ETree
-from typing import Callable, AnyStr, Union
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, AnyStr, Iterator, Union
 
 from newsmlg2 import DigitalwiresModel
-from newsmlg2.utils import Category, Link, element_to_string
+from newsmlg2.utils import Category, Link, element_to_string, split_children
+
+_DATELINE = re.compile(
+    r"^(?P<located>.+)(?P<credit>\(.+\))\s*[-\u2010\u2011\u2012\u2013\u2014\u2015\uFE58\uFE63\uFF0D]\s*"
+)
+_DATELINE_SPAN = re.compile(r'<span(?: [^>]*)? class="dateline"[ />]')
 
 
 def render_slugline(
@@ -70,7 +78,7 @@ def render_infobox(
     if infobox is None:
         return None
 
-    section = ETree.fromstring(infobox)
+    section = _parse(dw_model, infobox)
 
     div = ETree.Element("div", attrib={"class": "INFOBOX"})
     for child in section:
@@ -83,7 +91,8 @@ def render_article(
     dw_model: DigitalwiresModel,
     extract_dateline: Callable[[DigitalwiresModel], str],
     extract_article: Callable[[DigitalwiresModel], str],
-) -> Union[list[str], None]:
+    incremental: bool = False,
+) -> Union[list[str], "IncrementalArticle", None]:
     """Renders the main section of a newsmlg2 article.
 
     :param dw_model: A model of the digitalwires message.
@@ -91,39 +100,129 @@ def render_article(
         returns the dateline as a string.
     :param extract_article: An extractor function, which takes a context object and
         returns the article as a string.
+    :param incremental: If ``True`` and the article has no dateline yet, the article
+        is parsed while the paragraphs are consumed, so only one paragraph is kept as
+        a tree at a time. Parse errors are then raised while iterating.
     :return: A list of the child elements from the article as strings or None if there
         is no article. If there is a dateline from `extract_dateline` and there is no
         dateline in the article, the dateline is inserted into the first element of the
+        list. In incremental mode an `IncrementalArticle` is returned instead of the
         list.
     """
     article = extract_article(dw_model)
     dateline = extract_dateline(dw_model)
     if article is None:
         return None
+    if incremental and "dateline" not in article:
+        return IncrementalArticle(_iter_children(article, dateline))
+
+    # markup serialized like ElementTree would serialize it is passed through as is,
+    # unless a dateline has to be inserted
+    children = split_children(article)
+    if children is not None and (
+        dateline is None
+        or not children
+        or _DATELINE_SPAN.search(article, article.index(">"))
+        or _extract_parts(dateline) is None
+    ):
+        return children
 
-    section = ETree.fromstring(article)
+    section = _parse(dw_model, article)
 
     if dateline is not None and _has_no_dateline(section):
+        # the parsed fragment is shared, insert_dateline only replaces a child
+        section = copy.copy(section)
         insert_dateline(dateline, section)
     return [element_to_string(p) for p in section]
 
 
-def insert_dateline(dateline, section):
+class IncrementalArticle(object):
+    """The lazily rendered child elements of an article.
+
+    It can be iterated once, like a generator, but unlike a generator it is only true
+    if the article has at least one child element.
+    """
+
+    def __init__(self, children: Iterator[str]):
+        self._children = children
+        self._peeked = []
+
+    def __bool__(self) -> bool:
+        if not self._peeked:
+            self._peeked.extend(islice(self._children, 1))
+        return bool(self._peeked)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._peeked:
+            yield self._peeked.pop()
+        yield from self._children
+
+
+def _iter_children(
+    article: str, dateline: Union[str, None], chunk_size: int = 65536
+) -> Iterator[str]:
+    section = None
+    complete = None
+    first = True
+    depth = 0
+    for event, element in _pull_events(article, chunk_size):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                section = element
+                continue
+            if depth > 2 or complete is None:
+                continue
+        else:
+            depth -= 1
+            if depth == 1:
+                # the tail of a child is only known once the next child starts
+                complete = element
+                continue
+            if depth > 1 or complete is None:
+                continue
+        if first and dateline is not None:
+            paragraph = ETree.Element("section")
+            paragraph.append(complete)
+            insert_dateline(dateline, paragraph)
+            complete = paragraph[0]
+        first = False
+        section.remove(section[0])
+        yield element_to_string(complete)
+        complete = None
+
+
+def _pull_events(article: str, chunk_size: int) -> Iterator[tuple[str, ETree.Element]]:
+    parser = ETree.XMLPullParser(events=("start", "end"))
+    for offset in range(0, len(article), chunk_size):
+        parser.feed(article[offset : offset + chunk_size])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def insert_dateline(dateline, section, namespace: str = None):
     if len(section) <= 0:
         return
 
-    dateline_ele = ETree.Element("span", attrib={"class": "dateline"})
+    def element(tag, attrib):
+        # created by the section, so it also works for lxml trees
+        return section.makeelement(
+            f"{{{namespace}}}{tag}" if namespace else tag, attrib
+        )
+
+    dateline_ele = element("span", {"class": "dateline"})
     parts = _extract_parts(dateline)
     if parts is None:
         return
 
     dateline_ele.text, credit = parts
-    credit_elem = ETree.Element("span", attrib={"class": "credit"})
+    credit_elem = element("span", {"class": "credit"})
     credit_elem.text = credit
     credit_elem.tail = " - "
     dateline_ele.append(credit_elem)
     dateline_ele.tail = section[0].text
-    new_p = ETree.Element("p")
+    new_p = element("p", {})
     new_p.append(dateline_ele)
     section[0] = new_p
 
@@ -153,15 +252,29 @@ def render_remote_content(
     ]
 
 
+def _parse(dw_model: DigitalwiresModel, html: str) -> ETree.Element:
+    if dw_model is None:
+        return ETree.fromstring(html)
+    return dw_model.parse_fragment(html)
+
+
 def _has_no_dateline(section):
     return section.find(".//span[@class = 'dateline']") is None
 
 
+@lru_cache(maxsize=1024)
 def _extract_parts(dateline: str) -> Union[tuple[AnyStr, AnyStr], None]:
-    regex = re.compile(
-        r"^(?P<located>.+)(?P<credit>\(.+\))\s*[-\u2010\u2011\u2012\u2013\u2014\u2015\uFE58\uFE63\uFF0D]\s*"
-    )
-    parsed_dateline = re.match(regex, dateline)
+    parsed_dateline = _DATELINE.match(dateline)
     if parsed_dateline is None:
         return None
     return parsed_dateline.group("located"), parsed_dateline.group("credit")
+
+
+def dateline_cache_info():
+    """Returns the statistics of the cache of parsed datelines.
+
+    Datelines like "Berlin (dpa) - " repeat constantly, so their parts are cached in a
+    bounded LRU cache.
+    :return: A named tuple of hits, misses, maxsize and currsize.
+    """
+    return _extract_parts.cache_info()
@@ -27,7 +27,7 @@ def render_item_class(dw_model: DigitalwiresModel) -> dict[str, str]:
     :return: A dictionary with the item class name.
     """
     return {
-        "qcode": dw_model.get_item_class(),
+        "qcode": dw_model.item_class,
     }
 
 
@@ -116,7 +116,7 @@ def render_links(
     :param extractors: A list of functions that extract link objects.
     :return: A list of dictionaries containing link information.
     """
-    if not dw_model.is_text_message():
+    if not dw_model.is_text:
         return []
     links = [a for extractor in extractors for a in extractor(dw_model)]
     return [
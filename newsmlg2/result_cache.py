@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import hashlib
+import importlib.metadata
+import os
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Callable, Union
+
+ResultCacheInfo = namedtuple(
+    "ResultCacheInfo", ["hits", "misses", "evictions", "currsize", "maxsize"]
+)
+
+
+def result_cache_key(digitalwires: Mapping, config: str = "") -> Union[str, None]:
+    """Returns the cache key of a digitalwires message.
+
+    A message is identified by its `urn` and `version`, or if one of them is missing,
+    by its `entry_id` and `updated` timestamp.
+    :param digitalwires: A parsed digitalwires message.
+    :param config: The fingerprint of the converter configuration, see
+        `config_fingerprint`.
+    :return: The key, or None if the message can not be identified.
+    """
+    urn, version = digitalwires.get("urn"), digitalwires.get("version")
+    if urn is not None and version is not None:
+        return f"{config}|urn|{urn}|{version}"
+    entry_id, updated = digitalwires.get("entry_id"), digitalwires.get("updated")
+    if entry_id is not None and updated is not None:
+        return f"{config}|entry|{entry_id}|{updated}"
+    return None
+
+
+def config_fingerprint(
+    engine: str,
+    templates: str,
+    jinja_args: Union[dict, None],
+    filters: Union[dict[str, Callable], None],
+) -> Union[str, None]:
+    """Returns a short fingerprint of everything that changes the rendered message.
+
+    Besides the converter arguments the fingerprint covers the installed version of
+    this package and, for the jinja engine, the contents of the templates. These are
+    hashed once and kept in the process-wide template cache, call
+    `invalidate_template_cache` after templates have been changed on disk.
+    :param engine: The engine of the converter.
+    :param templates: The templates folder of the converter.
+    :param jinja_args: The jinja arguments of the converter.
+    :param filters: The filters of the converter, identified by their qualified names.
+    :return: A hex digest, or None if a filter is not a function defined at the top
+        level of a module. Closures, lambdas or partials can not be told apart by
+        name, so the messages they render must not be cached.
+    """
+    filter_names = {}
+    for name, f in (filters or {}).items():
+        if not _is_module_function(f):
+            return None
+        filter_names[name] = f"{f.__module__}.{f.__qualname__}"
+    digest = None
+    if engine == "jinja":
+        from newsmlg2.template_cache import template_cache
+
+        digest = template_cache.source_digest(templates)
+    return _fingerprint(
+        _PACKAGE_VERSION,
+        engine,
+        os.path.abspath(templates) if engine == "jinja" else None,
+        digest,
+        repr(sorted((jinja_args or {}).items(), key=lambda item: item[0])),
+        tuple(sorted(filter_names.items())),
+    )
+
+
+@lru_cache(maxsize=256)
+def _fingerprint(
+    version: str,
+    engine: str,
+    templates: Union[str, None],
+    digest: Union[str, None],
+    jinja_args: str,
+    filter_names: tuple,
+) -> str:
+    config = (version, engine, templates, digest, jinja_args, filter_names)
+    return hashlib.sha1(repr(config).encode("utf-8")).hexdigest()[:16]
+
+
+def _is_module_function(f: Callable) -> bool:
+    module = sys.modules.get(getattr(f, "__module__", None))
+    qualname = getattr(f, "__qualname__", "")
+    return module is not None and getattr(module, qualname, None) is f
+
+
+def _package_version() -> str:
+    try:
+        return importlib.metadata.version("digitalwirestonewsmlg2")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+_PACKAGE_VERSION = _package_version()
+
+
+class ResultCache(ABC):
+    """The interface of the caches of converted newsmlg2 messages."""
+
+    @abstractmethod
+    def get(self, key: str) -> Union[str, None]:
+        """Returns the cached message for `key`, or None on a miss."""
+
+    @abstractmethod
+    def put(self, key: str, g2: str) -> None:
+        """Caches the message `g2` under `key`."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drops every cached message. Statistics are kept."""
+
+    @abstractmethod
+    def cache_info(self) -> ResultCacheInfo:
+        """Returns the hit, miss and eviction statistics and the cached bytes."""
+
+
+class MemoryResultCache(ResultCache):
+    """An in-memory LRU cache of converted messages, bounded by their size in bytes.
+
+    The size of a message is the memory of its string object. Once the cached messages
+    exceed `max_bytes`, the least recently used ones are evicted.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Union[str, None]:
+        with self._lock:
+            g2 = self._entries.get(key)
+            if g2 is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return g2
+
+    def put(self, key: str, g2: str) -> None:
+        size = sys.getsizeof(g2)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= sys.getsizeof(previous)
+            self._entries[key] = g2
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= sys.getsizeof(evicted)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def cache_info(self) -> ResultCacheInfo:
+        with self._lock:
+            return ResultCacheInfo(
+                self._hits, self._misses, self._evictions, self._size, self.max_bytes
+            )
+
+
+class SQLiteResultCache(ResultCache):
+    """An on-disk cache of converted messages in a SQLite database.
+
+    The database can be shared by processes and survives restarts. If `max_bytes` is
+    given, the least recently used messages are evicted once the UTF-8 encoded
+    messages exceed it. Hits, misses and evictions are counted per instance.
+    """
+
+    def __init__(self, path: str, max_bytes: int = None):
+        """
+        :param path: The path of the database file, created if it does not exist.
+        :param max_bytes: The maximum size of the cached messages, unbounded if
+            ``None``.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, "
+                "g2 BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+            )
+
+    def get(self, key: str) -> Union[str, None]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT g2 FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            if self.max_bytes is not None:
+                with self._db:
+                    self._db.execute(
+                        "UPDATE results SET accessed = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+            return row[0].decode("utf-8")
+
+    def put(self, key: str, g2: str) -> None:
+        data = g2.encode("utf-8")
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            if self.max_bytes is not None:
+                self._evict()
+
+    def _evict(self):
+        excess = self._size() - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM results ORDER BY accessed"
+        ):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM results WHERE key = ?", evicted)
+        self._evictions += len(evicted)
+
+    def _size(self) -> int:
+        return self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM results")
+
+    def cache_info(self) -> ResultCacheInfo:
+        with self._lock:
+            return ResultCacheInfo(
+                self._hits, self._misses, self._evictions, self._size(), self.max_bytes
+            )
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .lxml_serializer import (
+        HAS_LXML,
+        LxmlDwToG2Converter,
+        build_g2_tree,
+        serialize_g2_tree,
+    )
+    from .native_serializer import serialize_g2, write_g2
+
+# the serializers are imported on first access, so the native one doesn't load lxml
+_LAZY_ATTRIBUTES = {
+    "serialize_g2": ".native_serializer",
+    "write_g2": ".native_serializer",
+    "HAS_LXML": ".lxml_serializer",
+    "LxmlDwToG2Converter": ".lxml_serializer",
+    "build_g2_tree": ".lxml_serializer",
+    "serialize_g2_tree": ".lxml_serializer",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
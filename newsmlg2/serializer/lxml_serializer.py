@@ -0,0 +1,439 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""A serializer building the newsmlg2 message of the bundled `g2_template.j2` as an
+lxml tree.
+
+The message contains the same elements, attributes and texts as the rendered template,
+but is pretty printed by lxml, so whitespace between elements differs. lxml is an
+optional dependency, `HAS_LXML` tells whether it is installed.
+"""
+
+from typing import Any, Callable, Union
+
+from newsmlg2.builder import DwToG2Converter
+from newsmlg2.digitalwires_model import DigitalwiresModel
+from newsmlg2.renderer.render_content import insert_dateline
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover
+    etree = None
+
+HAS_LXML = etree is not None
+
+G2_NS = "http://iptc.org/std/nar/2006-10-01/"
+XHTML_NS = "http://www.w3.org/1999/xhtml"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+_DATELINE_PATH = f".//{{{XHTML_NS}}}span[@class='dateline']"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+# like jinja, `None` is rendered as "None", so a missing text needs its own marker
+_NO_TEXT = object()
+
+
+class LxmlDwToG2Converter(DwToG2Converter):
+    """Creates the context for the lxml serializer.
+
+    The context equals the one of `DwToG2Converter`, except for the article and the
+    infobox. Their markup is parsed from the message straight into lxml elements,
+    instead of being rendered into strings which lxml would have to parse again.
+    """
+
+    fields = [
+        (
+            ("infobox", "render_infobox", *extractors)
+            if field == "infobox"
+            else (field, render, *extractors)
+        )
+        for field, render, *extractors in DwToG2Converter.fields
+    ]
+
+    def render_article(
+        self,
+        dw_model: DigitalwiresModel,
+        extract_dateline: Callable[[DigitalwiresModel], str],
+        extract_article: Callable[[DigitalwiresModel], str],
+    ) -> Union[list["etree._Element"], None]:
+        article = extract_article(dw_model) if dw_model.is_text else None
+        if article is None:
+            return None
+        section = _parse_html(article)
+        dateline = extract_dateline(dw_model)
+        if dateline is not None and section.find(_DATELINE_PATH) is None:
+            insert_dateline(dateline, section, XHTML_NS)
+        return list(section)
+
+    def render_infobox(
+        self,
+        dw_model: DigitalwiresModel,
+        extract_infobox: Callable[[DigitalwiresModel], str],
+    ) -> Union["etree._Element", None]:
+        infobox = extract_infobox(dw_model)
+        if infobox is None:
+            return None
+        div = etree.Element(_xhtml("div"), {"class": "INFOBOX"})
+        div.extend(_parse_html(infobox))
+        return div
+
+
+def serialize_g2_tree(entry: dict[str, Any], datetime_format: Callable) -> str:
+    """Serializes the context created by `LxmlDwToG2Converter.convert` into a newsmlg2
+    message using lxml.
+
+    :param entry: The context created by `LxmlDwToG2Converter.convert`.
+    :param datetime_format: The function used as `datetimeformat` filter.
+    :return: The newsmlg2 message as a string.
+    """
+    root = build_g2_tree(entry, datetime_format)
+    return _XML_DECLARATION + etree.tostring(
+        root, encoding="unicode", pretty_print=True
+    )
+
+
+def build_g2_tree(entry: dict[str, Any], datetime_format: Callable) -> "etree._Element":
+    """Builds the newsMessage element for the context created by
+    `LxmlDwToG2Converter.convert`.
+
+    The elements of the article and the infobox are moved into the tree, so a context
+    can only be built once.
+    :param entry: The context created by `LxmlDwToG2Converter.convert`.
+    :param datetime_format: The function used as `datetimeformat` filter.
+    :return: The newsMessage element.
+    """
+    if not HAS_LXML:
+        raise ImportError("lxml is required to build newsmlg2 trees")
+    get = entry.get
+
+    root = etree.Element(_g2("newsMessage"), nsmap={None: G2_NS})
+    item = _sub(
+        _sub(root, "itemSet"),
+        "newsItem",
+        conformance="power",
+        guid=_str(get("urn", "")),
+        standard="NewsML-G2",
+        standardversion="2.32",
+        version=_str(get("version", "")),
+    )
+    item.set(XML_LANG, _str(get("language", "")))
+    _sub(
+        item,
+        "catalogRef",
+        href="http://www.iptc.org/std/catalog/catalog.IPTC-G2-Standards_32.xml",
+    )
+
+    # rightsInfo
+    rights_info = _sub(item, "rightsInfo")
+    if get("copyright_notice"):
+        _sub(rights_info, "copyrightNotice", text=get("copyright_notice"))
+    for usageterm in get("usageterms", ()):
+        _sub(rights_info, "usageTerms", text=usageterm)
+
+    # itemMeta
+    item_meta = _sub(item, "itemMeta")
+    _sub(item_meta, "itemClass", qcode=_str(_attr(get("item_class"), "qcode")))
+    provider = get("provider")
+    _named(
+        item_meta, "provider", _attr(provider, "name"), qcode=_attr(provider, "qcode")
+    )
+    _sub(item_meta, "versionCreated", text=get("version_created", ""))
+    if get("embargoed"):
+        _sub(item_meta, "embargoed", text=get("embargoed"))
+    pubstatus = get("pubstatus")
+    if _attr(pubstatus, "qcode"):
+        _named(
+            item_meta,
+            "pubStatus",
+            _attr(pubstatus, "name"),
+            qcode=_attr(pubstatus, "qcode"),
+        )
+    generator = get("generator")
+    _sub(
+        item_meta,
+        "generator",
+        text=_attr(generator, "name"),
+        versioninfo=_str(_attr(generator, "version")),
+    )
+    _sub(item_meta, "profile", text="dpa-G2-from-digitalwires", versioninfo="0.9")
+    for service in get("services", ()):
+        service_ele = _sub(item_meta, "service", qcode=_str(_attr(service, "qcode")))
+        if _attr(service, "name"):
+            _sub(service_ele, "name", text=_attr(service, "name"))
+    if get("title"):
+        _sub(item_meta, "title", text=get("title"))
+    for ednote in get("ednotes", ()):
+        ednote_ele = _sub(item_meta, "edNote", text=_attr(ednote, "text"))
+        _set_if(ednote_ele, "role", _attr(ednote, "role"))
+        _set_if(ednote_ele, "pubconstraint", _attr(ednote, "constraint"))
+    notepad = get("notepad")
+    if notepad:
+        section = etree.SubElement(
+            _sub(item_meta, "edNote", role="dpaednoterole:notepad"),
+            _xhtml("section"),
+            {"class": "notepad"},
+            nsmap={None: XHTML_NS},
+        )
+        for part in ("header", "public", "non_public"):
+            if _attr(notepad, part):
+                _append_html(section, _str(_attr(notepad, part)))
+        if _attr(notepad, "closingline"):
+            closingline = etree.SubElement(
+                section, _xhtml("p"), {"class": "closingline"}
+            )
+            closingline.text = _str(_attr(notepad, "closingline"))
+    for signal in get("signals") or ():
+        _sub(item_meta, "signal", qcode=_str(signal))
+    for link in get("association_links", ()):
+        link_ele = _sub(item_meta, "link")
+        for attr, name in (
+            ("rel", "rel"),
+            ("rank", "rank"),
+            ("urn", "residref"),
+            ("href", "href"),
+            ("version", "version"),
+        ):
+            _set_if(link_ele, name, _attr(link, attr))
+        if _attr(link, "itemClass"):
+            _sub(link_ele, "itemClass", qcode=_str(_attr(link, "itemClass")))
+        if _attr(link, "title"):
+            _sub(link_ele, "title", text=_attr(link, "title"))
+
+    # contentMeta
+    content_meta = _sub(item, "contentMeta")
+    _sub(content_meta, "urgency", text=get("urgency", ""))
+    if get("content_created"):
+        _sub(content_meta, "contentCreated", text=get("content_created"))
+    for located in get("located_list", ()):
+        if located:
+            located_ele = _named(content_meta, "located", _attr(located, "name"))
+            _set_if(located_ele, "qcode", _attr(located, "qcode"))
+    for infosource in get("info_sources", ()):
+        name = _attr(infosource, "name")
+        infosource_ele = _sub(
+            content_meta, "infoSource", role=_str(_attr(infosource, "role"))
+        )
+        if not name or _attr(infosource, "qcode"):
+            infosource_ele.set("qcode", _str(_attr(infosource, "qcode")))
+        if name:
+            _sub(infosource_ele, "name", text=name)
+    for tag, persons in (
+        ("creator", get("creators", ())),
+        ("contributor", get("contributors", ())),
+    ):
+        for person in persons:
+            person_ele = _sub(content_meta, tag)
+            _set_if(person_ele, "qcode", _attr(person, "qcode"))
+            _set_if(person_ele, "role", _attr(person, "role"))
+            if _attr(person, "name"):
+                _sub(person_ele, "name", text=_attr(person, "name"))
+    genre = get("genre")
+    if genre:
+        _named(content_meta, "genre", _attr(genre, "name"), qcode=_attr(genre, "qcode"))
+    for subject in get("subjects", ()):
+        subject_ele = _sub(content_meta, "subject")
+        _set_if(subject_ele, "qcode", _attr(subject, "qcode"))
+        subject_ele.set("type", _str(_attr(subject, "type")))
+        _set_if(subject_ele, "rank", _attr(subject, "rank"))
+        if _attr(subject, "name"):
+            _sub(subject_ele, "name", text=_attr(subject, "name"))
+    pois = get("pois") or ()
+    for poi in pois:
+        poi_ele = _sub(
+            content_meta,
+            "subject",
+            literal=_str(_attr(poi, "literal")),
+            rank=_str(_attr(poi, "rank")),
+            type="cpnat:poi",
+        )
+        if _attr(poi, "name"):
+            _sub(poi_ele, "name", text=_attr(poi, "name"))
+    for audience in get("audiences", ()):
+        audience_ele = _sub(
+            content_meta, "audience", qcode=_str(_attr(audience, "qcode"))
+        )
+        if _attr(audience, "name"):
+            _sub(audience_ele, "name", text=_attr(audience, "name"))
+    for keyword in get("keywords", ()):
+        keyword_ele = _sub(content_meta, "keyword", text=_attr(keyword, "name"))
+        _set_if(keyword_ele, "rank", _attr(keyword, "rank"))
+    _sub(content_meta, "language", tag=_str(get("language", "")))
+    _sub(content_meta, "headline", text=get("headline", ""), rank="1")
+    if get("kicker"):
+        _sub(content_meta, "headline", text=get("kicker"), rank="3")
+    if get("dateline"):
+        _sub(content_meta, "dateline", text=get("dateline"))
+    if get("byline"):
+        _sub(content_meta, "by", text=get("byline"))
+    if get("credit"):
+        _sub(content_meta, "creditline", text=get("credit"))
+    if get("teaser"):
+        _sub(content_meta, "description", text=get("teaser"), role="drol:teaser")
+    if get("description"):
+        _sub(content_meta, "description", text=get("description"), role="drol:summary")
+    for desc in get("descriptions", ()):
+        _sub(
+            content_meta,
+            "description",
+            text=_attr(desc, "value"),
+            role=_str(_attr(desc, "role")),
+        )
+
+    # pois
+    for poi in pois:
+        details = _sub(
+            _sub(item, "assert", literal=_str(_attr(poi, "literal"))), "POIDetails"
+        )
+        _sub(
+            details,
+            "position",
+            latitude=_str(_attr(poi, "latitude")),
+            longitude=_str(_attr(poi, "longitude")),
+        )
+        address = _sub(details, "address")
+        _sub(address, "line", text=_attr(poi, "name"), role="nrol:display")
+        _sub(address, "line", text=_attr(poi, "address"), role="nrol:full")
+        _named(address, "locality", _attr(poi, "city"), role="dpalocalityrole:locality")
+        _named(address, "area", _attr(poi, "address"), role="dpaarearole:area")
+        _named(address, "country", _attr(poi, "country"), type="cpnat:geoArea")
+
+    # contentSet
+    content_set = _sub(item, "contentSet")
+    if get("article_html"):
+        _build_inline_xml(
+            _sub(content_set, "inlineXML", contenttype="application/xhtml+xml"),
+            entry,
+            datetime_format,
+        )
+    for remote_content in get("remote_contents") or ():
+        remote_content_ele = _sub(
+            content_set,
+            "remoteContent",
+            contenttype=_str(_attr(remote_content, "contenttype")),
+            href=_str(_attr(remote_content, "href")),
+        )
+        for attr in ("width", "height", "bitrate", "samplerate"):
+            _set_if(remote_content_ele, attr, _attr(remote_content, attr))
+    return root
+
+
+def _build_inline_xml(inline_xml, entry: dict[str, Any], datetime_format: Callable):
+    get = entry.get
+    html = etree.SubElement(inline_xml, _xhtml("html"), nsmap={None: XHTML_NS})
+    head = etree.SubElement(html, _xhtml("head"))
+    etree.SubElement(head, _xhtml("meta"), charset="utf-8")
+    etree.SubElement(head, _xhtml("title")).text = _str(get("headline", ""))
+    body = etree.SubElement(html, _xhtml("body"))
+    header = etree.SubElement(body, _xhtml("header"))
+    version_created = get("version_created", "")
+    time = etree.SubElement(
+        header,
+        _xhtml("time"),
+        {"class": "publicationDate", "data-datetime": _str(version_created)},
+    )
+    time.text = _str(datetime_format(version_created, "%d.%m.%Y %H:%M"))
+    if get("sluglines"):
+        slugline_ele = etree.SubElement(header, _xhtml("ul"), {"class": "slugline"})
+        for slugline in get("sluglines"):
+            li = etree.SubElement(
+                slugline_ele, _xhtml("li"), {"class": _str(_attr(slugline, "kind"))}
+            )
+            _set_if(li, "data-qcode", _attr(slugline, "qcode"))
+            li.text = _str(_attr(slugline, "name"))
+    if get("embargoed"):
+        strong = etree.SubElement(
+            header,
+            _xhtml("strong"),
+            {"class": "embargoed", "data-datetime": _str(get("embargoed"))},
+        )
+        strong.text = _str(get("embargo_notice", ""))
+    for tag, key, attrib in (
+        ("h1", "headline", {}),
+        ("h3", "kicker", {}),
+        ("p", "byline", {"class": "byline"}),
+    ):
+        if get(key):
+            etree.SubElement(header, _xhtml(tag), attrib).text = _str(get(key))
+    genre_qcode = _attr(get("genre"), "qcode")
+    section = etree.SubElement(
+        body,
+        _xhtml("section"),
+        {
+            "class": "main "
+            + (_str(genre_qcode).replace(":", "_") if genre_qcode else "")
+        },
+    )
+    if get("teaser"):
+        teaser = etree.SubElement(section, _xhtml("p"), {"class": "teaser"})
+        teaser.text = _str(get("teaser"))
+    section.extend(get("article_html"))
+    if get("infobox") is not None:
+        section.append(get("infobox"))
+
+
+def _parse_html(html: str) -> "etree._Element":
+    # the markup of the message has no namespace, the wrapper puts it into XHTML
+    return etree.fromstring(f'<wrapper xmlns="{XHTML_NS}">{html}</wrapper>')[0]
+
+
+def _append_html(parent, html: str):
+    # the notepads are markup taken verbatim from the message, parsed only here
+    wrapper = etree.fromstring(f'<wrapper xmlns="{XHTML_NS}">{html}</wrapper>')
+    if wrapper.text:
+        if len(parent):
+            parent[-1].tail = (parent[-1].tail or "") + wrapper.text
+        else:
+            parent.text = (parent.text or "") + wrapper.text
+    parent.extend(wrapper)
+
+
+def _g2(tag: str) -> str:
+    return f"{{{G2_NS}}}{tag}"
+
+
+def _xhtml(tag: str) -> str:
+    return f"{{{XHTML_NS}}}{tag}"
+
+
+def _sub(parent, local_name: str, text: Any = _NO_TEXT, **attrib: str):
+    element = etree.SubElement(parent, _g2(local_name), attrib)
+    if text is not _NO_TEXT:
+        element.text = _str(text)
+    return element
+
+
+def _named(parent, tag: str, name: Any, **attrib: Any):
+    element = _sub(parent, tag)
+    for key, value in attrib.items():
+        element.set(key, _str(value))
+    _sub(element, "name", text=name)
+    return element
+
+
+def _set_if(element, key: str, value: Any):
+    if value:
+        element.set(key, _str(value))
+
+
+def _str(value: Any) -> str:
+    return str(value)
+
+
+def _attr(obj: Any, key: str) -> Union[Any, str]:
+    # mirrors jinja's attribute lookup: undefined attributes render as empty string
+    try:
+        return obj[key]
+    except (KeyError, TypeError):
+        return getattr(obj, key, "")
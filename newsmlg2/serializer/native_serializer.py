@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""A serializer writing the same newsmlg2 message as the bundled `g2_template.j2`
+without evaluating the template.
+
+The constant fragments below are the literal parts of `g2_template.j2` after jinja
+applied `trim_blocks` and `lstrip_blocks`. Any change to the template has to be
+reflected here, `tests/serializer/test_native_serializer.py` compares both.
+"""
+
+from typing import Any, Callable
+
+from markupsafe import escape
+
+_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<newsMessage xmlns="http://iptc.org/std/nar/2006-10-01/">\n'
+    "    <itemSet>\n"
+    '        <newsItem conformance="power" guid="'
+)
+_CATALOG = (
+    '">\n'
+    '            <catalogRef href="http://www.iptc.org/std/catalog/catalog.IPTC-G2-'
+    'Standards_32.xml"/>\n'
+    "            <rightsInfo>\n"
+)
+_I16 = " " * 16
+_I20 = " " * 20
+_I24 = " " * 24
+_I28 = " " * 28
+_I32 = " " * 32
+_NOTEPAD = (
+    '                    <edNote role="dpaednoterole:notepad">\n'
+    '                        <section xmlns="http://www.w3.org/1999/xhtml" '
+    'class="notepad">\n'
+)
+_NOTEPAD_END = "                        </section>\n                    </edNote>\n"
+_INLINE_XML = (
+    '                    <inlineXML contenttype="application/xhtml+xml">\n'
+    '                        <html xmlns="http://www.w3.org/1999/xhtml">\n'
+    "                        <head>\n"
+    '                            <meta charset="utf-8"/>\n'
+    "                            <title>"
+)
+_INLINE_XML_HEADER = (
+    "</title>\n"
+    "                        </head>\n"
+    "                        <body>\n"
+    "                        <header>\n"
+    '                            <time class="publicationDate"\n'
+    '                                  data-datetime="'
+)
+_INLINE_XML_END = (
+    "                        </section>\n"
+    "                        </body>\n"
+    "                        </html>\n"
+    "                    </inlineXML>\n"
+)
+_TAIL = "            </contentSet>\n        </newsItem>\n    </itemSet>\n</newsMessage>"
+
+
+def serialize_g2(entry: dict[str, Any], datetime_format: Callable) -> str:
+    """Serializes the context created by `DwToG2Converter.convert` into a newsmlg2
+    message, byte-identical to rendering the bundled `g2_template.j2`.
+
+    :param entry: The context created by `DwToG2Converter.convert`.
+    :param datetime_format: The function used as `datetimeformat` filter.
+    :return: The newsmlg2 message as a string.
+    """
+    buffer = []
+    write_g2(entry, buffer.append, datetime_format)
+    return "".join(buffer)
+
+
+def write_g2(
+    entry: dict[str, Any], write: Callable[[str], Any], datetime_format: Callable
+) -> None:
+    """Writes the newsmlg2 message for the context created by `DwToG2Converter.convert`
+    fragment by fragment.
+
+    :param entry: The context created by `DwToG2Converter.convert`.
+    :param write: A function called with every fragment of the message, i.e.
+        `list.append` or the `write` method of a text file.
+    :param datetime_format: The function used as `datetimeformat` filter.
+    """
+    get = entry.get
+    w = write
+    e = escape
+
+    # newsItem
+    w(_HEAD)
+    w(e(get("urn", "")))
+    w('" standard="NewsML-G2" standardversion="2.32"\n                  version="')
+    w(e(get("version", "")))
+    w('" xml:lang="')
+    w(e(get("language", "")))
+    w(_CATALOG)
+
+    # rightsInfo
+    copyright_notice = get("copyright_notice")
+    if copyright_notice:
+        w(f"{_I20}<copyrightNotice>{e(copyright_notice)}</copyrightNotice>\n")
+    for usageterm in get("usageterms", ()):
+        w(f"{_I20}<usageTerms>{e(usageterm)}</usageTerms>\n")
+    w("            </rightsInfo>\n            <itemMeta>\n")
+
+    # itemMeta
+    item_class = get("item_class", {})
+    provider = get("provider", {})
+    w(f'{_I16}<itemClass qcode="{e(_attr(item_class, "qcode"))}"/>\n')
+    w(f'{_I16}<provider qcode="{e(_attr(provider, "qcode"))}">\n')
+    w(f"{_I20}<name>{e(_attr(provider, 'name'))}</name>\n{_I16}</provider>\n")
+    w(f"{_I16}<versionCreated>{e(get('version_created', ''))}</versionCreated>\n")
+    embargoed = get("embargoed")
+    if embargoed:
+        w(f"{_I20}<embargoed>{e(embargoed)}</embargoed>\n")
+    pubstatus = get("pubstatus", {})
+    if _attr(pubstatus, "qcode"):
+        w(f'{_I20}<pubStatus qcode="{e(_attr(pubstatus, "qcode"))}">\n')
+        w(f"{_I24}<name>{e(_attr(pubstatus, 'name'))}</name>\n{_I20}</pubStatus>\n")
+    generator = get("generator", {})
+    w(f'{_I16}<generator versioninfo="{e(_attr(generator, "version"))}">')
+    w(f"{e(_attr(generator, 'name'))}</generator>\n")
+    w(f'{_I16}<profile versioninfo="0.9">dpa-G2-from-digitalwires</profile>\n')
+    for service in get("services", ()):
+        w(f'{_I20}<service qcode="{e(_attr(service, "qcode"))}">\n')
+        if _attr(service, "name"):
+            w(f"{_I28}<name>{e(_attr(service, 'name'))}</name>\n")
+        w(f"{_I20}</service>\n")
+    title = get("title")
+    if title:
+        w(f"{_I20}<title>{e(title)}</title>\n")
+    for ednote in get("ednotes", ()):
+        w(f"{_I20}<edNote ")
+        if _attr(ednote, "role"):
+            w(f'role="{e(_attr(ednote, "role"))}" ')
+        if _attr(ednote, "constraint"):
+            w(f'pubconstraint="{e(_attr(ednote, "constraint"))}"')
+        w(f">{e(_attr(ednote, 'text'))}</edNote>\n")
+    notepad = get("notepad")
+    if notepad:
+        w(_NOTEPAD)
+        for part in ("header", "public", "non_public"):
+            if _attr(notepad, part):
+                w(str(_attr(notepad, part)))
+        if _attr(notepad, "closingline"):
+            w(f'<p class="closingline">{e(_attr(notepad, "closingline"))}</p>')
+        w(_NOTEPAD_END)
+    signals = get("signals")
+    if signals:
+        for signal in signals:
+            w(f'{_I24}<signal qcode="{e(signal)}"/>\n')
+    for link in get("association_links", ()):
+        w(f"{_I20}<link")
+        for attr, name in _LINK_ATTRIBUTES:
+            value = _attr(link, attr)
+            if value:
+                w(f' {name}="{e(value)}"')
+        w(">\n")
+        if _attr(link, "itemClass"):
+            w(f'{_I24}<itemClass qcode="{e(_attr(link, "itemClass"))}"/>\n')
+        if _attr(link, "title"):
+            w(f"{_I24}<title>{e(_attr(link, 'title'))}</title>\n")
+        w(f"{_I20}</link>\n")
+    w("            </itemMeta>\n            <contentMeta>\n")
+
+    # contentMeta
+    w(f"{_I16}<urgency>{e(get('urgency', ''))}</urgency>\n")
+    content_created = get("content_created")
+    if content_created:
+        w(f"{_I20}<contentCreated>{e(content_created)}</contentCreated>\n")
+    for located in get("located_list", ()):
+        if located and not _attr(located, "qcode"):
+            w(f"{_I24}<located>\n")
+            w(f"{_I28}<name>{e(_attr(located, 'name'))}</name>\n{_I24}</located>\n")
+        if located and _attr(located, "qcode"):
+            w(f'{_I24}<located qcode="{e(_attr(located, "qcode"))}">\n')
+            w(f"{_I28}<name>{e(_attr(located, 'name'))}</name>\n{_I24}</located>\n")
+    w("\n")
+    for infosource in get("info_sources", ()):
+        role = e(_attr(infosource, "role"))
+        if _attr(infosource, "qcode") and _attr(infosource, "name"):
+            w(f'{_I24}<infoSource role="{role}" ')
+            w(f'qcode="{e(_attr(infosource, "qcode"))}">\n')
+            w(f"{_I28}<name>{e(_attr(infosource, 'name'))}</name>\n")
+            w(f"{_I24}</infoSource>\n")
+        elif _attr(infosource, "name"):
+            w(f'{_I24}<infoSource role="{role}">\n')
+            w(f"{_I28}<name>{e(_attr(infosource, 'name'))}</name>\n")
+            w(f"{_I24}</infoSource>\n")
+        else:
+            w(f'{_I24}<infoSource role="{role}" ')
+            w(f'qcode="{e(_attr(infosource, "qcode"))}"/>\n')
+    w("\n")
+    for tag, persons in (
+        ("creator", get("creators", ())),
+        ("contributor", get("contributors", ())),
+    ):
+        for person in persons:
+            w(f"{_I20}<{tag} ")
+            if _attr(person, "qcode"):
+                w(f'qcode="{e(_attr(person, "qcode"))}"')
+            if _attr(person, "role"):
+                w(f'role="{e(_attr(person, "role"))}"')
+            w(">\n")
+            if _attr(person, "name"):
+                w(f"{_I28}<name>{e(_attr(person, 'name'))}</name>\n")
+            w(f"{_I20}</{tag}>\n")
+        w("\n")
+    genre = get("genre")
+    if genre:
+        w(f'{_I20}<genre qcode="{e(_attr(genre, "qcode"))}">\n')
+        w(f"{_I24}<name>{e(_attr(genre, 'name'))}</name>\n{_I20}</genre>\n")
+    w("\n")
+    for subject in get("subjects", ()):
+        w(f"{_I20}<subject ")
+        if _attr(subject, "qcode"):
+            w(f'qcode="{e(_attr(subject, "qcode"))}"')
+        w(f' type="{e(_attr(subject, "type"))}"')
+        if _attr(subject, "rank"):
+            w(f' rank="{e(_attr(subject, "rank"))}"')
+        w(">\n")
+        if _attr(subject, "name"):
+            w(f"{_I28}<name>{e(_attr(subject, 'name'))}</name>\n")
+        w(f"{_I20}</subject>\n")
+    pois = get("pois")
+    if pois:
+        for poi in pois:
+            w(f'{_I24}<subject literal="{e(_attr(poi, "literal"))}" ')
+            w(f'rank="{e(_attr(poi, "rank"))}" type="cpnat:poi">\n')
+            if _attr(poi, "name"):
+                w(f"{_I32}<name>{e(_attr(poi, 'name'))}</name>\n")
+            w(f"{_I24}</subject>\n")
+    w(f"\n{_I16}")
+    for audience in get("audiences", ()):
+        w(f'<audience qcode="{e(_attr(audience, "qcode"))}">\n{_I24}')
+        if _attr(audience, "name"):
+            w(f"<name>{e(_attr(audience, 'name'))}</name>")
+        w(f"{_I20}</audience>\n{_I16}")
+    w(f"\n{_I16}")
+    for keyword in get("keywords", ()):
+        w("<keyword ")
+        if _attr(keyword, "rank"):
+            w(f'rank="{e(_attr(keyword, "rank"))}"')
+        w(f">{e(_attr(keyword, 'name'))}</keyword>\n{_I16}")
+    w(f'\n{_I16}<language tag="{e(get("language", ""))}"/>\n\n')
+    w(f'{_I16}<headline rank="1">{e(get("headline", ""))}</headline>\n{_I16}')
+    kicker = get("kicker")
+    if kicker:
+        w(f'<headline rank="3">{e(kicker)}</headline>')
+    w(f"\n{_I16}")
+    dateline = get("dateline")
+    if dateline:
+        w(f"<dateline>{e(dateline)}</dateline>")
+    w(f"\n{_I16}")
+    byline = get("byline")
+    if byline:
+        w(f"<by>{e(byline)}</by>")
+    w(f"\n{_I16}")
+    credit = get("credit")
+    if credit:
+        w(f"<creditline>{e(credit)}</creditline>")
+    w(f"\n{_I16}")
+    teaser = get("teaser")
+    if teaser:
+        w(f'<description role="drol:teaser">{e(teaser)}</description>')
+    w(_I16)
+    description = get("description")
+    if description:
+        w(f'<description role="drol:summary">{e(description)}</description>')
+    w(_I16)
+    for desc in get("descriptions", ()):
+        w(f'<description role="{e(_attr(desc, "role"))}">')
+        w(f"{e(_attr(desc, 'value'))}</description>")
+    w("\n            </contentMeta>\n")
+
+    # pois
+    if pois:
+        for poi in pois:
+            address = e(_attr(poi, "address"))
+            w(f'{_I20}<assert literal="{e(_attr(poi, "literal"))}">\n')
+            w(f"{_I24}<POIDetails>\n")
+            w(f'{_I28}<position latitude="{e(_attr(poi, "latitude"))}" ')
+            w(f'longitude="{e(_attr(poi, "longitude"))}"/>\n')
+            w(f"{_I28}<address>\n")
+            w(f'{_I32}<line role="nrol:display">{e(_attr(poi, "name"))}</line>\n')
+            w(f'{_I32}<line role="nrol:full">{address}</line>\n')
+            w(f'{_I32}<locality role="dpalocalityrole:locality">\n')
+            w(f"{_I32}    <name>{e(_attr(poi, 'city'))}</name>\n")
+            w(f"{_I32}</locality>\n")
+            w(f'{_I32}<area role="dpaarearole:area">\n')
+            w(f"{_I32}<name>{address}</name>\n")
+            w(f"{_I32}</area>\n")
+            w(f'{_I32}<country type="cpnat:geoArea">\n')
+            w(f"{_I32}    <name>{e(_attr(poi, 'country'))}</name>\n")
+            w(f"{_I32}</country>\n")
+            w(f"{_I28}</address>\n")
+            w(f"{_I24}</POIDetails>\n")
+            w(f"{_I20}</assert>\n")
+
+    # contentSet
+    w("            <contentSet>\n")
+    article_html = get("article_html")
+    if article_html:
+        headline = get("headline", "")
+        version_created = get("version_created", "")
+        w(_INLINE_XML)
+        w(e(headline))
+        w(_INLINE_XML_HEADER)
+        w(f'{e(version_created)}">')
+        w(f"{e(datetime_format(version_created, '%d.%m.%Y %H:%M'))}</time>\n")
+        sluglines = get("sluglines")
+        if sluglines:
+            w(f'{_I32}<ul class="slugline">\n')
+            for slugline in sluglines:
+                w(f'{_I32}        <li class="{e(_attr(slugline, "kind"))}"\n')
+                w(f"{_I32}            ")
+                if _attr(slugline, "qcode"):
+                    w(f'data-qcode="{e(_attr(slugline, "qcode"))}"')
+                w(f">{e(_attr(slugline, 'name'))}</li>\n")
+            w(f"{_I32}</ul>\n")
+        if embargoed:
+            w(f'{_I32}<strong class="embargoed" data-datetime="{e(embargoed)}">')
+            w(f"{e(get('embargo_notice', ''))}</strong>\n")
+        if headline:
+            w(f"{_I32}<h1>{e(headline)}</h1>\n")
+        if kicker:
+            w(f"{_I32}<h3>{e(kicker)}</h3>\n")
+        if byline:
+            w(f'{_I32}<p class="byline">{e(byline)}</p>\n')
+        w(f'{_I24}</header>\n{_I24}<section class="main ')
+        genre_qcode = _attr(genre, "qcode")
+        if genre_qcode:
+            w(e(genre_qcode.replace(":", "_")))
+        w('">\n')
+        if teaser:
+            w(f'{_I32}<p class="teaser">{e(teaser)}</p>\n')
+        for paragraph in article_html:
+            w(f"{_I32}{paragraph}\n")
+        infobox = get("infobox")
+        if infobox:
+            w(f"{_I32}{infobox}\n")
+        w(_INLINE_XML_END)
+    remote_contents = get("remote_contents")
+    if remote_contents:
+        for remote_content in remote_contents:
+            w(f'{_I24}<remoteContent contenttype="')
+            w(f'{e(_attr(remote_content, "contenttype"))}" ')
+            w(f'href="{e(_attr(remote_content, "href"))}"')
+            for attr in ("width", "height", "bitrate"):
+                if _attr(remote_content, attr):
+                    w(f' {attr}="{e(_attr(remote_content, attr))}"')
+            if _attr(remote_content, "samplerate"):
+                w(f'{_I32}       samplerate="')
+                w(f'{e(_attr(remote_content, "samplerate"))}"')
+            w("/>\n")
+    w(_TAIL)
+
+
+_LINK_ATTRIBUTES = (
+    ("rel", "rel"),
+    ("rank", "rank"),
+    ("urn", "residref"),
+    ("href", "href"),
+    ("version", "version"),
+)
+
+
+def _attr(obj: Any, key: str) -> Any:
+    # mirrors jinja's attribute lookup: undefined attributes render as empty string
+    try:
+        return obj[key]
+    except (KeyError, TypeError):
+        return getattr(obj, key, "")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import hashlib
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Union
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from newsmlg2.templates import TEMPLATES_DIR
+
+TEMPLATE_NAME = "g2_template.j2"
+
+DEFAULT_JINJA_ARGS = {
+    "lstrip_blocks": True,
+    "trim_blocks": True,
+    "keep_trailing_newline": False,
+    "autoescape": True,
+}
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class TemplateCache(object):
+    """A bounded LRU cache of jinja environments and their compiled templates.
+
+    Environments are keyed by the absolute templates path, the jinja arguments, the
+    filters and the bytecode cache folder they were created with. Every environment
+    keeps the templates it has compiled, so repeated lookups neither touch the
+    filesystem nor recompile the template. Once more than `maxsize` environments are
+    cached, the least recently used one is dropped.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self._environments = OrderedDict()
+        self._digests = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_environment(
+        self,
+        templates: str,
+        jinja_args: dict = None,
+        filters: dict[str, Callable] = None,
+        bytecode_cache: str = None,
+    ) -> Environment:
+        """Returns a cached jinja environment, creating it on first use.
+
+        :param templates: A path to a jinja templates folder.
+        :param jinja_args: Optional arguments to pass to jinja2.Environment. Defaults to
+            `DEFAULT_JINJA_ARGS`.
+        :param filters: Optional filters to register with the environment.
+        :param bytecode_cache: Optional folder to persist compiled templates in.
+        :return: The jinja environment.
+        """
+        return self._get_entry(templates, jinja_args, filters, bytecode_cache)[0]
+
+    def get_template(
+        self,
+        templates: str,
+        jinja_args: dict = None,
+        filters: dict[str, Callable] = None,
+        bytecode_cache: str = None,
+        name: str = TEMPLATE_NAME,
+    ) -> Template:
+        """Returns a cached compiled template, loading and compiling it on first use.
+
+        :param templates: A path to a jinja templates folder containing `name`.
+        :param jinja_args: Optional arguments to pass to jinja2.Environment. Defaults to
+            `DEFAULT_JINJA_ARGS`.
+        :param filters: Optional filters to register with the environment.
+        :param bytecode_cache: Optional folder to persist compiled templates in.
+        :param name: The name of the template inside the templates folder.
+        :return: The compiled jinja template.
+        """
+        environment, compiled = self._get_entry(
+            templates, jinja_args, filters, bytecode_cache
+        )
+        template = compiled.get(name)
+        if template is None:
+            with self._lock:
+                template = compiled.get(name)
+                if template is None:
+                    template = environment.get_template(name)
+                    compiled[name] = template
+        return template
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the hit and miss statistics of the environment lookups.
+
+        :return: A named tuple of hits, misses, maxsize and currsize.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._environments)
+            )
+
+    def source_digest(self, templates: str) -> str:
+        """Returns a cached hash of the sources of every template in a folder.
+
+        :param templates: A path to a jinja templates folder.
+        :return: A hex digest, computed once until the folder is invalidated.
+        """
+        path = os.path.abspath(templates)
+        with self._lock:
+            digest = self._digests.get(path)
+            if digest is None:
+                digest = self._digests[path] = _source_digest(path)
+                while len(self._digests) > self.maxsize:
+                    self._digests.popitem(last=False)
+            return digest
+
+    def invalidate(self, templates: str = None) -> None:
+        """Drops cached environments and templates, i.e. after templates have been
+        redeployed. Statistics are kept.
+
+        :param templates: Only drop environments for this templates path. If ``None``
+            every environment is dropped.
+        """
+        with self._lock:
+            if templates is None:
+                self._environments.clear()
+                self._digests.clear()
+                return
+            path = os.path.abspath(templates)
+            self._digests.pop(path, None)
+            for key in [key for key in self._environments if key[0] == path]:
+                del self._environments[key]
+
+    def _get_entry(
+        self,
+        templates: str,
+        jinja_args: Union[dict, None],
+        filters: Union[dict, None],
+        bytecode_cache: Union[str, None],
+    ) -> tuple[Environment, dict[str, Template]]:
+        if jinja_args is None:
+            jinja_args = DEFAULT_JINJA_ARGS
+        key = (
+            os.path.abspath(templates),
+            _freeze(jinja_args),
+            _freeze(filters),
+            bytecode_cache,
+        )
+        with self._lock:
+            entry = self._environments.get(key)
+            if entry is not None:
+                self._hits += 1
+                self._environments.move_to_end(key)
+                return entry
+
+            self._misses += 1
+            entry = (
+                create_environment(templates, jinja_args, filters, bytecode_cache),
+                {},
+            )
+            self._environments[key] = entry
+            while len(self._environments) > self.maxsize:
+                self._environments.popitem(last=False)
+            return entry
+
+
+def create_environment(
+    templates: str,
+    jinja_args: dict = None,
+    filters: dict[str, Callable] = None,
+    bytecode_cache: str = None,
+) -> Environment:
+    """Creates an uncached jinja environment for a templates folder.
+
+    For the bundled templates folder, the templates precompiled by
+    `newsmlg2.templates.precompile` are loaded if they are up-to-date. Otherwise the
+    templates are compiled on first use, and if `bytecode_cache` is given, persisted to
+    that folder so later processes can skip compiling them again.
+    :param templates: A path to a jinja templates folder.
+    :param jinja_args: Optional arguments to pass to jinja2.Environment. Defaults to
+        `DEFAULT_JINJA_ARGS`.
+    :param filters: Optional filters to register with the environment.
+    :param bytecode_cache: Optional folder to persist compiled templates in.
+    :return: The jinja environment.
+    """
+    if jinja_args is None:
+        jinja_args = DEFAULT_JINJA_ARGS
+    loader = None
+    if os.path.realpath(templates) == os.path.realpath(TEMPLATES_DIR):
+        from newsmlg2.templates.precompile import precompiled_loader
+
+        loader = precompiled_loader(jinja_args)
+    if loader is None:
+        loader = FileSystemLoader(templates)
+        if bytecode_cache is not None:
+            os.makedirs(bytecode_cache, exist_ok=True)
+            jinja_args = {
+                **jinja_args,
+                "bytecode_cache": FileSystemBytecodeCache(bytecode_cache),
+            }
+    env = Environment(loader=loader, **jinja_args)
+    env.filters.update(filters or {})
+    return env
+
+
+def _source_digest(templates: str) -> str:
+    # the sources of all templates, as included templates change the message too
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(templates):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".j2"):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, templates).encode("utf-8"))
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+template_cache = TemplateCache()
+
+
+def get_template(
+    templates: str,
+    jinja_args: dict = None,
+    filters: dict[str, Callable] = None,
+    bytecode_cache: str = None,
+) -> Template:
+    """Returns the `g2_template.j2` template from the process-wide template cache.
+
+    :param templates: A path to a jinja templates folder containing `g2_template.j2`.
+    :param jinja_args: Optional arguments to pass to jinja2.Environment.
+    :param filters: Optional filters to register with the environment.
+    :param bytecode_cache: Optional folder to persist compiled templates in.
+    :return: The compiled jinja template.
+    """
+    return template_cache.get_template(templates, jinja_args, filters, bytecode_cache)
+
+
+def cache_info() -> CacheInfo:
+    """Returns the hit and miss statistics of the process-wide template cache.
+
+    :return: A named tuple of hits, misses, maxsize and currsize.
+    """
+    return template_cache.cache_info()
+
+
+def invalidate_template_cache(templates: str = None) -> None:
+    """Drops environments from the process-wide template cache, i.e. after templates
+    have been redeployed.
+
+    :param templates: Only drop environments for this templates path. If ``None`` every
+        environment is dropped.
+    """
+    template_cache.invalidate(templates)
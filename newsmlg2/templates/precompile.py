@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Ahead-of-time compilation of the bundled templates.
+
+The bundled templates are compiled into importable python modules, which are loaded
+with a `jinja2.ModuleLoader` instead of being parsed and compiled on first use::
+
+    python -m newsmlg2.templates.precompile [target]
+
+`setup.py` runs this while building the package. The compiled modules are only used as
+long as the template sources, the jinja arguments and the jinja version match the ones
+they were compiled with.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from typing import Union
+
+import jinja2
+from jinja2 import Environment, FileSystemLoader, ModuleLoader
+
+from newsmlg2.templates import COMPILED_DIR, TEMPLATES_DIR
+
+CHECKSUMS_FILE = "checksums.json"
+
+
+def compile_templates(
+    jinja_args: dict, target: str = COMPILED_DIR, templates: str = TEMPLATES_DIR
+) -> list[str]:
+    """Compiles all `*.j2` templates into python modules.
+
+    :param jinja_args: The arguments to pass to jinja2.Environment. The compiled modules
+        are only used for environments created with the same arguments.
+    :param target: The folder to write the modules to.
+    :param templates: The folder containing the templates.
+    :return: The names of the compiled templates.
+    """
+    env = Environment(loader=FileSystemLoader(templates), **jinja_args)
+    names = env.list_templates(filter_func=_is_template)
+    os.makedirs(target, exist_ok=True)
+    env.compile_templates(
+        target, filter_func=_is_template, zip=None, ignore_errors=False
+    )
+    with open(os.path.join(target, CHECKSUMS_FILE), "w") as f:
+        json.dump(
+            {name: _checksum(templates, name, jinja_args) for name in names},
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+    return names
+
+
+def precompiled_loader(
+    jinja_args: dict, target: str = COMPILED_DIR, templates: str = TEMPLATES_DIR
+) -> Union[ModuleLoader, None]:
+    """Returns a loader for the precompiled templates, if they are up-to-date.
+
+    :param jinja_args: The arguments the environment is created with.
+    :param target: The folder containing the compiled modules.
+    :param templates: The folder containing the template sources.
+    :return: A ModuleLoader or ``None`` if there are no compiled modules matching the
+        template sources and `jinja_args`.
+    """
+    try:
+        with open(os.path.join(target, CHECKSUMS_FILE)) as f:
+            checksums = json.load(f)
+        up_to_date = len(checksums) > 0 and all(
+            checksum == _checksum(templates, name, jinja_args)
+            for name, checksum in checksums.items()
+        )
+    except (OSError, ValueError):
+        return None
+    return ModuleLoader(target) if up_to_date else None
+
+
+def _is_template(name: str) -> bool:
+    return name.endswith(".j2")
+
+
+def _checksum(templates: str, name: str, jinja_args: dict) -> str:
+    digest = hashlib.sha256()
+    with open(os.path.join(templates, name), "rb") as f:
+        digest.update(f.read())
+    digest.update(repr(sorted(jinja_args.items())).encode("utf-8"))
+    digest.update(jinja2.__version__.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def main(argv: list[str] = None) -> None:
+    from newsmlg2.template_cache import DEFAULT_JINJA_ARGS
+
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else COMPILED_DIR
+    for name in compile_templates(DEFAULT_JINJA_ARGS, target):
+        print(f"compiled {name} into {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,5 +15,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from .collection_utils import get_rank, get_none_safe
-from .objects import Link, POI, EdNote, Category
-from .string_utils import element_to_string
+from .datetime_utils import parse_iso_datetime
+from .iter_utils import prefetch
+from .json_utils import (
+    HAS_ORJSON,
+    JsonInput,
+    LazyDocument,
+    get_json_decoder,
+    loads_orjson,
+    loads_stdlib,
+)
+from .objects import Link, POI, EdNote, Category, object_factory
+from .string_utils import element_to_string, split_children
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Union
+
+_ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?"
+    r"(?:(Z)|([+-])(\d{2}):(\d{2}))?"
+)
+
+
+def parse_iso_datetime(value: str) -> Union[datetime, None]:
+    """Parses the ISO-8601 timestamps found in digitalwires messages, i.e.
+    ``"2025-01-23T16:28:31Z"`` or ``"2025-01-23T16:28:31.123+01:00"``.
+
+    Timestamps without an offset are UTC, like `arrow.get` treats them.
+    :param value: The timestamp.
+    :return: An aware datetime or ``None`` if the value isn't in one of these formats or
+        not a valid date.
+    """
+    match = _ISO_DATETIME.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, z, sign, tz_h, tz_m = (
+        match.groups()
+    )
+    if sign is None:
+        tz = timezone.utc
+    else:
+        offset = timedelta(hours=int(tz_h), minutes=int(tz_m))
+        tz = timezone(-offset if sign == "-" else offset)
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=tz,
+        )
+    except ValueError:
+        return None
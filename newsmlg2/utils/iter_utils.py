@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def prefetch(iterable: Iterable[T], size: int, name: str = "prefetch") -> Iterator[T]:
+    """Consumes an iterable on a background thread, up to `size` items ahead.
+
+    While the consumer processes an item, the thread already produces the next ones,
+    i.e. reads and decodes them. Exceptions raised by the iterable are re-raised in
+    the consumer. Once the consumer stops, the thread stops as well.
+    :param iterable: The iterable to consume, it is only iterated by the thread.
+    :param size: The maximum number of items produced ahead.
+    :param name: The name of the thread.
+    :return: An iterator of the items of `iterable`.
+    """
+    produced = queue.Queue(maxsize=max(size, 1))
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        # gives up once the consumer has stopped, instead of blocking forever
+        while not stopped.is_set():
+            try:
+                produced.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(_DONE)
+
+    threading.Thread(target=produce, name=name, daemon=True).start()
+    try:
+        while True:
+            item = produced.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # not joined, the thread may be blocked reading a pipe; it stops on its own
+        stopped.set()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import re
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+def loads_stdlib(data: JsonInput) -> Any:
+    """Decodes JSON with the json module of the standard library.
+
+    :param data: UTF-8 encoded JSON as bytes, bytearray or memoryview, or a string.
+    :return: The decoded value.
+    """
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(_strip_bom(data))
+
+
+def loads_orjson(data: JsonInput) -> Any:
+    """Decodes JSON with orjson, which reads the UTF-8 bytes without decoding them to a
+    string first.
+
+    :param data: UTF-8 encoded JSON as bytes, bytearray or memoryview, or a string.
+    :return: The decoded value.
+    """
+    return orjson.loads(_strip_bom(data))
+
+
+def _strip_bom(data: JsonInput) -> JsonInput:
+    # files written by some editors start with a byte order mark, which is no JSON
+    if isinstance(data, str):
+        return data[1:] if data.startswith("\ufeff") else data
+    return data[3:] if data[:3] == b"\xef\xbb\xbf" else data
+
+
+def get_json_decoder(name: str = None) -> Callable[[JsonInput], Any]:
+    """Returns a JSON decoder by name.
+
+    :param name: ``"orjson"`` or ``"stdlib"``. If ``None``, orjson is used if it is
+        installed, otherwise the standard library.
+    :return: A function decoding bytes, bytearray, memoryview or strings.
+    """
+    if name is None:
+        name = "orjson" if HAS_ORJSON else "stdlib"
+    if name == "orjson":
+        if not HAS_ORJSON:
+            raise ValueError("orjson is not installed")
+        return loads_orjson
+    if name == "stdlib":
+        return loads_stdlib
+    raise ValueError(f"Unknown JSON decoder {name!r}, expected 'orjson' or 'stdlib'")
+
+
+_OBJECT_START = re.compile(rb"[ \t\n\r]*\{[ \t\n\r]*")
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+# a key and, unless it is an object or array, its value
+_MEMBER = re.compile(
+    rb'"([^"\\]*(?:\\.[^"\\]*)*)"[ \t\n\r]*:[ \t\n\r]*('
+    + _STRING
+    + rb'|[^,}\]\s\[{"]+)?'
+)
+# everything up to and including the next bracket outside of a string
+_NEXT_BRACKET = re.compile(rb'[^"\[\]{}]*(?:' + _STRING + rb'[^"\[\]{}]*)*[\[\]{}]')
+_SEPARATOR = re.compile(rb"[ \t\n\r]*([,}])[ \t\n\r]*")
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_CLOSING = {ord("{"): ord("}"), ord("["): ord("]")}
+
+
+class LazyDocument(Mapping):
+    """A JSON object whose values are materialized when they are first accessed.
+
+    Creating the document only scans the top level of the object for the spans of its
+    values, nested objects and arrays are skipped by counting their brackets. No value
+    is decoded before its key is read, it is then kept, so values which are never read,
+    i.e. large lists of rubric or keyword names, hold no objects in memory. The
+    document keeps the raw JSON as UTF-8 bytes, it only saves memory if the values
+    left unread are larger than that.
+    """
+
+    def __init__(
+        self, raw: JsonInput, decoder: Callable[[JsonInput], Any] = None
+    ) -> None:
+        """
+        :param raw: A JSON object as UTF-8 bytes, bytearray, memoryview or string.
+        :param decoder: The function decoding the values, defaults to
+            `get_json_decoder()`.
+        :raises ValueError: If `raw` is no JSON object. Values are only validated when
+            they are read.
+        """
+        raw = _strip_bom(raw)
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        elif not isinstance(raw, bytes):
+            raw = bytes(raw)
+        self._raw = raw
+        self._decode = decoder or get_json_decoder()
+        self._spans = _scan_object(raw)
+        self._values = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            start, end = self._spans[key]
+            value = self._values[key] = self._decode(self._raw[start:end])
+            return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key not in self._spans:
+            return default
+        return self[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._spans
+
+    @property
+    def decoded_keys(self) -> list[str]:
+        """The keys whose values have been materialized so far."""
+        return list(self._values)
+
+    def to_dict(self) -> dict:
+        """Materializes all values and returns them as a dict."""
+        return {key: self[key] for key in self._spans}
+
+
+def _scan_object(raw: bytes) -> dict[str, tuple[int, int]]:
+    spans = {}
+    match = _OBJECT_START.match(raw)
+    if match is None:
+        raise ValueError("Expected a JSON object")
+    pos = match.end()
+    if raw.startswith(b"}", pos):
+        _expect_end(raw, pos + 1)
+        return spans
+    while True:
+        match = _MEMBER.match(raw, pos)
+        if match is None:
+            raise ValueError(f"Expected a key at position {pos}")
+        key = match.group(1).decode("utf-8")
+        if "\\" in key:
+            key = json.loads(f'"{key}"')
+        start = end = match.end()
+        if match.group(2) is not None:
+            start = match.start(2)
+        elif raw[start : start + 1] in (b"{", b"["):
+            end = _skip_container(raw, start)
+        else:
+            raise ValueError(f"Expected a value at position {start}")
+        spans[key] = (start, end)
+        match = _SEPARATOR.match(raw, end)
+        if match is None:
+            raise ValueError(f"Expected ',' or '}}' at position {end}")
+        if match.group(1) == b"}":
+            _expect_end(raw, match.end())
+            return spans
+        pos = match.end()
+
+
+def _skip_container(raw: bytes, pos: int) -> int:
+    # only the brackets are visited, strings and scalars are skipped by the regex
+    closing = []
+    while True:
+        char = raw[pos]
+        if char in _CLOSING:
+            closing.append(_CLOSING[char])
+        elif char != closing.pop():
+            raise ValueError(f"Unexpected {chr(char)!r} at position {pos}")
+        elif not closing:
+            return pos + 1
+        match = _NEXT_BRACKET.match(raw, pos + 1)
+        if match is None:
+            raise ValueError(f"Unterminated object or array at position {pos}")
+        pos = match.end() - 1
+
+
+def _expect_end(raw: bytes, pos: int):
+    if _WHITESPACE.match(raw, pos).end() != len(raw):
+        raise ValueError(f"Unexpected data after the object at position {pos}")
@@ -14,10 +14,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
+from typing import Any, Callable
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class POI:
     name: str = None
     formatted_address: str = None
@@ -27,7 +29,7 @@ class POI:
     longitude: str = None
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Link:
     content_type: str = None
     width: str = None
@@ -43,7 +45,7 @@ class Link:
     urn: str = None
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Category:
     category_type: str = None
     role: str = None
@@ -65,14 +67,46 @@ class Category:
         return dw_key
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class EdNote:
     role: str = None
     ednote: str = None
     is_publishable: bool = None
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Description:
     role: str = None
     description: str = None
+
+
+@lru_cache(maxsize=None)
+def object_factory(cls: type, dw_keys: tuple[str, ...]) -> Callable[[dict], Any]:
+    """Returns a function creating objects of `cls` from digitalwires dicts.
+
+    The mapping of the digitalwires keys to the fields of `cls` is computed once per
+    class and keys, so creating many objects only reads the values from the dicts.
+    :param cls: A value class of this module, i.e. `Category`.
+    :param dw_keys: The keys to read from the dicts. They are mapped to field names by
+        `cls.map_dw_key` if the class has it, otherwise they are the field names.
+    :return: A function taking a dict and returning an object of `cls`. Missing keys
+        are ``None``.
+    """
+    names = cls.map_dw_key(list(dw_keys)) if hasattr(cls, "map_dw_key") else dw_keys
+    by_name = dict(zip(names, dw_keys))
+    cls_fields = fields(cls)
+    unknown = set(by_name) - {f.name for f in cls_fields}
+    if unknown:
+        raise TypeError(f"{cls.__name__} has no fields {sorted(unknown)}")
+    sources = [(by_name.get(f.name), f.default) for f in cls_fields]
+    while sources and sources[-1][0] is None:
+        sources.pop()
+    if any(key is None and default is MISSING for key, default in sources):
+        raise TypeError(f"{cls.__name__} requires values for all of its fields")
+    sources = tuple(sources)
+
+    def create(values: dict) -> Any:
+        get = values.get
+        return cls(*[default if key is None else get(key) for key, default in sources])
+
+    return create
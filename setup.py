@@ -15,7 +15,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import sys
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithPrecompiledTemplates(build_py):
+    """Compiles the bundled jinja templates into python modules shipped with the
+    package, see `newsmlg2.templates.precompile`."""
+
+    def run(self):
+        super().run()
+        target = os.path.join(self.build_lib, "newsmlg2", "templates", "compiled")
+        # isolated builds do not run from the source folder, the package is imported
+        # from the build folder; jinja2 is a build requirement in pyproject.toml
+        sys.path.insert(0, os.path.abspath(self.build_lib))
+        try:
+            from newsmlg2.templates.precompile import main
+        except ImportError as e:
+            raise RuntimeError(f"the templates can not be precompiled: {e}") from e
+        finally:
+            sys.path.pop(0)
+        main([target])
+
 
 setup(
     name="digitalwirestonewsmlg2",
@@ -26,11 +50,14 @@ setup(
             "tests",
         ]
     ),
+    cmdclass={"build_py": BuildPyWithPrecompiledTemplates},
     include_package_data=True,
     package_data={
         "newsmlg2.templates": ["*.j2", "*.xsd"],
     },
     install_requires=["arrow==1.3.0", "jinja2==3.1.5"],
+    extras_require={"lxml": ["lxml>=4.9"], "orjson": ["orjson>=3.8"]},
+    entry_points={"console_scripts": ["dw2g2=newsmlg2.cli:main"]},
     author="Christoffer Kassens",
     author_email="kassens.christoffer@dpa.com",
     python_requires=">=3.12",
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from newsmlg2 import DigitalwiresModel
+from newsmlg2.builder import DwToG2Converter
+from newsmlg2.builder.to_g2_converter import memoized
+from newsmlg2.extractor.category_extractor import get_keywords
+from newsmlg2.renderer.render_content import render_slugline
+from newsmlg2.renderer.render_content_meta import render_keywords
+
+
+def test_plan_contains_every_field():
+    converter = DwToG2Converter()
+
+    assert [field for field, _ in converter.plan] == [
+        field for field, *_ in DwToG2Converter.fields
+    ]
+    assert converter.convert(DigitalwiresModel({}))["generator"] == {
+        "name": DwToG2Converter.name,
+        "role": DwToG2Converter.role,
+        "version": DwToG2Converter.version,
+    }
+
+
+def test_plan_is_compiled_once_per_class():
+    first, second = DwToG2Converter(), DwToG2Converter(incremental_article=True)
+
+    assert dict(first.plan)["urn"] is dict(second.plan)["urn"]
+    article, other_article = (
+        dict(first.plan)["article_html"],
+        dict(second.plan)["article_html"],
+    )
+    assert article.func is other_article.func
+    assert article.args[0].__self__ is first
+    assert other_article.args[0].__self__ is second
+
+
+def test_shared_extractors_run_once_per_model(test_data_json):
+    calls = []
+
+    def counting_keywords(dw_model):
+        calls.append(dw_model)
+        return get_keywords(dw_model)
+
+    class CountingConverter(DwToG2Converter):
+        fields = [
+            ("keywords", render_keywords, [counting_keywords]),
+            ("sluglines", render_slugline, [counting_keywords]),
+        ]
+
+    converter = CountingConverter()
+    dw_model = DigitalwiresModel(test_data_json["dw-1.json"])
+    entry = converter.convert(dw_model)
+
+    assert len(calls) == 1
+    assert entry["keywords"] == render_keywords(dw_model, [get_keywords])
+    converter.convert(DigitalwiresModel(test_data_json["dw-1.json"]))
+    assert len(calls) == 2
+
+
+def test_memoized():
+    dw_model = DigitalwiresModel({"urn": "urn:1"})
+    extract = memoized(lambda model: [model["urn"]])
+
+    assert extract(dw_model) is extract(dw_model)
+    assert extract(DigitalwiresModel({"urn": "urn:2"})) == ["urn:2"]
@@ -16,6 +16,9 @@
 #  limitations under the License.
 
 from newsmlg2.renderer.render_content import (
+    IncrementalArticle,
+    _extract_parts,
+    dateline_cache_info,
     render_article,
     render_slugline,
     render_infobox,
@@ -225,3 +228,71 @@ def test_render_slugline_reduced():
     assert len(result) == 1
     assert result[0]["kind"] == "subject"
     assert result[0]["name"] == "Foo"
+
+
+def test_render_article_passes_markup_through():
+    article = '<section class="main"><p>Lorem</p><p></p><p>ipsum<br/></p></section>'
+
+    assert render_article(None, lambda c: None, lambda c: article) == [
+        "<p>Lorem</p>",
+        "<p />",
+        "<p>ipsum<br /></p>",
+    ]
+    assert render_article(None, lambda c: "no dateline", lambda c: article)[0] == (
+        "<p>Lorem</p>"
+    )
+    assert render_article(None, lambda c: "Rom (dpa) - ", lambda c: article)[0] == (
+        '<p><span class="dateline">Rom <span class="credit">(dpa)</span> - </span>'
+        "Lorem</p>"
+    )
+
+
+def test_render_article_incremental():
+    article = '<section class="main"><p>Lorem</p>tail<p></p><p>ipsum</p></section>'
+    for dateline in (None, "Rom (dpa) - ", "no dateline"):
+        result = render_article(
+            None, lambda c: dateline, lambda c: article, incremental=True
+        )
+
+        assert type(result) is IncrementalArticle
+        assert result
+        assert list(result) == render_article(
+            None, lambda c: dateline, lambda c: article
+        )
+
+
+def test_render_article_incremental_empty_article():
+    result = render_article(
+        None,
+        lambda c: "Rom (dpa) - ",
+        lambda c: '<section class="main"></section>',
+        incremental=True,
+    )
+
+    assert not result
+    assert list(result) == []
+
+
+def test_render_article_incremental_with_dateline_in_article():
+    article = (
+        '<section class="main"><p><span class="dateline">Hamburg '
+        '<span class="credit">(dpa)</span> - </span>Lorem ipsum</p></section>'
+    )
+    result = render_article(
+        None, lambda c: "Berlin (dpa) - ", lambda c: article, incremental=True
+    )
+
+    assert result == render_article(
+        None, lambda c: "Berlin (dpa) - ", lambda c: article
+    )
+
+
+def test_dateline_parts_are_cached():
+    _extract_parts.cache_clear()
+
+    assert _extract_parts("Berlin (dpa) - ") == ("Berlin ", "(dpa)")
+    assert _extract_parts("Berlin (dpa) - ") == ("Berlin ", "(dpa)")
+    assert _extract_parts("Washington (AP) \u2013 ") == ("Washington ", "(AP)")
+    assert _extract_parts("no credit") is None
+    info = dateline_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 3)
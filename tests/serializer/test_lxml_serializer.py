@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+from unittest import mock
+
+import pytest
+
+from newsmlg2 import DigitalwiresModel, G2Converter
+from newsmlg2.digitalwires_to_newsmlg2 import datetime_format
+
+etree = pytest.importorskip("lxml.etree")
+
+from newsmlg2.serializer import (  # noqa: E402
+    LxmlDwToG2Converter,
+    build_g2_tree,
+    serialize_g2_tree,
+)
+
+
+def _canonical(xml: str) -> bytes:
+    root = etree.fromstring(xml.encode("utf-8"))
+    for element in root.iter():
+        if element.text is not None and not element.text.strip():
+            element.text = None
+        if element.tail is not None and not element.tail.strip():
+            element.tail = None
+    return etree.tostring(root, method="c14n")
+
+
+def test_serialize_g2_tree(test_data_json, result_data_g2):
+    for filename, file in test_data_json.items():
+        expected = result_data_g2[filename.replace(".json", ".xml")]
+        entry = LxmlDwToG2Converter().convert(DigitalwiresModel(file))
+        result = serialize_g2_tree(entry, datetime_format)
+
+        assert result.startswith('<?xml version="1.0" encoding="UTF-8"?>\n')
+        assert _canonical(expected) == _canonical(result), filename
+
+
+def test_build_g2_tree(test_data_json):
+    entry = LxmlDwToG2Converter().convert(
+        DigitalwiresModel(test_data_json["dw-1.json"])
+    )
+    root = build_g2_tree(entry, datetime_format)
+    ns = {"g2": "http://iptc.org/std/nar/2006-10-01/"}
+
+    assert root.find("g2:itemSet/g2:newsItem", ns).get("guid") == entry["urn"]
+    assert root.find(".//g2:contentMeta/g2:headline", ns).text == entry["headline"]
+
+
+def test_g2_converter_lxml_engine(test_data_json, result_data_g2):
+    converter = G2Converter(engine="lxml")
+    for filename, file in test_data_json.items():
+        expected = result_data_g2[filename.replace(".json", ".xml")]
+        result = converter.convert(file)
+
+        assert _canonical(expected) == _canonical(result)
+        assert "".join(converter.stream(file)) == result
+
+
+def test_g2_converter_lxml_engine_falls_back_without_lxml(
+    test_data_json, result_data_g2, caplog
+):
+    with mock.patch("newsmlg2.serializer.lxml_serializer.HAS_LXML", False):
+        with caplog.at_level(logging.WARNING):
+            converter = G2Converter(engine="lxml")
+
+    assert converter.engine == "jinja"
+    assert "lxml is not installed" in caplog.text
+    assert converter.convert(test_data_json["dw-1.json"]) == result_data_g2["dw-1.xml"]
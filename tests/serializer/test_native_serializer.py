@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import copy
+import random
+
+import pytest
+
+from newsmlg2 import DigitalwiresModel, G2Converter, convert_to_g2
+from newsmlg2.builder import DwToG2Converter
+from newsmlg2.digitalwires_to_newsmlg2 import DEFAULT_FILTERS, datetime_format
+from newsmlg2.serializer import serialize_g2, write_g2
+from newsmlg2.template_cache import get_template
+
+TEMPLATES = "./newsmlg2/templates"
+
+VALUES = [None, "", 0, 7, "dpa", "<b>\"Tom\" & 'Jerry'</b>", "a:b"]
+
+
+def _mutate(value, rnd):
+    if isinstance(value, list):
+        return [_mutate(v, rnd) for v in value if rnd.random() > 0.1]
+    if isinstance(value, dict):
+        mutated = {}
+        for key, v in value.items():
+            if rnd.random() < 0.1:
+                continue
+            mutated[key] = _mutate(v, rnd) if rnd.random() < 0.5 else v
+        return mutated
+    return rnd.choice(VALUES) if rnd.random() < 0.3 else value
+
+
+def test_serialize_g2(test_data_json, result_data_g2):
+    for filename, file in test_data_json.items():
+        entry = DwToG2Converter().convert(DigitalwiresModel(file))
+        result = serialize_g2(entry, datetime_format)
+
+        assert result_data_g2[filename.replace(".json", ".xml")] == result
+
+
+def test_serialize_g2_matches_template_for_mutated_entries(test_data_json):
+    template = get_template(TEMPLATES, None, DEFAULT_FILTERS)
+    rnd = random.Random(1337)
+    compared = 0
+    for filename, file in test_data_json.items():
+        entry = DwToG2Converter().convert(DigitalwiresModel(file))
+        entry["title"] = "Title"
+        entry["description"] = "Summary"
+        for _ in range(40):
+            mutated = {
+                key: _mutate(value, rnd) if rnd.random() < 0.3 else value
+                for key, value in copy.deepcopy(entry).items()
+                if rnd.random() > 0.05
+            }
+            try:
+                expected = template.render(**mutated)
+            except Exception:
+                continue
+            assert expected == serialize_g2(mutated, datetime_format)
+            compared += 1
+
+    assert compared > 300
+
+
+def test_write_g2_fragments(test_data_json, result_data_g2):
+    fragments = []
+    entry = DwToG2Converter().convert(DigitalwiresModel(test_data_json["dw-1.json"]))
+    write_g2(entry, fragments.append, datetime_format)
+
+    assert len(fragments) > 1
+    assert result_data_g2["dw-1.xml"] == "".join(fragments)
+
+
+def test_convert_to_g2_native_engine(test_data_json, result_data_g2):
+    for filename, file in test_data_json.items():
+        result = convert_to_g2(file, templates=TEMPLATES, engine="native")
+        assert result_data_g2[filename.replace(".json", ".xml")] == result
+
+
+def test_g2_converter_native_engine_stream(test_data_json, result_data_g2):
+    converter = G2Converter(engine="native")
+    chunks = list(converter.stream(test_data_json["dw-1.json"], buffer_size=1))
+
+    assert len(chunks) > 1
+    assert result_data_g2["dw-1.xml"] == "".join(chunks)
+
+
+def test_g2_converter_unknown_engine():
+    with pytest.raises(ValueError):
+        G2Converter(engine="xslt")
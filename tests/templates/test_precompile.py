@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import shutil
+
+from jinja2 import Environment, ModuleLoader
+
+from newsmlg2 import DigitalwiresModel, G2Converter
+from newsmlg2.builder import DwToG2Converter
+from newsmlg2.digitalwires_to_newsmlg2 import DEFAULT_FILTERS
+from newsmlg2.template_cache import DEFAULT_JINJA_ARGS
+from newsmlg2.templates import TEMPLATES_DIR
+from newsmlg2.templates.precompile import compile_templates, precompiled_loader
+
+
+def test_compile_templates(tmp_path):
+    names = compile_templates(DEFAULT_JINJA_ARGS, str(tmp_path))
+
+    assert names == ["g2_template.j2"]
+    assert os.path.exists(tmp_path / "checksums.json")
+    assert any(f.endswith(".py") for f in os.listdir(tmp_path))
+
+
+def test_precompiled_loader_renders_like_source(
+    tmp_path, test_data_json, result_data_g2
+):
+    compile_templates(DEFAULT_JINJA_ARGS, str(tmp_path))
+    loader = precompiled_loader(DEFAULT_JINJA_ARGS, str(tmp_path))
+    assert type(loader) is ModuleLoader
+
+    env = Environment(loader=loader, **DEFAULT_JINJA_ARGS)
+    env.filters.update(DEFAULT_FILTERS)
+    template = env.get_template("g2_template.j2")
+    for filename, file in test_data_json.items():
+        entry = DwToG2Converter().convert(DigitalwiresModel(file))
+        assert result_data_g2[filename.replace(".json", ".xml")] == template.render(
+            **entry
+        )
+
+
+def test_precompiled_loader_outdated(tmp_path):
+    compile_templates(DEFAULT_JINJA_ARGS, str(tmp_path))
+
+    assert (
+        precompiled_loader({**DEFAULT_JINJA_ARGS, "autoescape": False}, str(tmp_path))
+        is None
+    )
+
+
+def test_precompiled_loader_template_changed(tmp_path):
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates, ignore=shutil.ignore_patterns("*.py*"))
+    compile_templates(DEFAULT_JINJA_ARGS, str(tmp_path / "compiled"), str(templates))
+    with open(templates / "g2_template.j2", "a") as f:
+        f.write("\n")
+
+    assert (
+        precompiled_loader(
+            DEFAULT_JINJA_ARGS, str(tmp_path / "compiled"), str(templates)
+        )
+        is None
+    )
+
+
+def test_precompiled_loader_not_compiled(tmp_path):
+    assert precompiled_loader(DEFAULT_JINJA_ARGS, str(tmp_path)) is None
+
+
+def test_bytecode_cache(tmp_path, test_data_json, result_data_g2):
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates, ignore=shutil.ignore_patterns("*.py*"))
+    converter = G2Converter(
+        templates=str(templates), bytecode_cache=str(tmp_path / "bytecode")
+    )
+
+    assert len(os.listdir(tmp_path / "bytecode")) == 1
+    assert result_data_g2["dw-1.xml"] == converter.convert(test_data_json["dw-1.json"])
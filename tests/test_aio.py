@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import pickle
+import threading
+import time
+from unittest import mock
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from newsmlg2 import AsyncG2Converter
+from newsmlg2.aio import _convert_in_worker, _worker_converter, _WorkerConfig
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+def test_async_convert(test_data_json, result_data_g2):
+    async def convert():
+        converter = AsyncG2Converter(templates=TEMPLATES)
+        return await converter.convert(test_data_json["dw-1.json"])
+
+    assert asyncio.run(convert()) == result_data_g2["dw-1.xml"]
+
+
+def test_async_convert_many_ordered(test_data_json, result_data_g2):
+    filenames = list(test_data_json.keys())
+
+    async def produce():
+        for filename in filenames:
+            await asyncio.sleep(0)
+            yield test_data_json[filename]
+
+    async def convert():
+        converter = AsyncG2Converter(templates=TEMPLATES, max_concurrency=3)
+        return [result async for result in converter.convert_many(produce())]
+
+    results = asyncio.run(convert())
+
+    assert [result.index for result in results] == list(range(len(filenames)))
+    for filename, result in zip(filenames, results):
+        assert result_data_g2[filename.replace(".json", ".xml")] == result.g2
+
+
+def test_async_convert_many_unordered_isolates_failures(test_data_json):
+    broken = {"urn": "urn:newsml:dpa.com:20090101:broken", "version": "not a number"}
+    entries = [test_data_json["image.json"], broken, test_data_json["eil.json"]]
+
+    async def convert():
+        with ThreadPoolExecutor(2) as executor:
+            converter = AsyncG2Converter(
+                templates=TEMPLATES, executor=executor, max_concurrency=2
+            )
+            return [r async for r in converter.convert_many(entries, ordered=False)]
+
+    results = {result.index: result for result in asyncio.run(convert())}
+
+    assert sorted(results) == [0, 1, 2]
+    assert results[0].ok and results[2].ok
+    assert type(results[1].error) is ValueError
+    assert results[1].urn == broken["urn"]
+
+
+def test_async_convert_limits_concurrency(test_data_json):
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    async def convert():
+        with ThreadPoolExecutor(8) as executor:
+            converter = AsyncG2Converter(
+                templates=TEMPLATES, executor=executor, max_concurrency=2
+            )
+            convert_entry = converter._convert
+
+            def tracked(dw):
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.01)
+                try:
+                    return convert_entry(dw)
+                finally:
+                    with lock:
+                        running[0] -= 1
+
+            converter._convert = tracked
+            entries = [test_data_json["dw-1.json"]] * 10
+            return [r async for r in converter.convert_many(entries, ordered=False)]
+
+    results = asyncio.run(convert())
+
+    assert len(results) == 10
+    assert all(result.ok for result in results)
+    assert peak[0] == 2
+
+
+def test_async_convert_with_process_pool(test_data_json, result_data_g2):
+    async def convert():
+        with ProcessPoolExecutor(1) as executor:
+            converter = AsyncG2Converter(
+                templates=TEMPLATES, engine="native", executor=executor
+            )
+            return await converter.convert(test_data_json["eil.json"])
+
+    assert asyncio.run(convert()) == result_data_g2["eil.xml"]
+
+
+def test_async_convert_uses_engine(test_data_json, result_data_g2):
+    async def convert():
+        converter = AsyncG2Converter(templates=TEMPLATES, engine="native")
+        return await converter.convert(test_data_json["eil.json"])
+
+    with mock.patch(
+        "newsmlg2.serializer.native_serializer.serialize_g2", return_value="native"
+    ):
+        assert asyncio.run(convert()) == "native"
+
+
+def test_worker_converters_are_bounded(test_data_json, result_data_g2):
+    entry = test_data_json["eil.json"]
+    _worker_converter.cache_clear()
+
+    for index in range(20):
+        config = _WorkerConfig(str(index), TEMPLATES, None, None, "native")
+        # the config reaches the worker pickled, a copy must hit the cache
+        for copy in (config, pickle.loads(pickle.dumps(config))):
+            assert _convert_in_worker(copy, entry) == result_data_g2["eil.xml"]
+
+    info = _worker_converter.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (20, 20, 16)
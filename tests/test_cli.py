@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import io
+import json
+import os
+import shutil
+
+import pytest
+
+from newsmlg2 import cli
+
+INPUT_DIR = os.path.join(os.path.dirname(__file__), "data", "input")
+
+
+def _copy_inputs(directory, filenames):
+    directory.mkdir()
+    for filename in filenames:
+        shutil.copy(os.path.join(INPUT_DIR, filename), directory / filename)
+    return directory
+
+
+def _output_name(entry):
+    return f"{entry['urn']}-{entry['version']}".replace(":", "_") + ".xml"
+
+
+def test_cli_converts_files_and_directories(tmp_path, result_data_g2, capsys):
+    inputs = _copy_inputs(tmp_path / "in", ["dw-1.json", "eil.json"])
+    out = tmp_path / "out"
+
+    status = cli.main(
+        ["-o", str(out), str(inputs), os.path.join(INPUT_DIR, "image.json")]
+    )
+
+    assert status == 0
+    assert sorted(os.listdir(out)) == ["dw-1.xml", "eil.xml", "image.xml"]
+    for name in os.listdir(out):
+        assert (out / name).read_text(encoding="utf-8") == result_data_g2[name]
+    assert "converted 3, skipped 0, failed 0" in capsys.readouterr().err
+
+
+def test_cli_skips_up_to_date_outputs(tmp_path, capsys):
+    inputs = _copy_inputs(tmp_path / "in", ["dw-1.json", "eil.json"])
+    out = tmp_path / "out"
+    cli.main(["-q", "-o", str(out), str(inputs)])
+    stale = out / "eil.xml"
+    os.utime(stale, (0, 0))
+
+    status = cli.main(["-o", str(out), str(inputs)])
+
+    assert status == 0
+    assert "converted 1, skipped 1, failed 0" in capsys.readouterr().err
+    assert stale.stat().st_mtime > 0
+
+    cli.main(["-f", "-o", str(out), str(inputs)])
+    assert "converted 2, skipped 0" in capsys.readouterr().err
+
+
+def test_cli_converts_ndjson_in_parallel(
+    tmp_path, test_data_json, result_data_g2, capsys
+):
+    feed = tmp_path / "feed.ndjson"
+    entries = [test_data_json["dw-1.json"], test_data_json["eil.json"]]
+    lines = [json.dumps(entry) for entry in entries]
+    feed.write_text("\n".join(lines[:1] + ["{broken"] + lines[1:]) + "\n")
+    out = tmp_path / "out"
+
+    status = cli.main(["-j", "2", "--chunksize", "1", "-o", str(out), str(feed)])
+
+    assert status == 1
+    assert "converted 2, skipped 0, failed 1" in capsys.readouterr().err
+    for entry, name in zip(entries, ["dw-1.xml", "eil.xml"]):
+        output = out / "feed" / _output_name(entry)
+        assert output.read_text(encoding="utf-8") == result_data_g2[name]
+
+
+def test_cli_reads_ndjson_from_stdin(tmp_path, test_data_json, monkeypatch):
+    entry = test_data_json["eil.json"]
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(entry) + "\n"))
+
+    status = cli.main(["-q", "--engine", "native", "-o", str(tmp_path), "-"])
+
+    assert status == 0
+    assert os.listdir(tmp_path) == [_output_name(entry)]
+
+
+def test_cli_writes_every_version_of_a_message(tmp_path, test_data_json, capsys):
+    entry = test_data_json["eil.json"]
+    versions = [dict(entry, version=1), dict(entry, version=2)]
+    feed = tmp_path / "feed.ndjson"
+    feed.write_text("".join(json.dumps(v) + "\n" for v in versions))
+    out = tmp_path / "out"
+
+    status = cli.main(["--engine", "native", "-o", str(out), str(feed)])
+
+    assert status == 0
+    assert "converted 2, skipped 0, failed 0" in capsys.readouterr().err
+    assert sorted(os.listdir(out / "feed")) == [_output_name(v) for v in versions]
+
+
+def test_cli_counts_unreadable_inputs_as_failed(tmp_path, capsys):
+    inputs = _copy_inputs(tmp_path / "in", ["dw-1.json"])
+    (inputs / "latin1.json").write_bytes('{"urn": "\xe4"}'.encode("latin-1"))
+    (inputs / "latin1.ndjson").write_bytes('{"urn": "\xe4"}\n'.encode("latin-1"))
+    out = tmp_path / "out"
+
+    status = cli.main(["-o", str(out), str(inputs), str(tmp_path / "missing.json")])
+
+    assert status == 1
+    assert "converted 1, skipped 0, failed 3" in capsys.readouterr().err
+    assert os.listdir(out) == ["dw-1.xml"]
+
+
+@pytest.mark.parametrize("option", ["--chunksize", "--jobs"])
+@pytest.mark.parametrize("value", ["0", "-1", "x"])
+def test_cli_rejects_invalid_counts(option, value, capsys):
+    with pytest.raises(SystemExit) as e:
+        cli.main(["-j", "2", "--chunksize", "2", option, value, "-"])
+
+    assert e.value.code != 0
+    assert option in capsys.readouterr().err
+
+
+def test_cli_fails_outputs_claimed_twice(tmp_path, capsys, caplog):
+    _copy_inputs(tmp_path / "a", ["eil.json"])
+    _copy_inputs(tmp_path / "b", ["eil.json"])
+    out = tmp_path / "out"
+
+    status = cli.main(
+        [
+            "--engine",
+            "native",
+            "-o",
+            str(out),
+            str(tmp_path / "a" / "eil.json"),
+            str(tmp_path / "b" / "eil.json"),
+        ]
+    )
+
+    assert status == 1
+    assert "converted 1, skipped 0, failed 1" in capsys.readouterr().err
+    assert os.path.join("a", "eil.json") + " is written to" in caplog.text
+    assert os.listdir(out) == ["eil.xml"]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+
+from newsmlg2 import G2Converter, convert_to_g2_into, convert_to_g2_stream
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+def test_convert_to_g2_stream(test_data_json, result_data_g2):
+    for filename, file in test_data_json.items():
+        chunks = list(convert_to_g2_stream(file, templates=TEMPLATES))
+
+        assert len(chunks) > 1
+        assert result_data_g2[filename.replace(".json", ".xml")] == "".join(chunks)
+
+
+def test_g2_converter_stream_unbuffered(test_data_json, result_data_g2):
+    converter = G2Converter(templates=TEMPLATES)
+    buffered = list(converter.stream(test_data_json["dw-1.json"]))
+    unbuffered = list(converter.stream(test_data_json["dw-1.json"], buffer_size=1))
+
+    assert len(unbuffered) > len(buffered)
+    assert result_data_g2["dw-1.xml"] == "".join(unbuffered)
+
+
+def test_convert_to_g2_into_text_file(test_data_json, result_data_g2):
+    fp = io.StringIO()
+    convert_to_g2_into(test_data_json["dw-1.json"], fp, templates=TEMPLATES)
+
+    assert result_data_g2["dw-1.xml"] == fp.getvalue()
+
+
+def test_convert_to_g2_into_binary_file(test_data_json, result_data_g2):
+    fp = io.BytesIO()
+    convert_to_g2_into(test_data_json["dw-1.json"], fp, templates=TEMPLATES)
+
+    assert result_data_g2["dw-1.xml"].encode("utf-8") == fp.getvalue()
+
+
+def test_convert_to_g2_into_socket(test_data_json, result_data_g2):
+    class Socket:
+        def __init__(self):
+            self.received = []
+
+        def sendall(self, data):
+            self.received.append(data)
+
+    sock = Socket()
+    convert_to_g2_into(test_data_json["eil.json"], sock, templates=TEMPLATES)
+
+    assert result_data_g2["eil.xml"].encode("utf-8") == b"".join(sock.received)
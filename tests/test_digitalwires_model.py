@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+
+import pytest
+
+from newsmlg2 import DigitalwiresModel
+from newsmlg2.extractor.content_extractor import get_article
+from newsmlg2.extractor.meta_extractor import get_dateline
+from newsmlg2.renderer.render_content import render_article
+from newsmlg2.utils import element_to_string
+from newsmlg2.utils import get_rank
+from newsmlg2.utils.objects import Category, EdNote
+
+CATEGORIES = [
+    {"type": "dnltype:keyword", "name": "b", "qcode": None, "rank": 2},
+    {"type": "dnltype:dpasubject", "name": "s", "qcode": "dpasubject:1", "rank": 1},
+    {"type": "dnltype:keyword", "name": "a", "rank": 1},
+    {"type": "dnltype:keyword", "name": "c"},
+    {"type": "dnltype:keyword", "name": "d", "rank": None},
+    {"name": "untyped", "rank": 0},
+]
+
+
+def test_category_items_are_grouped_and_sorted_by_rank():
+    dw_model = DigitalwiresModel({"categories": CATEGORIES})
+
+    assert [c.name for c in dw_model.category_items("dnltype:keyword")] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+    assert dw_model.category_items("dnltype:dpasubject", ["qcode"]) == [
+        Category(qcode="dpasubject:1")
+    ]
+    assert dw_model.category_items("dnltype:poi") == []
+    assert [c.name for c in dw_model.category_items(attrs=["name"])] == [
+        "untyped",
+        "s",
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+
+def test_category_items_match_sorted_list(test_data_json):
+    for filename, file in test_data_json.items():
+        dw_model = DigitalwiresModel(file)
+        types = {cat.get("type") for cat in file.get("categories") or []}
+        for cat_type in types | {None}:
+            for attrs in (["qcode"], ["type", "name", "qcode", "rank"]):
+                type_filter = {"key": "type", "value": cat_type} if cat_type else None
+                expected = [
+                    Category(**dict(zip(Category.map_dw_key(attrs), cat)))
+                    for cat in dw_model.get_sorted_list(
+                        attrs, "categories", type_filter
+                    )
+                ]
+
+                assert dw_model.category_items(cat_type, attrs) == expected, filename
+
+
+def test_category_index_is_built_once():
+    dw_model = DigitalwiresModel({"categories": CATEGORIES})
+    first = dw_model.category_items("dnltype:keyword", ["name"])
+    first.append(None)
+
+    assert dw_model.categories_by_type is dw_model.categories_by_type
+    assert dw_model.categories("dnltype:keyword") is dw_model.categories(
+        "dnltype:keyword"
+    )
+    assert dw_model.category_items("dnltype:keyword", ["name"]) == first[:-1]
+    assert dw_model.categories() == sorted(CATEGORIES, key=get_rank)
+
+
+def test_categories_without_categories():
+    assert DigitalwiresModel({"categories": None}).category_items("dnltype:wire") == []
+    assert DigitalwiresModel({}).categories_by_type == {}
+
+
+EDNOTES = [
+    {"role": "dpaednoterole:embargo", "ednote": "second", "rank": 2},
+    {"role": "dpaednoterole:closingline", "ednote": "closing"},
+    {"role": "dpaednoterole:embargo", "ednote": "first", "rank": 1},
+    {"ednote": "no role", "rank": 0},
+]
+
+
+def test_notepad_items_are_grouped_and_sorted_by_rank():
+    dw_model = DigitalwiresModel({"ednotes": EDNOTES})
+
+    assert dw_model.notepad_items("dpaednoterole:embargo", ["ednote"]) == [
+        EdNote(ednote="first"),
+        EdNote(ednote="second"),
+    ]
+    assert dw_model.notepad_items("dpaednoterole:genrenote", ["ednote"]) == []
+    assert [note.ednote for note in dw_model.notepad_items()] == [
+        "no role",
+        "first",
+        "second",
+        "closing",
+    ]
+    assert dw_model.ednotes_by_role is dw_model.ednotes_by_role
+
+
+def test_notepad_items_match_sorted_list(test_data_json):
+    for filename, file in test_data_json.items():
+        dw_model = DigitalwiresModel(file)
+        roles = {note.get("role") for note in file.get("ednotes") or []}
+        for role in roles | {None}:
+            attrs = ["role", "ednote", "is_publishable"]
+            role_filter = {"key": "role", "value": role} if role else None
+            expected = [
+                EdNote(**dict(zip(attrs, note)))
+                for note in dw_model.get_sorted_list(attrs, "ednotes", role_filter)
+            ]
+
+            assert dw_model.notepad_items(role, attrs) == expected, filename
+
+
+def test_derived_facts():
+    dw_model = DigitalwiresModel(
+        {"associations": [{"type": "image"}], "linkbox_html": "", "infobox_html": ""}
+    )
+
+    assert dw_model.association_count == 1
+    assert dw_model.has_article is False
+    assert dw_model.has_linkbox is False
+    assert dw_model.has_infobox is True
+    assert dw_model.item_class == "ninat:picture"
+    assert dw_model.is_text is False
+    assert dw_model.get_item_class() == "ninat:picture"
+    assert dw_model.is_text_message() is False
+
+
+def test_derived_facts_are_computed_once():
+    dw = {"article_html": "<section></section>", "associations": None}
+    dw_model = DigitalwiresModel(dw)
+
+    assert dw_model.item_class == "ninat:text"
+    assert dw_model.association_count == 0
+    dw["article_html"] = None
+    assert dw_model.is_text is True
+    assert DigitalwiresModel(dw).is_text is True
+    assert DigitalwiresModel({"associations": [{"type": "video"}]}).is_text is False
+
+
+def test_parse_fragment_parses_once():
+    html = '<section class="main"><p>Lorem ipsum</p></section>'
+    dw_model = DigitalwiresModel({"article_html": html})
+
+    assert dw_model.fragment_cache_info() == (0, 0, 0.0, 0)
+    section = dw_model.parse_fragment(html)
+    assert dw_model.parse_fragment(html) is section
+    info = dw_model.fragment_cache_info()
+    assert (info.hits, info.misses, info.parsed_chars) == (1, 1, len(html))
+    assert info.parse_time > 0
+
+
+def test_render_article_keeps_cached_fragment():
+    html = '<section class="main"><p>Lorem ipsum</p></section>'
+    dw_model = DigitalwiresModel({"article_html": html, "dateline": "Rom (dpa) - "})
+    dateline = '<p><span class="dateline">Rom <span class="credit">(dpa)</span> - '
+
+    for _ in range(2):
+        result = render_article(dw_model, get_dateline, get_article)
+
+        assert result[0].startswith(dateline)
+    assert element_to_string(dw_model.parse_fragment(html)[0]) == "<p>Lorem ipsum</p>"
+    assert dw_model.fragment_cache_info().misses == 1
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_model_from_json(lazy):
+    raw = json.dumps(
+        {"urn": "urn:x", "categories": CATEGORIES, "rubric_names": ["Politik"]}
+    ).encode()
+
+    model = DigitalwiresModel.from_json(raw, lazy=lazy)
+
+    assert model["urn"] == "urn:x"
+    assert model.get("missing", "default") == "default"
+    keywords = model.category_items("dnltype:keyword")
+    assert [keyword.name for keyword in keywords] == ["a", "b", "c", "d"]
+    if lazy:
+        assert "rubric_names" not in model.digitalwire.decoded_keys
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import io
+import json
+
+import pytest
+
+from newsmlg2 import G2Converter, convert_feed_page, iter_feed_entries
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+@pytest.fixture
+def entries(test_data_json):
+    return [
+        {**entry, "entry_id": f"entry-{i}", "updated": "2024-01-01T00:00:00Z"}
+        for i, entry in enumerate(test_data_json.values())
+    ]
+
+
+@pytest.fixture
+def page(entries):
+    return json.dumps(
+        {"next_page": 123456789, "entries": entries, "total": 2.5e3}, indent=1
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_feed_entries(page, entries, chunk_size):
+    for source in (page, memoryview(page), page.decode(), io.BytesIO(page)):
+        assert list(iter_feed_entries(source, chunk_size)) == entries
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_iter_feed_entries_number_split_across_chunks(chunk_size):
+    page = '{"total": 2.5e3, "count": 12, "entries": [{"a": 1}], "next": -0.25}'
+
+    for source in (io.StringIO(page), io.BytesIO(page.encode())):
+        assert list(iter_feed_entries(source, chunk_size)) == [{"a": 1}]
+
+
+def test_iter_feed_entries_without_entries():
+    assert list(iter_feed_entries(b'{"next_page": null}')) == []
+    assert list(iter_feed_entries(b'{"entries": []}')) == []
+
+
+@pytest.mark.parametrize(
+    "page", [b"[]", b'{"entries": [{"urn": "a"},', b'{"entries": [1 2]}', b""]
+)
+def test_iter_feed_entries_malformed(page):
+    with pytest.raises(ValueError):
+        list(iter_feed_entries(page))
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_convert_feed_page(page, entries, test_data_json, result_data_g2, prefetch):
+    converter = G2Converter(templates=TEMPLATES)
+
+    results = list(convert_feed_page(io.BytesIO(page), converter, prefetch, 1024))
+
+    assert [result.entry_id for result in results] == [e["entry_id"] for e in entries]
+    for filename, entry, result in zip(test_data_json, entries, results):
+        entry_id, urn, version, g2, error = result
+        assert error is None
+        assert (urn, version) == (entry["urn"], entry["version"])
+        assert result_data_g2[filename.replace(".json", ".xml")] == g2
+
+
+def test_convert_feed_page_isolates_failures(test_data_json, result_data_g2):
+    broken = {"entry_id": "broken", "urn": "urn:broken", "version": "not a number"}
+    eil = {**test_data_json["eil.json"], "entry_id": "eil"}
+    page = json.dumps({"entries": [broken, eil]})
+
+    results = list(convert_feed_page(page, G2Converter(templates=TEMPLATES)))
+
+    assert results[0][:4] == ("broken", "urn:broken", "not a number", None)
+    assert type(results[0].error) is ValueError
+    assert results[1].g2 == result_data_g2["eil.xml"]
+    assert results[1].error is None
+
+
+def test_convert_feed_page_does_not_depend_on_pull_pattern(test_data_json):
+    class EagerConverter(G2Converter):
+        def convert_many(self, digitalwires):
+            # takes every entry before the first result is yielded
+            return super().convert_many(list(digitalwires))
+
+    entries = [
+        {**test_data_json[name], "entry_id": name}
+        for name in ("dw-1.json", "eil.json", "image.json")
+    ]
+    page = json.dumps({"entries": entries})
+
+    results = list(convert_feed_page(page, EagerConverter(engine="native")))
+
+    assert [(r.entry_id, r.urn, r.version) for r in results] == [
+        (e["entry_id"], e["urn"], e["version"]) for e in entries
+    ]
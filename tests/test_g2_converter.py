@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import copy
+import json
+import tracemalloc
+
+from newsmlg2 import G2Converter
+from newsmlg2.utils import LazyDocument
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+def test_g2_converter_convert(test_data_json, result_data_g2):
+    converter = G2Converter(templates=TEMPLATES)
+    for filename, file in test_data_json.items():
+        result = converter.convert(file)
+        assert result_data_g2[filename.replace(".json", ".xml")] == result
+
+
+def test_g2_converter_convert_many(test_data_json, result_data_g2):
+    converter = G2Converter(templates=TEMPLATES)
+    filenames = list(test_data_json.keys())
+    results = list(converter.convert_many(test_data_json[f] for f in filenames))
+
+    assert len(results) == len(filenames)
+    for filename, result in zip(filenames, results):
+        assert result.ok
+        assert result.urn == test_data_json[filename]["urn"]
+        assert result_data_g2[filename.replace(".json", ".xml")] == result.g2
+
+
+def test_g2_converter_convert_many_isolates_failures(test_data_json, result_data_g2):
+    converter = G2Converter(templates=TEMPLATES)
+    broken = {"urn": "urn:newsml:dpa.com:20090101:broken", "version": "not a number"}
+    results = list(
+        converter.convert_many(
+            [test_data_json["image.json"], broken, test_data_json["eil.json"]]
+        )
+    )
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].g2 == result_data_g2["image.xml"]
+    assert not results[1].ok
+    assert results[1].g2 is None
+    assert results[1].urn == broken["urn"]
+    assert type(results[1].error) is ValueError
+    assert results[2].g2 == result_data_g2["eil.xml"]
+
+
+def test_g2_converter_custom_filters(test_data_json):
+    converter = G2Converter(
+        templates=TEMPLATES, filters={"datetimeformat": lambda v, f: "FORMATTED"}
+    )
+    result = converter.convert(test_data_json["dw-1.json"])
+
+    assert ">FORMATTED</time>" in result
+
+
+def test_g2_converter_incremental_article(test_data_json, result_data_g2):
+    for engine in ("jinja", "native"):
+        converter = G2Converter(engine=engine, incremental_article=True)
+        for filename, file in test_data_json.items():
+            expected = result_data_g2.get(filename.replace(".json", ".xml"))
+            if expected is None:
+                continue
+
+            assert converter.convert(file) == expected
+            assert "".join(converter.stream(file)) == expected
+
+
+def test_g2_converter_incremental_article_memory(test_data_json):
+    class NullWriter(object):
+        def write(self, chunk):
+            pass
+
+    dw = copy.deepcopy(test_data_json["dw-1.json"])
+    paragraph = "<p>%s</p>" % ("Lorem ipsum dolor sit amet. " * 20)
+    dw["article_html"] = '<section class="main">%s</section>' % (paragraph * 2000)
+    converter = G2Converter(incremental_article=True)
+
+    tracemalloc.start()
+    try:
+        converter.convert_into(dw, NullWriter())
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < len(dw["article_html"]) / 2
+
+
+def test_g2_converter_convert_bytes(result_data_g2):
+    with open("tests/data/input/dw-1.json", "rb") as f:
+        raw = f.read()
+
+    for decoder in ("stdlib", None, lambda data: json.loads(bytes(data))):
+        converter = G2Converter(templates=TEMPLATES, decoder=decoder)
+        assert converter.convert(raw) == result_data_g2["dw-1.xml"]
+        assert converter.convert(memoryview(raw)) == result_data_g2["dw-1.xml"]
+        assert "".join(converter.stream(raw)) == result_data_g2["dw-1.xml"]
+
+
+def test_g2_converter_convert_many_isolates_decoding_failures(result_data_g2):
+    with open("tests/data/input/eil.json", "rb") as f:
+        raw = f.read()
+    converter = G2Converter(templates=TEMPLATES)
+
+    results = list(converter.convert_many([b"{broken", raw]))
+
+    assert isinstance(results[0].error, ValueError)
+    assert results[1].urn is not None
+    assert results[1].g2 == result_data_g2["eil.xml"]
+
+
+def test_g2_converter_convert_lazy_documents(test_data_json, result_data_g2):
+    converter = G2Converter(templates=TEMPLATES, decoder=LazyDocument)
+    for filename in test_data_json:
+        with open(f"tests/data/input/{filename}", "rb") as f:
+            result = converter.convert(f.read())
+        assert result_data_g2[filename.replace(".json", ".xml")] == result
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_modules(statement: str, modules: list[str]) -> list[str]:
+    script = (
+        f"import sys\n{statement}\n"
+        f"print(' '.join(m for m in {modules!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def test_import_does_not_load_dependencies():
+    loaded = _loaded_modules(
+        "import newsmlg2",
+        ["jinja2", "arrow", "lxml", "newsmlg2.builder", "newsmlg2.serializer"],
+    )
+
+    assert loaded == []
+
+
+def test_public_names_are_loaded_on_access():
+    import newsmlg2
+
+    assert newsmlg2.G2Converter.__name__ == "G2Converter"
+    assert "G2Converter" in dir(newsmlg2)
+    with pytest.raises(AttributeError):
+        newsmlg2.does_not_exist
+
+
+def test_native_engine_does_not_load_jinja_or_arrow():
+    loaded = _loaded_modules(
+        "import json\n"
+        "from newsmlg2 import G2Converter\n"
+        "with open('tests/data/input/dw-1.json') as f:\n"
+        "    G2Converter(engine='native').convert(json.load(f))",
+        ["jinja2", "arrow", "lxml"],
+    )
+
+    assert loaded == []
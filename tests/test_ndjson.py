@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import io
+import json
+import threading
+import tracemalloc
+
+import pytest
+
+from newsmlg2 import G2Converter, convert_ndjson, iter_ndjson
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+@pytest.fixture
+def feed(tmp_path, test_data_json):
+    path = tmp_path / "feed.ndjson"
+    with open(path, "w") as f:
+        for entry in test_data_json.values():
+            f.write(json.dumps(entry) + "\n\n")
+    return path
+
+
+@pytest.mark.parametrize("prefetch", [0, 4])
+def test_iter_ndjson(feed, test_data_json, prefetch):
+    assert list(iter_ndjson(feed, prefetch)) == list(test_data_json.values())
+    with open(feed) as f:
+        assert list(iter_ndjson(f, prefetch)) == list(test_data_json.values())
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_ndjson_invalid_line(prefetch):
+    source = io.BytesIO(b'{"urn": "a"}\n{broken\n')
+
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_ndjson(source, prefetch))
+
+
+def test_iter_ndjson_prefetch_stops_with_consumer(feed):
+    entries = iter_ndjson(feed, prefetch=1)
+    next(entries)
+    entries.close()
+
+    prefetching = [t for t in threading.enumerate() if t.name == "ndjson-prefetch"]
+    for thread in prefetching:
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_convert_ndjson(feed, test_data_json, result_data_g2, prefetch):
+    results = []
+
+    stats = convert_ndjson(
+        feed, results.append, G2Converter(templates=TEMPLATES), prefetch
+    )
+
+    assert stats.converted == len(test_data_json)
+    assert stats.failed == 0
+    for filename, result in zip(test_data_json, results):
+        assert result.ok
+        assert result_data_g2[filename.replace(".json", ".xml")] == result.g2
+
+
+def test_convert_ndjson_isolates_failures(test_data_json, result_data_g2):
+    broken = {"urn": "urn:newsml:dpa.com:20090101:broken", "version": "not a number"}
+    source = io.StringIO(
+        "\n".join(json.dumps(e) for e in [broken, test_data_json["eil.json"]])
+    )
+    results = []
+
+    stats = convert_ndjson(source, results.append, G2Converter(templates=TEMPLATES))
+
+    assert (stats.converted, stats.failed) == (1, 1)
+    assert type(results[0].error) is ValueError
+    assert results[1].g2 == result_data_g2["eil.xml"]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_convert_ndjson_isolates_invalid_lines(
+    test_data_json, result_data_g2, prefetch
+):
+    entry = json.dumps(test_data_json["eil.json"])
+    source = io.StringIO("\n".join([entry, "", "{broken", entry]))
+    results = []
+
+    stats = convert_ndjson(
+        source, results.append, G2Converter(templates=TEMPLATES), prefetch
+    )
+
+    assert (stats.converted, stats.failed) == (2, 1)
+    assert [result.index for result in results] == [1, 3, 4]
+    assert "line 3" in str(results[1].error)
+    assert results[2].g2 == result_data_g2["eil.xml"]
+
+
+def test_convert_ndjson_memory_does_not_depend_on_file_size(tmp_path, test_data_json):
+    converter = G2Converter(templates=TEMPLATES)
+    line = json.dumps(test_data_json["dw-1.json"]) + "\n"
+
+    def peak(entries):
+        path = tmp_path / f"{entries}.ndjson"
+        path.write_text(line * entries)
+        tracemalloc.start()
+        convert_ndjson(path, lambda result: None, converter, prefetch=2)
+        _, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_size
+
+    peak(5)
+    assert peak(200) < 2 * peak(20)
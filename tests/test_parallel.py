@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from newsmlg2 import G2Converter, convert_parallel
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+def test_convert_parallel_ordered(test_data_json, result_data_g2):
+    filenames = list(test_data_json.keys())
+    results = list(
+        convert_parallel(
+            (test_data_json[f] for f in filenames),
+            workers=2,
+            chunksize=3,
+            templates=TEMPLATES,
+        )
+    )
+
+    assert [result.index for result in results] == list(range(len(filenames)))
+    for filename, result in zip(filenames, results):
+        assert result.ok
+        assert result.urn == test_data_json[filename]["urn"]
+        assert result_data_g2[filename.replace(".json", ".xml")] == result.g2
+
+
+def test_convert_parallel_unordered(test_data_json, result_data_g2):
+    filenames = list(test_data_json.keys())
+    results = convert_parallel(
+        [test_data_json[f] for f in filenames],
+        workers=2,
+        chunksize=2,
+        ordered=False,
+        engine="native",
+    )
+
+    by_index = {result.index: result for result in results}
+    assert sorted(by_index) == list(range(len(filenames)))
+    for index, filename in enumerate(filenames):
+        assert result_data_g2[filename.replace(".json", ".xml")] == by_index[index].g2
+
+
+def test_convert_parallel_isolates_failures(test_data_json, result_data_g2):
+    broken = {"urn": "urn:newsml:dpa.com:20090101:broken", "version": "not a number"}
+    results = list(
+        convert_parallel(
+            [test_data_json["image.json"], broken, test_data_json["eil.json"]],
+            workers=1,
+            chunksize=2,
+            templates=TEMPLATES,
+        )
+    )
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].g2 == result_data_g2["image.xml"]
+    assert type(results[1].error) is ValueError
+    assert results[1].urn == broken["urn"]
+    assert results[2].g2 == result_data_g2["eil.xml"]
+
+
+def test_convert_parallel_custom_jinja_args(test_data_json):
+    jinja_args = {"autoescape": True, "keep_trailing_newline": True}
+    results = list(
+        convert_parallel(
+            [test_data_json["eil.json"]],
+            workers=1,
+            templates=TEMPLATES,
+            jinja_args=jinja_args,
+        )
+    )
+
+    expected = G2Converter(TEMPLATES, jinja_args).convert(test_data_json["eil.json"])
+    assert results[0].g2 == expected
+
+
+def test_convert_parallel_rejects_invalid_chunksize():
+    with pytest.raises(ValueError):
+        list(convert_parallel([], chunksize=0))
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import io
+import json
+from functools import partial
+from unittest import mock
+
+import pytest
+
+from newsmlg2 import (
+    G2Converter,
+    MemoryResultCache,
+    SQLiteResultCache,
+    convert_to_g2,
+    invalidate_template_cache,
+)
+from newsmlg2.result_cache import ResultCache, config_fingerprint, result_cache_key
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryResultCache()
+    else:
+        cache = SQLiteResultCache(str(tmp_path / "results.db"))
+        yield cache
+        cache.close()
+
+
+def test_result_cache_key():
+    assert result_cache_key({"urn": "urn:x", "version": 2}, "c") == "c|urn|urn:x|2"
+    assert (
+        result_cache_key({"urn": "urn:x", "entry_id": "e", "updated": "t"}, "c")
+        == "c|entry|e|t"
+    )
+    assert result_cache_key({"urn": "urn:x"}) is None
+
+
+def test_config_fingerprint():
+    fingerprint = config_fingerprint("jinja", TEMPLATES, None, None)
+
+    assert fingerprint == config_fingerprint("jinja", TEMPLATES, None, None)
+    assert fingerprint != config_fingerprint("native", TEMPLATES, None, None)
+    assert fingerprint != config_fingerprint("jinja", TEMPLATES, {"a": 1}, None)
+    assert fingerprint != config_fingerprint("jinja", TEMPLATES, None, {"f": len})
+    assert config_fingerprint("jinja", TEMPLATES, None, {"f": lambda v: v}) is None
+    assert config_fingerprint("jinja", TEMPLATES, None, {"f": partial(len)}) is None
+
+
+def test_custom_filters_bypass_cache(cache, test_data_json):
+    def datetimeformat(value, *args):
+        return "now"
+
+    message = test_data_json["dw-1.json"]
+    converter = G2Converter(filters={"datetimeformat": datetimeformat}, cache=cache)
+
+    assert converter.cache is None
+    converter.convert(message)
+    assert cache.cache_info().misses == 0
+
+
+def test_config_fingerprint_covers_templates_and_version(tmp_path):
+    template = tmp_path / "g2_template.j2"
+    template.write_text("{{ urn }}")
+    fingerprint = config_fingerprint("jinja", str(tmp_path), None, None)
+
+    template.write_text("<urn>{{ urn }}</urn>")
+    # the sources are hashed once until the template cache is invalidated
+    assert fingerprint == config_fingerprint("jinja", str(tmp_path), None, None)
+    invalidate_template_cache(str(tmp_path))
+    assert fingerprint != config_fingerprint("jinja", str(tmp_path), None, None)
+    fingerprint = config_fingerprint("jinja", str(tmp_path), None, None)
+
+    with mock.patch("newsmlg2.result_cache._PACKAGE_VERSION", "99.0"):
+        assert fingerprint != config_fingerprint("jinja", str(tmp_path), None, None)
+
+
+def test_changed_template_misses_cache(cache, tmp_path):
+    template = tmp_path / "g2_template.j2"
+    template.write_text("{{ urn }}")
+    message = {"urn": "urn:x", "version": 1}
+    assert G2Converter(str(tmp_path), cache=cache).convert(message) == "urn:x"
+
+    template.write_text("<urn>{{ urn }}</urn>")
+    invalidate_template_cache()
+    assert G2Converter(str(tmp_path), cache=cache).convert(message) == (
+        "<urn>urn:x</urn>"
+    )
+    assert cache.cache_info().misses == 2
+
+
+def test_converter_consults_cache(cache, test_data_json, result_data_g2):
+    converter = G2Converter(templates=TEMPLATES, cache=cache)
+    dw = test_data_json["dw-1.json"]
+
+    assert converter.convert(dw) == result_data_g2["dw-1.xml"]
+    with mock.patch.object(converter.dw_converter, "convert") as convert:
+        assert converter.convert(json.dumps(dw)) == result_data_g2["dw-1.xml"]
+        assert "".join(converter.stream(dw)) == result_data_g2["dw-1.xml"]
+        convert.assert_not_called()
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (2, 1, 0)
+    assert info.currsize > 0
+
+
+def test_cache_is_keyed_by_version_and_config(cache, test_data_json, result_data_g2):
+    dw = test_data_json["eil.json"]
+    convert_to_g2(dw, TEMPLATES, cache=cache)
+    G2Converter(TEMPLATES, engine="native", cache=cache).convert_into(dw, io.StringIO())
+
+    newer = convert_to_g2({**dw, "version": dw["version"] + 1}, TEMPLATES, cache=cache)
+
+    assert newer != result_data_g2["eil.xml"]
+    assert cache.cache_info().misses == 3
+
+
+def test_uncacheable_messages_are_converted(cache, test_data_json):
+    dw = {**test_data_json["eil.json"], "urn": None, "entry_id": None}
+    converter = G2Converter(templates=TEMPLATES, cache=cache)
+
+    assert converter.convert(dw) == converter.convert(dw)
+    assert cache.cache_info().hits == cache.cache_info().misses == 0
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_cache_evicts_least_recently_used(kind, tmp_path):
+    g2 = "x" * 1000
+    if kind == "memory":
+        cache = MemoryResultCache(max_bytes=int(2.5 * len(g2)) + 200)
+    else:
+        cache = SQLiteResultCache(str(tmp_path / "results.db"), max_bytes=2500)
+    cache.put("a", g2)
+    cache.put("b", g2)
+    cache.get("a")
+
+    cache.put("c", g2)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == g2 and cache.get("c") == g2
+    info = cache.cache_info()
+    assert info.evictions == 1
+    assert info.currsize <= info.maxsize
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = str(tmp_path / "results.db")
+    cache = SQLiteResultCache(path)
+    cache.put("key", "<newsItem>ä</newsItem>")
+    cache.close()
+
+    reopened = SQLiteResultCache(path)
+
+    assert reopened.get("key") == "<newsItem>ä</newsItem>"
+    reopened.clear()
+    assert reopened.get("key") is None
+    reopened.close()
+
+
+def test_incomplete_cache_can_not_be_created():
+    class GetOnlyCache(ResultCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyCache()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from newsmlg2 import convert_to_g2
+from newsmlg2.template_cache import TemplateCache, cache_info, invalidate_template_cache
+
+TEMPLATES = "./newsmlg2/templates"
+
+
+def test_template_cache_hit():
+    cache = TemplateCache()
+    first = cache.get_template(TEMPLATES)
+    second = cache.get_template(TEMPLATES)
+
+    assert first is second
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+    assert cache.cache_info().currsize == 1
+
+
+def test_template_cache_keyed_by_jinja_args():
+    cache = TemplateCache()
+    default = cache.get_template(TEMPLATES)
+    custom = cache.get_template(TEMPLATES, jinja_args={"autoescape": True})
+
+    assert default is not custom
+    assert cache.cache_info().misses == 2
+
+
+def test_template_cache_keyed_by_filters():
+    cache = TemplateCache()
+    env = cache.get_environment(TEMPLATES, filters={"foo": str})
+
+    assert env.filters["foo"] is str
+    assert cache.get_environment(TEMPLATES, filters={"foo": str}) is env
+    assert cache.get_environment(TEMPLATES, filters={"foo": repr}) is not env
+
+
+def test_template_cache_is_bounded():
+    cache = TemplateCache(maxsize=2)
+    oldest = cache.get_template(TEMPLATES, jinja_args={"trim_blocks": True})
+    cache.get_template(TEMPLATES, jinja_args={"lstrip_blocks": True})
+    cache.get_template(TEMPLATES, jinja_args={"autoescape": True})
+
+    assert cache.cache_info().currsize == 2
+    assert cache.get_template(TEMPLATES, jinja_args={"trim_blocks": True}) is not oldest
+
+
+def test_template_cache_invalidate():
+    cache = TemplateCache()
+    template = cache.get_template(TEMPLATES)
+    cache.invalidate("./tests")
+
+    assert cache.get_template(TEMPLATES) is template
+
+    cache.invalidate(TEMPLATES)
+
+    assert cache.cache_info().currsize == 0
+    assert cache.get_template(TEMPLATES) is not template
+
+
+def test_convert_to_g2_uses_template_cache(test_data_json, result_data_g2):
+    invalidate_template_cache()
+    before = cache_info()
+    for _ in range(3):
+        result = convert_to_g2(test_data_json["image.json"], templates=TEMPLATES)
+        assert result_data_g2["image.xml"] == result
+
+    after = cache_info()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 2
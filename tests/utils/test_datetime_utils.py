@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import datetime, timedelta, timezone
+
+import arrow
+import pytest
+
+from newsmlg2.digitalwires_to_newsmlg2 import datetime_format
+from newsmlg2.utils import parse_iso_datetime
+
+VALUES = [
+    "2025-01-23T16:28:31Z",
+    "2025-01-23T16:28:31",
+    "2025-01-23T16:28:31.5Z",
+    "2025-01-23T16:28:31.123456+01:00",
+    "2025-07-01T00:05:00-05:30",
+    "2024-02-29T23:59:59+14:00",
+]
+FORMATS = ["%d.%m.%Y %H:%M", "%H:%M %d-%m-%y", "%Y-%m-%dT%H:%M:%S.%f%z", "%Z"]
+
+
+def test_parse_iso_datetime():
+    assert parse_iso_datetime("2025-01-23T16:28:31Z") == datetime(
+        2025, 1, 23, 16, 28, 31, tzinfo=timezone.utc
+    )
+    assert parse_iso_datetime("2025-01-23T16:28:31.12-02:30") == datetime(
+        2025, 1, 23, 16, 28, 31, 120000, tzinfo=timezone(-timedelta(hours=2.5))
+    )
+    assert parse_iso_datetime("2025-01-23T16:28:31").tzinfo is timezone.utc
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2025-02-30T16:28:31Z", "2025-01-23 16:28:31", "2025-01-23", "23.01.2025", ""],
+)
+def test_parse_iso_datetime_rejects_other_formats(value):
+    assert parse_iso_datetime(value) is None
+
+
+@pytest.mark.parametrize("value", VALUES + ["2025-01-23 16:28:31", "2025-01-23"])
+@pytest.mark.parametrize("format", FORMATS)
+def test_datetime_format_matches_arrow(value, format):
+    assert datetime_format(value, format) == arrow.get(value).strftime(format)
+
+
+def test_datetime_format_falls_back_to_arrow():
+    value = datetime(2025, 1, 23, 16, 28, tzinfo=timezone.utc)
+
+    assert datetime_format(value, "%H:%M") == "16:28"
+    with pytest.raises(Exception):
+        datetime_format("not a date", "%H:%M")
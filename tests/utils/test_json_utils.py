@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+import json
+
+from newsmlg2.utils import (
+    HAS_ORJSON,
+    LazyDocument,
+    get_json_decoder,
+    loads_orjson,
+    loads_stdlib,
+)
+
+DOCUMENT = '{"urn": "urn:newsml:dpa.com:20090101:1", "headline": "Grüße", "n": 1.5}'
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        DOCUMENT,
+        DOCUMENT.encode(),
+        bytearray(DOCUMENT.encode()),
+        memoryview(DOCUMENT.encode()),
+    ],
+)
+def test_loads_stdlib(data):
+    assert loads_stdlib(data)["headline"] == "Grüße"
+
+
+@pytest.mark.skipif(not HAS_ORJSON, reason="orjson is not installed")
+@pytest.mark.parametrize(
+    "data", [DOCUMENT, DOCUMENT.encode(), memoryview(DOCUMENT.encode())]
+)
+def test_loads_orjson(data):
+    assert loads_orjson(data) == loads_stdlib(DOCUMENT)
+
+
+@pytest.mark.parametrize(
+    "decoder",
+    [
+        loads_stdlib,
+        pytest.param(
+            loads_orjson,
+            marks=pytest.mark.skipif(not HAS_ORJSON, reason="orjson is not installed"),
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "data",
+    [
+        "\ufeff" + DOCUMENT,
+        b"\xef\xbb\xbf" + DOCUMENT.encode(),
+        bytearray(b"\xef\xbb\xbf" + DOCUMENT.encode()),
+        memoryview(b"\xef\xbb\xbf" + DOCUMENT.encode()),
+    ],
+)
+def test_decoders_strip_bom(decoder, data):
+    assert decoder(data) == loads_stdlib(DOCUMENT)
+
+
+def test_get_json_decoder():
+    assert get_json_decoder("stdlib") is loads_stdlib
+    assert get_json_decoder() is (loads_orjson if HAS_ORJSON else loads_stdlib)
+    with pytest.raises(ValueError):
+        get_json_decoder("yaml")
+
+
+NESTED = {
+    "urn": "urn:newsml:dpa.com:20090101:1",
+    'quote "\\ key': 'a "quoted" \\ value',
+    "rubric_names": ["Politik", "[not a bracket]", {"nested": "{"}],
+    "keyword_names": ['an "escaped ]" quote', "Grüße „x“", "\\"],
+    "version": 3,
+    "rank": -1.5e3,
+    "embargoed": None,
+    "is_publishable": True,
+    "empty": {},
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("encode", [False, True])
+def test_lazy_document(indent, encode):
+    raw = json.dumps(NESTED, indent=indent, ensure_ascii=False)
+    document = LazyDocument(raw.encode() if encode else raw, loads_stdlib)
+
+    assert list(document) == list(NESTED)
+    assert len(document) == len(NESTED)
+    assert document.decoded_keys == []
+    assert document["version"] == 3
+    assert document.get("missing", "default") == "default"
+    assert "rubric_names" in document
+    assert document.decoded_keys == ["version"]
+    assert document.to_dict() == NESTED
+
+
+def test_lazy_document_allows_surrounding_whitespace():
+    assert LazyDocument(' \n{"a": 1} \r\n').to_dict() == {"a": 1}
+    assert LazyDocument("{ }\n").to_dict() == {}
+
+
+def test_lazy_document_decodes_values_once():
+    calls = []
+
+    def decoder(data):
+        calls.append(data)
+        return loads_stdlib(data)
+
+    document = LazyDocument(json.dumps(NESTED), decoder)
+    for _ in range(3):
+        assert document["rubric_names"] == NESTED["rubric_names"]
+
+    assert len(calls) == 1
+    with pytest.raises(KeyError):
+        document["missing"]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "",
+        "[]",
+        '{"a" 1}',
+        '{"a": [1, 2}',
+        '{"a": 1,}',
+        '{"a": 1',
+        '{"a": "x}',
+        '{"a": 1} trailing',
+        '{"a": 1}}',
+        "{} []",
+        '{"a": [{"b": "]"]}',
+        '{"a": ["x]}',
+        '{"a": {"b": [}}',
+    ],
+)
+def test_lazy_document_malformed(raw):
+    with pytest.raises(ValueError):
+        LazyDocument(raw)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from newsmlg2.utils import object_factory
+from newsmlg2.utils.objects import POI, Category, Description, EdNote, Link
+
+
+def test_value_objects_are_slotted():
+    for cls in (POI, Link, Category, EdNote, Description):
+        obj = cls()
+
+        assert not hasattr(obj, "__dict__")
+        assert hash(obj) == hash(cls())
+
+
+def test_object_factory_maps_keys():
+    create = object_factory(Category, ("type", "name", "qcode", "rank"))
+    cat = {"type": "dnltype:keyword", "name": "Sport", "rank": 2, "other": 1}
+
+    assert create(cat) == Category(
+        category_type="dnltype:keyword", name="Sport", qcode=None, rank=2
+    )
+    assert object_factory(Category, ("qcode",))(cat) == Category()
+    assert object_factory(EdNote, ("ednote",))({"ednote": "x"}) == EdNote(ednote="x")
+
+
+def test_object_factory_is_cached():
+    assert object_factory(Description, ("role", "description")) is object_factory(
+        Description, ("role", "description")
+    )
+
+
+def test_object_factory_rejects_unknown_keys():
+    with pytest.raises(TypeError):
+        object_factory(EdNote, ("qcode",))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#  Copyright (c) 2025  dpa-IT Services GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import random
+import xml.etree.ElementTree as ETree
+
+import pytest
+
+from newsmlg2.utils import element_to_string, split_children
+
+
+def _children(markup):
+    return [element_to_string(child) for child in ETree.fromstring(markup)]
+
+
+def test_split_children_passes_markup_through():
+    markup = (
+        '<section class="main"><p>Lorem <a href="a?b=1&amp;c=2">ipsum</a></p>\n'
+        '<h2>&lt;Dolor&gt; "sit"</h2>tail<p>amet</p></section>'
+    )
+
+    assert split_children(markup) == [
+        '<p>Lorem <a href="a?b=1&amp;c=2">ipsum</a></p>\n',
+        '<h2>&lt;Dolor&gt; "sit"</h2>tail',
+        "<p>amet</p>",
+    ]
+    assert split_children(markup) == _children(markup)
+
+
+def test_split_children_writes_empty_elements_like_element_tree():
+    markup = '<section><p></p><p>a<br/>b</p><p class="x"></p><br /></section>'
+
+    assert split_children(markup) == [
+        "<p />",
+        "<p>a<br />b</p>",
+        '<p class="x" />',
+        "<br />",
+    ]
+    assert split_children(markup) == _children(markup)
+    assert split_children("<section></section>") == []
+    assert split_children("<section/>") == []
+
+
+@pytest.mark.parametrize(
+    "markup",
+    [
+        "<section><p>&#160;</p></section>",
+        "<section><p>&quot;</p></section>",
+        "<section><p>a > b</p></section>",
+        "<section><!-- comment --><p /></section>",
+        "<section><p class='a'>a</p></section>",
+        '<section><p  class="a">a</p></section>',
+        '<section xmlns="http://www.w3.org/1999/xhtml"><p /></section>',
+        "<x:section><p /></x:section>",
+        "<section><p>a</section>",
+        "<section><p>a</p></section><p />",
+        " <section />",
+        "<section><p>\r</p></section>",
+        "",
+    ],
+)
+def test_split_children_rejects_other_markup(markup):
+    assert split_children(markup) is None
+
+
+def test_split_children_matches_element_tree(test_data_json):
+    for filename, file in test_data_json.items():
+        for field in ("article_html", "infobox_html", "linkbox_html"):
+            if file.get(field):
+                assert split_children(file[field]) == _children(file[field])
+
+    pieces = ["<p>", "</p>", "<b>", "</b>", "<br/>", "<i />", "x", "&amp;", " ", "ä"]
+    pieces += ['<p class="a">', "&#160;", ">", "<", "\n", "<!-- c -->", "<p></p>"]
+    rnd = random.Random(13)
+    for _ in range(5000):
+        markup = "<section>%s</section>" % "".join(
+            rnd.choice(pieces) for _ in range(rnd.randint(0, 8))
+        )
+        children = split_children(markup)
+        if children is not None:
+            assert children == _children(markup), markup